@@ -0,0 +1,128 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Autosave Module
+
+This module provides a write-behind save scheduler for the game loop.
+Instead of rewriting the save file after every action, actions mark the
+character dirty and saves are coalesced until one of the policy limits
+is reached:
+- interval: seconds since the last save
+- max_actions: number of save requests since the last save
+
+The limits are only checked when the game requests a save, i.e. after
+an action. There is no timer: while the game waits for input, a pending
+change stays unsaved until the player's next action, however long the
+interval. Pending changes are always written by flush() (on quit, death
+and shutdown), so coalescing never loses more than the current session
+keeps in memory.
+"""
+
+import time
+import character_manager
+
+# Default policy: save on the first action 5 seconds after the last save,
+# or on every 10th action
+DEFAULT_INTERVAL = 5.0
+DEFAULT_MAX_ACTIONS = 10
+
+class SaveScheduler:
+    """
+    Coalesces save requests for the current character
+
+    Counters:
+        requested: save requests made by the game
+        performed: save files actually written
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, max_actions=DEFAULT_MAX_ACTIONS,
+                 save_function=None, clock=time.monotonic):
+        """
+        Set up the save policy
+
+        Args:
+            interval: Seconds after the last save from which the next
+                      save request is written straight away (checked on
+                      requests only; 0 or None = no time limit)
+            max_actions: Requests that may be coalesced into one save
+                         (1 = save on every request, 0 or None = no limit)
+            save_function: Function(character) that writes the save and
+                           returns False if nothing needed writing
+                           (default: character_manager.save_if_changed)
+            clock: Function returning the current time in seconds
+        """
+        self.interval = interval
+        self.max_actions = max_actions
+        self.save_function = save_function or character_manager.save_if_changed
+        self.clock = clock
+
+        self.character = None
+        self.dirty = False
+        self.pending_actions = 0
+        self.last_save_time = clock()
+
+        self.requested = 0
+        self.performed = 0
+
+    def request_save(self, character):
+        """
+        Mark the character dirty and save it if the policy says so
+
+        Returns: True if the save file was written by this call
+        Raises: IOError / InvalidSaveDataError from the save function
+                (the character stays dirty so a later flush retries)
+        """
+        self.requested += 1
+        if self.character is not None and character is not self.character:
+            # A different character: write out the old one first
+            self.flush()
+        self.character = character
+        self.dirty = True
+        self.pending_actions += 1
+
+        if self.is_due():
+            return self.flush()
+        return False
+
+    def is_due(self):
+        """
+        Check the policy limits (called by request_save; nothing checks
+        them between requests)
+
+        Returns: True if a pending change has waited long enough to be written
+        """
+        if not self.dirty:
+            return False
+        if self.max_actions and self.pending_actions >= self.max_actions:
+            return True
+        if self.interval and self.clock() - self.last_save_time >= self.interval:
+            return True
+        return False
+
+    def flush(self):
+        """
+        Write the character now if it has unsaved changes
+
+        Returns: True if a save was written, False if nothing was pending
+                 (or the save function found the character unchanged)
+        Raises: IOError / InvalidSaveDataError from the save function
+        """
+        if not self.dirty or self.character is None:
+            return False
+        written = self.save_function(self.character) is not False
+        self.dirty = False
+        self.pending_actions = 0
+        self.last_save_time = self.clock()
+        if written:
+            self.performed += 1
+        return written
+
+    def get_stats(self):
+        """
+        Returns: Dictionary with 'requested', 'performed' and 'coalesced'
+                 (requests that did not need a file write of their own)
+        """
+        return {
+            'requested': self.requested,
+            'performed': self.performed,
+            'coalesced': self.requested - self.performed
+        }
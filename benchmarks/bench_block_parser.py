@@ -0,0 +1,67 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Block Parser
+
+Micro-benchmarks the single-pass schema parser (parse_*_block) against
+the two-step reference parser (parse_*_block_strict) on generated
+catalogs of 1k, 100k and 1M records.
+
+Blocks are generated and timed in chunks so the 1M run does not need
+the whole catalog in memory at once.
+
+Usage: python benchmarks/bench_block_parser.py [record_count ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from catalog_generator import item_block, quest_block
+
+DEFAULT_SIZES = [1000, 100000, 1000000]
+CHUNK_SIZE = 10000
+
+PARSERS = {
+    "quests": (quest_block, game_data.parse_quest_block_strict, game_data.parse_quest_block),
+    "items": (item_block, game_data.parse_item_block_strict, game_data.parse_item_block),
+}
+
+def make_chunk(make_block, start, stop):
+    """Build pre-split line lists for blocks start..stop-1"""
+    return [make_block(index).strip().split("\n") for index in range(start, stop)]
+
+def time_parser(parse_block, chunk):
+    """Return seconds taken to parse every block in chunk"""
+    start = time.perf_counter()
+    for lines in chunk:
+        parse_block(lines)
+    return time.perf_counter() - start
+
+def bench(label, count):
+    """Time reference vs fast parsing for count generated records"""
+    make_block, reference, fast = PARSERS[label]
+    reference_total = 0.0
+    fast_total = 0.0
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = make_chunk(make_block, start, min(start + CHUNK_SIZE, count))
+        assert reference(chunk[0]) == fast(chunk[0])
+        reference_total += time_parser(reference, chunk)
+        fast_total += time_parser(fast, chunk)
+
+    print(f"  {label:<7} reference {reference_total * 1000:10.1f} ms | "
+          f"fast {fast_total * 1000:10.1f} ms | "
+          f"{count / fast_total:12,.0f} records/s | "
+          f"speedup {reference_total / fast_total:4.2f}x")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} records ===")
+        for label in PARSERS:
+            bench(label, count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Catalog Cache
+
+Compares a cold parse of generated quest/item catalogs against a warm
+load from the binary sidecar cache.
+
+Usage: python benchmarks/bench_catalog_cache.py [record_count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catalog_cache
+import game_data
+from catalog_generator import write_item_file, write_quest_file
+
+DEFAULT_SIZES = [1000, 10000, 50000]
+
+def time_call(function, *args, **kwargs):
+    """Run function once and return (seconds, result)"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def bench_catalog(label, filename, loader):
+    """Print cold parse vs warm cache timings for one catalog file"""
+    catalog_cache.clear_cache(filename)
+    cold, parsed = time_call(loader, filename)
+    build, _ = time_call(loader, filename, use_cache=True)
+    warm, cached = time_call(loader, filename, use_cache=True)
+    assert cached == parsed, "cache returned a different catalog"
+
+    print(f"  {label:<7} cold parse {cold * 1000:9.1f} ms | "
+          f"cache build {build * 1000:9.1f} ms | "
+          f"warm cache {warm * 1000:9.1f} ms | "
+          f"speedup {cold / warm:6.1f}x")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in sizes:
+            print(f"\n=== {count} records ===")
+            quest_file = os.path.join(temp_dir, f"quests_{count}.txt")
+            item_file = os.path.join(temp_dir, f"items_{count}.txt")
+            write_quest_file(quest_file, count)
+            write_item_file(item_file, count)
+
+            bench_catalog("quests", quest_file, game_data.load_quests)
+            bench_catalog("items", item_file, game_data.load_items)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Character Creation
+
+Times building characters one create_character call at a time against
+one create_characters call for the whole batch.
+
+Usage: python benchmarks/bench_create_characters.py [character_count ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+DEFAULT_SIZES = [10000, 100000]
+CLASSES = ("Warrior", "mage", "Rogue", "CLERIC")
+
+def bench(count):
+    """Create count characters, cycling through CLASSES, both ways"""
+    specs = [(f"hero_{index}", CLASSES[index % len(CLASSES)]) for index in range(count)]
+
+    start = time.perf_counter()
+    characters = [character_manager.create_character(name, character_class)
+                  for name, character_class in specs]
+    single = time.perf_counter() - start
+    del characters
+
+    start = time.perf_counter()
+    character_manager.create_characters(specs)
+    bulk = time.perf_counter() - start
+
+    print(f"  create_character  {single / count * 1e6:6.2f} us/character")
+    print(f"  create_characters {bulk / count * 1e6:6.2f} us/character")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    character_manager.get_class_registry()
+    for count in sizes:
+        print(f"\n=== {count} characters ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Inventory
+
+Times has_item, count_item, remove-then-add and the per-render item
+count of display_inventory on a counted Inventory against a plain list
+inventory (the old list operations). Sizes go past MAX_INVENTORY_SIZE
+to show how each grows.
+
+Usage: python benchmarks/bench_inventory.py [inventory_size ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inventory_system import Inventory
+
+DEFAULT_SIZES = [20, 200, 2000]
+OPERATIONS = 20000
+DISTINCT_ITEMS = 10
+
+def count_for_display(items):
+    """The count dictionary display_inventory used to build"""
+    item_counts = {}
+    for item_id in items:
+        item_counts[item_id] = item_counts.get(item_id, 0) + 1
+    return item_counts
+
+def bench(size):
+    """Run OPERATIONS of each kind on an inventory of size items"""
+    items = [f"item_{index % DISTINCT_ITEMS}" for index in range(size)]
+    # The first item added is the one looked up, so the list has to scan
+    # past every other item to find its last copy or a missing item
+    wanted = "item_0"
+    for label, inventory in (("list", list(items)), ("Inventory", Inventory(items))):
+        counts = (lambda: inventory.counts) if label == "Inventory" else (lambda: count_for_display(inventory))
+        cases = (
+            ("has (miss)", lambda: "ghost" in inventory),
+            ("count", lambda: inventory.count(wanted)),
+            ("remove+add", lambda: (inventory.remove(wanted), inventory.append(wanted))),
+            ("display counts", counts),
+        )
+        results = []
+        for name, operation in cases:
+            start = time.perf_counter()
+            for _ in range(OPERATIONS):
+                operation()
+            results.append(f"{name} {(time.perf_counter() - start) / OPERATIONS * 1e6:7.3f} us")
+        print(f"  {label:<9} " + " | ".join(results))
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for size in sizes:
+        print(f"\n=== {size} items ===")
+        bench(size)
+
+if __name__ == "__main__":
+    main()
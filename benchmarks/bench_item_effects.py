@@ -0,0 +1,127 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Item Effects
+
+Times equip/unequip cycles (equip_weapon then unequip_weapon) with the
+effects compiled by the item catalog, against the previous code that
+parsed the EFFECT string and walked the stat if/elif chain on every
+call. Also times the effect step on its own, and 3-stat gear as three
+single-stat effects against one compound effect.
+
+Usage: python benchmarks/bench_item_effects.py [cycles ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import item_effects
+import item_index
+from game_data import Item
+from custom_exceptions import InventoryFullError, InvalidItemTypeError, ItemNotFoundError
+
+DEFAULT_SIZES = [1000000]
+
+def parse_and_apply(character, effect_string, sign=1):
+    """The previous effect step: parse the string, then the if/elif chain"""
+    stat_name, value = inventory_system.parse_item_effect(effect_string)
+    value *= sign
+    if stat_name == 'health':
+        character_manager.heal_character(character, value)
+    elif stat_name == 'max_health':
+        character['max_health'] += value
+        character_manager.heal_character(character, value)
+    elif stat_name == 'strength':
+        character['strength'] += value
+    elif stat_name == 'magic':
+        character['magic'] += value
+
+def string_equip_weapon(character, item_id, item_data):
+    """The previous equip_weapon"""
+    if not inventory_system.has_item(character, item_id):
+        raise ItemNotFoundError(f"Cannot equip: {item_id} not in inventory.")
+    if item_data['type'] != 'weapon':
+        raise InvalidItemTypeError(f"Cannot equip item of type: {item_data['type']}.")
+    unequipped_msg = ""
+    if character.get('equipped_weapon'):
+        old_item_id = string_unequip_weapon(character)
+        unequipped_msg = f"Unequipped {old_item_id}. "
+    parse_and_apply(character, item_data['effect'])
+    character['equipped_weapon'] = {'id': item_id, 'effect': item_data['effect']}
+    inventory_system.remove_item_from_inventory(character, item_id)
+    return f"{unequipped_msg}Equipped {item_data.get('name', item_id)}."
+
+def string_unequip_weapon(character):
+    """The previous unequip_weapon"""
+    if not character.get('equipped_weapon'):
+        return None
+    if inventory_system.get_inventory_space_remaining(character) <= 0:
+        raise InventoryFullError("Cannot unequip weapon: Inventory is full.")
+    equipped = character['equipped_weapon']
+    item_id = equipped['id']
+    parse_and_apply(character, equipped['effect'], -1)
+    inventory_system.add_item_to_inventory(character, item_id)
+    character['equipped_weapon'] = None
+    return item_id
+
+def bench(cycles):
+    """Equip and unequip one weapon cycles times with each implementation"""
+    catalog = item_index.IndexedItemCatalog({
+        'iron_sword': Item('iron_sword', "Iron Sword", 'weapon', 'strength:5', 100, "")
+    })
+    sword = catalog['iron_sword']
+    compiled = sword.compiled_effect
+    runs = (
+        ("parsed", string_equip_weapon, string_unequip_weapon),
+        ("compiled", inventory_system.equip_weapon, inventory_system.unequip_weapon),
+    )
+    for label, equip, unequip in runs:
+        character = character_manager.create_character("hero", "Warrior")
+        inventory_system.add_item_to_inventory(character, 'iron_sword')
+        start = time.perf_counter()
+        for _ in range(cycles):
+            equip(character, 'iron_sword', sword)
+            unequip(character)
+        elapsed = time.perf_counter() - start
+        assert character['strength'] == 15
+        print(f"  {label:<9} equip+unequip {elapsed / cycles * 1e6:6.2f} us/cycle "
+              f"({elapsed:5.2f} s total)")
+
+    character = character_manager.create_character("hero", "Warrior")
+    for label, apply, remove in (
+            ("parsed", lambda: parse_and_apply(character, 'strength:5'),
+             lambda: parse_and_apply(character, 'strength:5', -1)),
+            ("compiled", lambda: compiled.apply(character), lambda: compiled.remove(character))):
+        start = time.perf_counter()
+        for _ in range(cycles):
+            apply()
+            remove()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<9} effect only   {elapsed / cycles * 1e6:6.2f} us/cycle")
+
+    # The same gear as three single-stat effects or one compound effect
+    singles = [item_effects.compile_effect(effect)
+               for effect in ("strength:5", "magic:3", "max_health:10")]
+    compound = item_effects.compile_effect("strength:5,magic:3,max_health:10")
+    for label, effects in (("3 single", singles), ("compound", [compound])):
+        start = time.perf_counter()
+        for _ in range(cycles):
+            for effect in effects:
+                effect.apply(character)
+            for effect in effects:
+                effect.remove(character)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<9} 3-stat gear   {elapsed / cycles * 1e6:6.2f} us/cycle")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for cycles in sizes:
+        print(f"\n=== {cycles} cycles ===")
+        bench(cycles)
+
+if __name__ == "__main__":
+    main()
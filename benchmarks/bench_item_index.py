@@ -0,0 +1,70 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Item Index
+
+Compares full scans of the item catalog with the secondary indexes in
+item_index.IndexedItemCatalog for type, stat and cost-range queries.
+
+Usage: python benchmarks/bench_item_index.py [item_count ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from catalog_generator import item_block
+from item_index import IndexedItemCatalog
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+REPEAT = 20
+
+def best_of(function):
+    """Return the fastest of REPEAT runs in milliseconds"""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+def bench(count):
+    """Time each query with a scan and with the indexes"""
+    items = {}
+    for index in range(count):
+        item = game_data.parse_item_block(item_block(index).strip().split("\n"))
+        items[item['item_id']] = item
+
+    start = time.perf_counter()
+    catalog = IndexedItemCatalog(items)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"  build indexes            {build_ms:9.2f} ms")
+
+    queries = [
+        ("weapons",
+         lambda: [(i, item) for i, item in items.items() if item['type'] == 'weapon'],
+         lambda: catalog.items_of_type('weapon')),
+        ("affects strength",
+         lambda: [(i, item) for i, item in items.items() if item['effect'].startswith('strength:')],
+         lambda: catalog.items_affecting('strength')),
+        ("cost 100..110",
+         lambda: sorted(((item['cost'], i) for i, item in items.items() if 100 <= item['cost'] <= 110)),
+         lambda: catalog.items_by_cost(100, 110)),
+    ]
+    for label, scan, indexed in queries:
+        scan_ms = best_of(scan)
+        indexed_ms = best_of(indexed)
+        print(f"  {label:<17} scan {scan_ms:9.3f} ms | index {indexed_ms:9.3f} ms | "
+              f"{scan_ms / indexed_ms:6.1f}x")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} items ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Leveling
+
+Times gain_experience for XP grants that cross many levels, against the
+old one-level-at-a-time loop (without its console output).
+
+Usage: python benchmarks/bench_leveling.py [levels ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+DEFAULT_SIZES = [10, 1000, 100000]
+REPEATS = 200
+
+def level_one_at_a_time(character, xp_amount):
+    """The previous leveling loop, without printing"""
+    character['experience'] += xp_amount
+    level_up_xp = character['level'] * 100
+    while character['experience'] >= level_up_xp:
+        character['experience'] -= level_up_xp
+        character['level'] += 1
+        character['max_health'] += 10
+        character['strength'] += 2
+        character['magic'] += 2
+        character['health'] = character['max_health']
+        level_up_xp = character['level'] * 100
+
+def bench(levels):
+    """Grant enough XP to go from level 1 to 1 + levels, REPEATS times"""
+    xp = character_manager.get_total_xp_for_level(1 + levels)
+    quiet_grant = lambda character, amount: character_manager.gain_experience(character, amount, quiet=True)
+    for label, grant in (("loop", level_one_at_a_time), ("closed form", quiet_grant)):
+        characters = [character_manager.create_character("hero", "Warrior") for _ in range(REPEATS)]
+        start = time.perf_counter()
+        for character in characters:
+            grant(character, xp)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<11} {elapsed / REPEATS * 1e6:10.2f} us/grant")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for levels in sizes:
+        print(f"\n=== {levels} levels per grant ===")
+        bench(levels)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Load Cache
+
+Times repeated load_character calls for a small working set of
+characters with the LRU load cache enabled and disabled.
+
+Usage: python benchmarks/bench_load_cache.py [load_count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+DEFAULT_SIZES = [10000, 100000]
+WORKING_SET = 100
+
+def bench(count):
+    """Load count characters (round-robin over WORKING_SET) with and without the cache"""
+    with tempfile.TemporaryDirectory() as save_directory:
+        names = [f"hero_{index}" for index in range(WORKING_SET)]
+        for name in names:
+            character = character_manager.create_character(name, "Warrior")
+            character['inventory'] = ["health_potion"] * 5
+            character_manager.save_character(character, save_directory)
+
+        for label, cache_size in (("no cache", 0), ("lru cache", character_manager.LOAD_CACHE_SIZE)):
+            character_manager.load_cache = character_manager.CharacterCache(cache_size)
+            start = time.perf_counter()
+            for index in range(count):
+                character_manager.load_character(names[index % WORKING_SET], save_directory)
+            elapsed = time.perf_counter() - start
+            cache_stats = character_manager.get_load_cache_stats()
+            print(f"  {label:<9} {elapsed / count * 1e6:7.1f} us/load | "
+                  f"hits {cache_stats['hits']:7d} | misses {cache_stats['misses']:7d}")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} loads ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
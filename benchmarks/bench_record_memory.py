@@ -0,0 +1,66 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Record Memory
+
+Compares the memory held by quest/item catalogs stored as plain dicts
+(the old representation) and as __slots__ Quest/Item records, at 100k
+and 1M records.
+
+Every record shares the same field value objects, so the numbers show
+the per-record container overhead only - the part the record types
+change. Field strings cost the same in both representations.
+
+Usage: python benchmarks/bench_record_memory.py [record_count ...]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from catalog_generator import item_block, quest_block
+
+DEFAULT_SIZES = [100000, 1000000]
+
+def measure(build, count):
+    """Return bytes allocated by build(count) and still alive afterwards"""
+    gc.collect()
+    tracemalloc.start()
+    catalog = build(count)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return allocated
+
+def bench(label, record, count):
+    """Compare dict and record catalogs built from one sample record"""
+    values = tuple(record.values())
+    names = tuple(record)
+    record_type = type(record)
+
+    def build_dicts(n):
+        return {index: dict(zip(names, values)) for index in range(n)}
+
+    def build_records(n):
+        return {index: record_type(*values) for index in range(n)}
+
+    dict_bytes = measure(build_dicts, count)
+    record_bytes = measure(build_records, count)
+    print(f"  {label:<7} dict {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / count:6.1f} B/rec) | "
+          f"{record_type.__name__:<5} {record_bytes / 2**20:8.1f} MiB ({record_bytes / count:6.1f} B/rec) | "
+          f"saved {100 * (1 - record_bytes / dict_bytes):4.1f}%")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    quest = game_data.parse_quest_block(quest_block(1).strip().split("\n"))
+    item = game_data.parse_item_block(item_block(1).strip().split("\n"))
+    for count in sizes:
+        print(f"\n=== {count} records (catalog dict included) ===")
+        bench("quests", quest, count)
+        bench("items", item, count)
+
+if __name__ == "__main__":
+    main()
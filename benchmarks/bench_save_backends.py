@@ -0,0 +1,73 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Backends
+
+Compares the text-file and SQLite save backends for batch saves, batch
+loads, sorted listings and single-character saves.
+
+Usage: python benchmarks/bench_save_backends.py [character_count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_index
+
+DEFAULT_SIZES = [10000, 100000]
+SINGLE_SAVES = 1000
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+def make_characters(count):
+    """Build count characters with varied stats"""
+    characters = []
+    for index in range(count):
+        character = character_manager.create_character(f"hero_{index}", CLASSES[index % 4])
+        character['level'] = 1 + index % 50
+        character['gold'] = index % 997
+        character['inventory'] = ["health_potion", "iron_sword"][:index % 3]
+        characters.append(character)
+    return characters
+
+def timed(function):
+    """Return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def bench_backend(label, backend, characters):
+    """Time the common operations on one backend"""
+    names = [character['name'] for character in characters]
+    _, save_seconds = timed(lambda: backend.save_characters(characters))
+    if isinstance(backend, save_backends.TextSaveBackend):
+        save_index.index_cache.clear()
+    loaded, load_seconds = timed(lambda: backend.load_characters(names))
+    _, list_seconds = timed(lambda: backend.list_summaries(sort_by="level", reverse=True))
+
+    sample = characters[:SINGLE_SAVES]
+    _, single_seconds = timed(lambda: [backend.save_character(c) for c in sample])
+
+    assert len(loaded) == len(characters)
+    print(f"  {label:<7} batch save {save_seconds:7.2f} s | batch load {load_seconds:7.2f} s | "
+          f"sorted list {list_seconds * 1000:8.1f} ms | "
+          f"single save {single_seconds / len(sample) * 1e6:7.1f} us")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} characters ===")
+        characters = make_characters(count)
+        with tempfile.TemporaryDirectory() as directory:
+            text = save_backends.TextSaveBackend(os.path.join(directory, "saves"))
+            bench_backend("text", text, characters)
+            sqlite = save_backends.SQLiteSaveBackend(os.path.join(directory, "saves.db"))
+            bench_backend("sqlite", sqlite, characters)
+            sqlite.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Format
+
+Compares encode/decode throughput and size of the binary save format
+with the KEY: value text format.
+
+Usage: python benchmarks/bench_save_format.py [character_count ...]
+"""
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_format
+
+DEFAULT_SIZES = [10000, 100000]
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+ITEMS = ["health_potion", "iron_sword", "leather_armor", "mana_potion"]
+
+def make_characters(count):
+    """Build count characters with some inventory, quests and equipment"""
+    characters = []
+    for index in range(count):
+        character = character_manager.create_character(f"hero_{index}", CLASSES[index % 4])
+        character['level'] = 1 + index % 50
+        character['experience'] = index * 7
+        character['inventory'] = [ITEMS[(index + k) % 4] for k in range(index % 8)]
+        character['completed_quests'] = [f"quest_{k}" for k in range(index % 5)]
+        if index % 2:
+            character['equipped_weapon'] = {'id': 'iron_sword', 'effect': 'strength:5'}
+        characters.append(character)
+    return characters
+
+def text_encode(character):
+    return save_backends.format_text_save(character).encode("utf-8")
+
+def text_decode(data):
+    return save_backends.parse_text_save(data.decode("utf-8").splitlines())
+
+FORMATS = {
+    "text": (text_encode, text_decode),
+    "binary": (save_format.encode_character, save_format.decode_character),
+}
+
+def bench(count):
+    """Time encode and decode of count characters in each format"""
+    characters = make_characters(count)
+    # Keep collector pauses from building 100k dictionaries out of the timings
+    gc.disable()
+    for label, (encode, decode) in FORMATS.items():
+        start = time.perf_counter()
+        encoded = [encode(character) for character in characters]
+        encode_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = [decode(data) for data in encoded]
+        decode_seconds = time.perf_counter() - start
+
+        assert decoded[1]['max_health'] == characters[1]['max_health']
+        size = sum(len(data) for data in encoded) / count
+        print(f"  {label:<7} encode {count / encode_seconds:10.0f} /s | "
+              f"decode {count / decode_seconds:10.0f} /s | {size:6.1f} bytes/save")
+    gc.enable()
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} characters ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Index
+
+Compares building a load menu (name, class, level, gold for every save)
+by loading every save file with reading the save-directory index.
+
+Usage: python benchmarks/bench_save_index.py [save_count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_index
+
+DEFAULT_SIZES = [1000, 5000]
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+def bench(count):
+    """Time both ways of listing count saves"""
+    with tempfile.TemporaryDirectory() as save_directory:
+        for index in range(count):
+            character = character_manager.create_character(f"hero_{index}", CLASSES[index % 4])
+            character['level'] = 1 + index % 50
+            character_manager.save_character(character, save_directory)
+
+        start = time.perf_counter()
+        summaries = [save_index.read_save_summary(save_directory, name)
+                     for name in save_index.list_save_names(save_directory)]
+        summaries.sort(key=lambda entry: entry['level'])
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        # Force a fresh parse of the index file (no in-memory cache)
+        save_index.index_cache.clear()
+        start = time.perf_counter()
+        indexed = character_manager.list_save_summaries(save_directory, sort_by="level")
+        index_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        character_manager.list_save_summaries(save_directory, sort_by="level")
+        cached_ms = (time.perf_counter() - start) * 1000
+
+        assert len(indexed) == len(summaries) == count
+        print(f"  read every save {scan_ms:9.2f} ms | index file {index_ms:8.2f} ms | "
+              f"cached {cached_ms:7.2f} ms | {scan_ms / index_ms:5.1f}x")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} saves ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Journal
+
+Times saving a small change (gold, one new inventory item) to characters
+of growing size with whole-file binary saves and with the journal, and
+estimates bytes written per save (journal appends plus its periodic
+compactions).
+
+Usage: python benchmarks/bench_save_journal.py [inventory_size ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_journal
+
+DEFAULT_SIZES = [10, 1000, 10000]
+SAVES = 500
+
+def bench(inventory_size):
+    """Save SAVES small changes to one character with each backend"""
+    for label, make in (("binary", save_backends.BinarySaveBackend),
+                        ("journal", save_journal.JournalSaveBackend)):
+        with tempfile.TemporaryDirectory() as save_directory:
+            backend = make(save_directory)
+            character = character_manager.create_character("hero", "Warrior")
+            character['inventory'] = [f"item_{index}" for index in range(inventory_size)]
+            backend.save_character(character)
+
+            start = time.perf_counter()
+            for index in range(SAVES):
+                character['gold'] += 1
+                if index % 10 == 0:
+                    character['inventory'].append("health_potion")
+                backend.save_character(character)
+            elapsed = time.perf_counter() - start
+
+            if label == "binary":
+                per_save = os.path.getsize(backend.get_location("hero"))
+            else:
+                stats = backend.get_stats()
+                # Journals are compacted every COMPACT_RECORDS saves
+                per_save = (os.path.getsize(backend.get_location("hero")) * stats['snapshots']
+                            + stats['journal_bytes']) / SAVES
+            backend.close()
+            print(f"  {label:<8} {elapsed / SAVES * 1e6:8.1f} us/save | ~{per_save:9.0f} bytes written/save")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for inventory_size in sizes:
+        print(f"\n=== {inventory_size} inventory items, {SAVES} saves ===")
+        bench(inventory_size)
+
+if __name__ == "__main__":
+    main()
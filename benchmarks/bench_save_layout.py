@@ -0,0 +1,81 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Layout
+
+Fills a save directory with empty save files in the flat and the
+sharded layout, then times looking saves up by name (resolve the path
+with SaveLayout.locate and stat the file) for random hits and misses,
+and creating new save files.
+
+Usage: python benchmarks/bench_save_layout.py [save_count ...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import save_layout
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+LOOKUPS = 20000
+CREATES = 2000
+SUFFIX = "_save.dat"
+
+def fill(layout, count):
+    """Create count empty save files through the layout"""
+    for index in range(count):
+        path = layout.locate(f"hero_{index}", SUFFIX)
+        layout.make_directory(path)
+        open(path, "wb").close()
+
+def time_lookups(layout, names):
+    """Returns: Microseconds per locate + stat"""
+    start = time.perf_counter()
+    for name in names:
+        try:
+            os.stat(layout.locate(name, SUFFIX))
+        except FileNotFoundError:
+            pass
+    return (time.perf_counter() - start) / len(names) * 1e6
+
+def time_creates(layout, count):
+    """Returns: Microseconds per new save file created"""
+    start = time.perf_counter()
+    for index in range(CREATES):
+        path = layout.locate(f"newcomer_{count}_{index}", SUFFIX)
+        layout.make_directory(path)
+        open(path, "wb").close()
+    return (time.perf_counter() - start) / CREATES * 1e6
+
+def bench(count):
+    """Time lookups and creates in a flat and a sharded directory of count saves"""
+    rng = random.Random(count)
+    hits = [f"hero_{rng.randrange(count)}" for _ in range(LOOKUPS)]
+    misses = [f"ghost_{index}" for index in range(LOOKUPS)]
+    for mode in (save_layout.FLAT, save_layout.SHARDED):
+        with tempfile.TemporaryDirectory() as save_directory:
+            layout = save_layout.SaveLayout(save_directory)
+            if mode != save_layout.FLAT:
+                layout.set_mode(mode)
+            start = time.perf_counter()
+            fill(layout, count)
+            fill_elapsed = time.perf_counter() - start
+
+            hit_us = time_lookups(layout, hits)
+            miss_us = time_lookups(layout, misses)
+            create_us = time_creates(layout, count)
+            print(f"  {mode:<8} fill {fill_elapsed:7.1f} s | hit {hit_us:6.2f} us | "
+                  f"miss {miss_us:6.2f} us | create {create_us:7.2f} us")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} saves ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
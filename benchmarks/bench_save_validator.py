@@ -0,0 +1,49 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Validator
+
+Times validating a directory of binary saves with 1, 2, 4 and one per
+core worker processes.
+
+Usage: python benchmarks/bench_save_validator.py [save_count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_validator
+
+DEFAULT_SIZES = [20000, 100000]
+
+def bench(count):
+    """Write count saves, then validate them with each worker count"""
+    with tempfile.TemporaryDirectory() as save_directory:
+        backend = save_backends.BinarySaveBackend(save_directory)
+        characters = character_manager.create_characters(
+            (f"hero_{index}", "Warrior") for index in range(count))
+        for character in characters:
+            character['inventory'] = ["health_potion"] * 5
+        backend.save_characters(characters)
+
+        worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+        for workers in worker_counts:
+            start = time.perf_counter()
+            report = save_validator.validate_save_directory(save_directory, workers)
+            elapsed = time.perf_counter() - start
+            print(f"  {workers:3d} worker(s) {elapsed:7.2f} s | {report['checked'] / elapsed:9.0f} saves/s")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"CPU cores: {os.cpu_count()}")
+    for count in sizes:
+        print(f"\n=== {count} saves ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Save Writer
+
+Times save_character as seen by the game thread for each fsync policy,
+writing directly and through the background save writer. For the async
+rows, "call" is the time save_character takes to return and "total"
+includes the final flush.
+
+Usage: python benchmarks/bench_save_writer.py [save_count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+
+DEFAULT_SIZES = [200, 2000]
+WORKING_SET = 20
+
+def bench(count):
+    """Save count changes (round-robin over WORKING_SET characters) per mode"""
+    for policy in save_backends.DURABILITY_POLICIES:
+        for label in ("direct", "async"):
+            with tempfile.TemporaryDirectory() as save_directory:
+                if label == "async":
+                    character_manager.enable_async_saves(policy)
+                else:
+                    character_manager.set_save_durability(policy)
+                characters = [character_manager.create_character(f"hero_{index}", "Warrior")
+                              for index in range(WORKING_SET)]
+
+                start = time.perf_counter()
+                for index in range(count):
+                    character = characters[index % WORKING_SET]
+                    character['gold'] += 1
+                    character_manager.save_character(character, save_directory)
+                call_elapsed = time.perf_counter() - start
+                character_manager.disable_async_saves()
+                total_elapsed = time.perf_counter() - start
+                character_manager.file_backends.clear()
+
+            print(f"  {policy:<9} {label:<7} call {call_elapsed / count * 1e6:8.1f} us/save | "
+                  f"total {total_elapsed / count * 1e6:8.1f} us/save")
+    character_manager.set_save_durability("none")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} saves ===")
+        bench(count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: Sharded Catalog Loading
+
+Loads a directory of generated quest shards with different worker
+counts to show how parsing scales with CPU cores.
+
+Usage: python benchmarks/bench_shard_loading.py [shard_count] [quests_per_shard]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from catalog_generator import quest_block
+
+def write_shards(directory, shard_count, per_shard):
+    """Write shard_count quest files with per_shard quests each"""
+    for shard in range(shard_count):
+        with open(os.path.join(directory, f"quests_{shard:03d}.txt"), 'w') as f:
+            for index in range(shard * per_shard, (shard + 1) * per_shard):
+                f.write(quest_block(index))
+
+def main():
+    shard_count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    per_shard = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cores})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        write_shards(temp_dir, shard_count, per_shard)
+        print(f"{shard_count} shards x {per_shard} quests ({cores} cores)")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            quests = game_data.load_quests(temp_dir, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"  workers={workers:<3} {elapsed * 1000:9.1f} ms "
+                  f"({len(quests)} quests, {baseline / elapsed:4.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: String Pools
+
+Measures memory held by parsed catalogs with and without interning of
+the pooled fields (quest_id/prerequisite, item_id/type/effect), and the
+cost of the type check done by inventory_system.use_item.
+
+Usage: python benchmarks/bench_string_pool.py [record_count ...]
+"""
+
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from catalog_generator import item_block, quest_block
+
+DEFAULT_SIZES = [10000, 100000]
+
+PARSERS = {
+    "quests": (quest_block, game_data.QUEST_FIELDS, game_data.parse_quest_block_strict, game_data.Quest),
+    "items": (item_block, game_data.ITEM_FIELDS, game_data.parse_item_block_strict, game_data.Item),
+}
+
+def measure(parse_block, make_block, count):
+    """Parse count generated blocks and return (bytes retained, records)"""
+    blocks = [make_block(index).strip().split("\n") for index in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    records = [parse_block(lines) for lines in blocks]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, records
+
+def bench(label, count):
+    """Compare pooled and unpooled parsing for one record type"""
+    make_block, fields, strict_parser, record_type = PARSERS[label]
+    pooled = game_data.QUEST_BLOCK_PARSER if label == "quests" else game_data.ITEM_BLOCK_PARSER
+    unpooled = game_data.compile_block_parser(fields, strict_parser, record_type)
+
+    plain_bytes, plain_records = measure(unpooled, make_block, count)
+    del plain_records
+    pooled_bytes, pooled_records = measure(pooled, make_block, count)
+    print(f"  {label:<7} unpooled {plain_bytes / 2**20:8.1f} MiB | "
+          f"pooled {pooled_bytes / 2**20:8.1f} MiB | "
+          f"saved {(plain_bytes - pooled_bytes) / 2**20:7.1f} MiB "
+          f"({100 * (1 - pooled_bytes / plain_bytes):4.1f}%)")
+
+def bench_type_check(count):
+    """Time item_data['type'] != 'consumable' for pooled and unpooled items"""
+    unpooled = game_data.compile_block_parser(
+        game_data.ITEM_FIELDS, game_data.parse_item_block_strict, game_data.Item
+    )
+    # Index 2 is a consumable in the generator; build its type at runtime
+    lines = item_block(2).strip().split("\n")
+    plain_item = unpooled(lines)
+    pooled_item = game_data.parse_item_block(lines)
+    for label, item in (("unpooled", plain_item), ("pooled", pooled_item)):
+        seconds = timeit.timeit(lambda: item['type'] != 'consumable', number=count)
+        print(f"  type check ({label:<8}) {seconds * 1e9 / count:6.1f} ns/check")
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n=== {count} records ===")
+        for label in PARSERS:
+            bench(label, count)
+    print()
+    bench_type_check(1000000)
+
+if __name__ == "__main__":
+    main()
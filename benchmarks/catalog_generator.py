@@ -0,0 +1,61 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark Catalog Generator
+
+Writes synthetic quest and item files in the same block format as
+data/quests.txt and data/items.txt so benchmarks can run on catalogs
+much larger than the ones shipped with the game.
+"""
+
+ITEM_TYPES = ["weapon", "armor", "consumable"]
+ITEM_STATS = {"weapon": "strength", "armor": "max_health", "consumable": "health"}
+
+def quest_block(index):
+    """
+    Build the text for one generated quest
+
+    Every quest after the first requires the previous one, which gives
+    the catalog a long prerequisite chain.
+
+    Returns: String containing one quest block (with trailing blank line)
+    """
+    prerequisite = "NONE" if index == 0 else f"quest_{index - 1}"
+    return (
+        f"QUEST_ID: quest_{index}\n"
+        f"TITLE: Generated Quest {index}\n"
+        f"DESCRIPTION: Generated quest number {index} for benchmarking\n"
+        f"REWARD_XP: {50 + index % 500}\n"
+        f"REWARD_GOLD: {25 + index % 250}\n"
+        f"REQUIRED_LEVEL: {1 + index % 50}\n"
+        f"PREREQUISITE: {prerequisite}\n"
+        "\n"
+    )
+
+def item_block(index):
+    """
+    Build the text for one generated item
+
+    Returns: String containing one item block (with trailing blank line)
+    """
+    item_type = ITEM_TYPES[index % len(ITEM_TYPES)]
+    return (
+        f"ITEM_ID: item_{index}\n"
+        f"NAME: Generated Item {index}\n"
+        f"TYPE: {item_type}\n"
+        f"EFFECT: {ITEM_STATS[item_type]}:{1 + index % 40}\n"
+        f"COST: {10 + index % 1000}\n"
+        f"DESCRIPTION: Generated {item_type} number {index} for benchmarking\n"
+        "\n"
+    )
+
+def write_quest_file(filename, count):
+    """Write a quest file containing count generated quests"""
+    with open(filename, 'w') as f:
+        for index in range(count):
+            f.write(quest_block(index))
+
+def write_item_file(filename, count):
+    """Write an item file containing count generated items"""
+    with open(filename, 'w') as f:
+        for index in range(count):
+            f.write(item_block(index))
@@ -0,0 +1,172 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Catalog Cache Module
+
+This module stores parsed quest and item catalogs in a binary sidecar
+file next to their text source (e.g. data/quests.txt.cache) so an
+unchanged catalog can be loaded with a single read instead of a re-parse.
+"""
+
+import hashlib
+import os
+import pickle
+import struct
+
+# Sidecar layout:
+#   magic (4 bytes) | header (struct) | sha256 digest (32 bytes) | pickle payload
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"QCC1"
+CACHE_HEADER = struct.Struct("<16sQQ")   # schema tag, source size, source mtime_ns
+DIGEST_SIZE = 32
+PAYLOAD_OFFSET = len(CACHE_MAGIC) + CACHE_HEADER.size + DIGEST_SIZE
+
+# ============================================================================
+# SOURCE FINGERPRINTS
+# ============================================================================
+
+def get_cache_path(filename):
+    """
+    Get the sidecar cache path for a data file
+
+    Returns: String path (source path + ".cache")
+    """
+    return filename + CACHE_SUFFIX
+
+def get_source_stat(filename):
+    """
+    Get the size and modification time of a data file
+
+    Returns: Tuple of (size_in_bytes, mtime_ns)
+    """
+    stat = os.stat(filename)
+    return (stat.st_size, stat.st_mtime_ns)
+
+def hash_file(filename):
+    """
+    Compute the sha256 digest of a data file's contents
+
+    Returns: 32-byte digest
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+# ============================================================================
+# READING AND WRITING
+# ============================================================================
+
+def read_cache(filename, schema):
+    """
+    Read a cached catalog for a data file
+
+    Args:
+        filename: Path to the text data file
+        schema: Short tag naming the record type and parser version
+
+    The cache is used when the source size and mtime match the header.
+    If only the mtime differs (file touched or copied), the source is
+    hashed and the cache is still used when the content is unchanged.
+
+    Returns: Cached catalog dictionary, or None if missing or stale
+    """
+    cache_path = get_cache_path(filename)
+    try:
+        with open(cache_path, 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    if len(blob) < PAYLOAD_OFFSET or not blob.startswith(CACHE_MAGIC):
+        return None
+
+    tag, size, mtime_ns = CACHE_HEADER.unpack_from(blob, len(CACHE_MAGIC))
+    if tag.rstrip(b"\0") != schema.encode():
+        return None
+
+    try:
+        current_size, current_mtime_ns = get_source_stat(filename)
+    except OSError:
+        return None
+
+    if current_size != size:
+        return None
+
+    digest = blob[PAYLOAD_OFFSET - DIGEST_SIZE:PAYLOAD_OFFSET]
+    if current_mtime_ns != mtime_ns and hash_file(filename) != digest:
+        return None
+
+    try:
+        catalog = pickle.loads(memoryview(blob)[PAYLOAD_OFFSET:])
+    except Exception:
+        # A damaged sidecar is never fatal - the caller just re-parses
+        return None
+
+    if current_mtime_ns != mtime_ns:
+        # Content is unchanged, refresh the header so the next load skips hashing
+        write_cache(filename, schema, catalog, digest)
+    return catalog
+
+def write_cache(filename, schema, catalog, digest=None):
+    """
+    Write a parsed catalog to the sidecar cache for a data file
+
+    The sidecar is written to a temporary file and renamed into place so
+    a concurrent reader never sees a half-written cache.
+
+    Returns: True if the cache was written, False if it could not be
+    """
+    cache_path = get_cache_path(filename)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        size, mtime_ns = get_source_stat(filename)
+        if digest is None:
+            digest = hash_file(filename)
+        payload = pickle.dumps(catalog, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(temp_path, 'wb') as f:
+            f.write(CACHE_MAGIC)
+            f.write(CACHE_HEADER.pack(schema.encode(), size, mtime_ns))
+            f.write(digest)
+            f.write(payload)
+        os.replace(temp_path, cache_path)
+        return True
+    except OSError:
+        # Read-only data directories simply run without a cache
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def load_with_cache(filename, schema, parse_file):
+    """
+    Load a catalog through the sidecar cache
+
+    Args:
+        filename: Path to the text data file
+        schema: Short tag naming the record type and parser version
+        parse_file: Function that parses filename into a catalog dict
+
+    Returns: Catalog dictionary (from cache, or freshly parsed and cached)
+    """
+    catalog = read_cache(filename, schema)
+    if catalog is not None:
+        return catalog
+
+    digest = hash_file(filename)
+    catalog = parse_file(filename)
+    # Only cache what we parsed if the file did not change underneath us
+    if hash_file(filename) == digest:
+        write_cache(filename, schema, catalog, digest)
+    return catalog
+
+def clear_cache(filename):
+    """
+    Remove the sidecar cache for a data file if it exists
+
+    Returns: True if a cache file was removed
+    """
+    try:
+        os.remove(get_cache_path(filename))
+        return True
+    except FileNotFoundError:
+        return False
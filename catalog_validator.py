@@ -0,0 +1,207 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Catalog Validator Module
+
+Checks whole quest, item and class catalogs in one pass and reports every
+problem (with file, line and field) instead of stopping at the first
+InvalidDataFormatError the loaders would raise.
+
+Command line usage:
+    python catalog_validator.py [--quests PATH] [--items PATH] [--classes PATH] [--workers N]
+
+PATH may be a single file, a directory of shards or a glob pattern.
+With --workers, shard files are checked in parallel worker processes.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import game_data
+from custom_exceptions import DataError
+
+# kind -> (field schema, value rules, ID field)
+CATALOG_KINDS = {
+    'quests': (game_data.QUEST_FIELDS, game_data.QUEST_RULES, 'quest_id'),
+    'items': (game_data.ITEM_FIELDS, game_data.ITEM_RULES, 'item_id'),
+    'classes': (game_data.CLASS_FIELDS, game_data.CLASS_RULES, 'class_name')
+}
+
+# ============================================================================
+# SINGLE FILE VALIDATION
+# ============================================================================
+
+def make_error(filename, line, field, message):
+    """
+    Build one error entry
+
+    Returns: Dictionary with 'file', 'line', 'field' and 'message'
+             (line is None for whole-file problems, field is None for
+             problems that are not about a single field)
+    """
+    return {'file': filename, 'line': line, 'field': field, 'message': message}
+
+def validate_catalog_file(filename, kind):
+    """
+    Check every block in one quest or item file
+
+    Args:
+        filename: Path to the data file
+        kind: 'quests', 'items' or 'classes'
+
+    Returns: Dictionary with:
+        'errors': list of error entries found in this file
+        'records': list of (record_id, line) for every block with an ID
+        'prerequisites': list of (quest_id, prerequisite, line) (quests only)
+    """
+    fields, rules, id_field = CATALOG_KINDS[kind]
+    converters = {name: converter for name, converter in fields}
+    result = {'errors': [], 'records': [], 'prerequisites': []}
+    errors = result['errors']
+
+    try:
+        for start_line, lines in game_data.iter_data_blocks(filename):
+            record = {}
+            field_lines = {}
+            bad_fields = set()
+
+            # Blocks never contain blank lines, so line numbers are consecutive
+            for line_number, line in enumerate(lines, start_line):
+                key, separator, value = line.partition(": ")
+                if not separator:
+                    errors.append(make_error(filename, line_number, None,
+                                             f"expected 'KEY: value', found {line!r}"))
+                    continue
+                name = key.lower()
+                if name not in converters:
+                    continue    # Unknown keys are ignored by the loaders too
+                if name in field_lines:
+                    errors.append(make_error(filename, line_number, name,
+                                             f"field repeated (first on line {field_lines[name]})"))
+                field_lines[name] = line_number
+                if converters[name] is int:
+                    try:
+                        value = int(value)
+                    except ValueError:
+                        errors.append(make_error(filename, line_number, name,
+                                                 f"expected a whole number, found {value!r}"))
+                        bad_fields.add(name)
+                        continue
+                record[name] = value
+
+            for name, message in game_data.find_record_problems(record, fields, rules):
+                if name not in bad_fields:
+                    errors.append(make_error(filename, field_lines.get(name, start_line), name, message))
+
+            if id_field in record:
+                result['records'].append((record[id_field], field_lines[id_field]))
+                if 'prerequisite' in record:
+                    result['prerequisites'].append(
+                        (record[id_field], record['prerequisite'], field_lines['prerequisite'])
+                    )
+    except DataError as e:
+        errors.append(make_error(filename, None, None, str(e)))
+
+    return result
+
+# ============================================================================
+# CATALOG VALIDATION
+# ============================================================================
+
+def validate_catalog(path, kind, workers=1):
+    """
+    Check a whole quest or item catalog and collect every error
+
+    Besides the per-block checks, this reports IDs defined more than
+    once (within or across files) and, for quests, prerequisites that do
+    not name any quest in the catalog.
+
+    Args:
+        path: Data file, directory of shards or glob pattern
+        kind: 'quests', 'items' or 'classes'
+        workers: Worker processes for multi-file catalogs
+                 (1 = check in this process, 0 = one per CPU core)
+
+    Returns: List of error entries in file/line order (empty if valid)
+    """
+    if game_data.is_shard_path(path):
+        try:
+            filenames = game_data.find_shard_files(path)
+        except DataError as e:
+            return [make_error(path, None, None, str(e))]
+    else:
+        filenames = [path]
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(filenames)))
+
+    if workers == 1:
+        results = [validate_catalog_file(name, kind) for name in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_catalog_file, filenames, [kind] * len(filenames)))
+
+    errors = []
+    first_seen = {}
+    for filename, result in zip(filenames, results):
+        errors.extend(result['errors'])
+        for record_id, line in result['records']:
+            if record_id in first_seen:
+                first_file, first_line = first_seen[record_id]
+                errors.append(make_error(filename, line, CATALOG_KINDS[kind][2],
+                                         f"duplicate ID {record_id!r} (first defined at {first_file}:{first_line})"))
+            else:
+                first_seen[record_id] = (filename, line)
+
+    for filename, result in zip(filenames, results):
+        for quest_id, prerequisite, line in result['prerequisites']:
+            if prerequisite != "NONE" and prerequisite not in first_seen:
+                errors.append(make_error(filename, line, 'prerequisite',
+                                         f"quest {quest_id!r} requires missing quest {prerequisite!r}"))
+
+    errors.sort(key=lambda error: (error['file'], error['line'] or 0))
+    return errors
+
+def format_error(error):
+    """
+    Returns: String in "file:line: field: message" form
+    """
+    location = error['file'] if error['line'] is None else f"{error['file']}:{error['line']}"
+    if error['field']:
+        return f"{location}: {error['field']}: {error['message']}"
+    return f"{location}: {error['message']}"
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main(argv=None):
+    """
+    Validate the quest, item and class catalogs and print every error
+
+    Returns: Exit status (0 if every catalog is valid, 1 otherwise)
+    """
+    parser = argparse.ArgumentParser(description="Validate Quest Chronicles data catalogs.")
+    parser.add_argument("--quests", default="data/quests.txt",
+                        help="quest file, shard directory or glob (default: %(default)s)")
+    parser.add_argument("--items", default="data/items.txt",
+                        help="item file, shard directory or glob (default: %(default)s)")
+    parser.add_argument("--classes", default="data/classes.txt",
+                        help="class file, shard directory or glob (default: %(default)s)")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="worker processes for multi-file catalogs (0 = one per core)")
+    args = parser.parse_args(argv)
+
+    total_errors = 0
+    for kind, path in (('quests', args.quests), ('items', args.items), ('classes', args.classes)):
+        errors = validate_catalog(path, kind, args.workers)
+        for error in errors:
+            print(format_error(error))
+        print(f"{kind}: {len(errors)} error(s) in {path}")
+        total_errors += len(errors)
+
+    return 1 if total_errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,15 +9,49 @@ AI Usage: [Document any AI assistance used]
 This module handles character creation, loading, and saving.
 """
 
+import atexit
+import math
 import os
+from collections import OrderedDict
+import game_data
+import save_backends
+import save_layout
+import save_writer
+from save_backends import SAVE_FIELDS, EQUIPMENT_FIELDS
 from custom_exceptions import (
     InvalidCharacterClassError,
-    CharacterNotFoundError,
-    SaveFileCorruptedError,
+    MissingDataFileError,
     InvalidSaveDataError,
     CharacterDeadError
 )
 
+# Save location -> snapshot of the saved fields as last saved or loaded
+saved_snapshots = {}
+
+# (backend, character name) -> save location as last saved or loaded, so
+# an unchanged character is skipped without resolving its location (which
+# may check for files while a save directory is migrated)
+saved_locations = {}
+
+# Backend all saves go through. None means one save file per character in
+# the save_directory given to each call (binary unless QUEST_SAVE_BACKEND is
+# "text" or "journal"). Set it with set_storage_backend() or the QUEST_SAVE_BACKEND
+# environment variable (e.g. "sqlite:data/saves.db").
+storage_backend = None
+file_backends = {}
+
+# Class key -> game_data.CharacterClass, loaded from CLASSES_FILE on first
+# use (see get_class_registry)
+CLASSES_FILE = "data/classes.txt"
+class_registry = None
+
+# When saves are forced to disk (see save_backends.DURABILITY_POLICIES)
+save_durability = "none"
+
+# Background writer used by save_character while async saves are enabled
+# (see enable_async_saves). None means saves are written before returning.
+async_writer = None
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
@@ -26,7 +60,8 @@ def create_character(name, character_class):
     """
     Create a new character with stats based on class
     
-    Valid classes: Warrior, Mage, Rogue, Cleric
+    Valid classes: those in data/classes.txt (Warrior, Mage, Rogue and
+    Cleric by default), in any letter case
     
     Returns: Dictionary with character data including:
             - name, class, level, health, max_health, strength, magic
@@ -34,58 +69,66 @@ def create_character(name, character_class):
     
     Raises: InvalidCharacterClassError if class is not valid
     """
-    # TODO: Implement character creation
-    # Validate character_class first
-    # Example base stats:
-    # Warrior: health=120, strength=15, magic=5
-    # Mage: health=80, strength=8, magic=20
-    # Rogue: health=90, strength=12, magic=10
-    # Cleric: health=100, strength=10, magic=15
-    
     # All characters start with:
     # - level=1, experience=0, gold=100
     # - inventory=[], active_quests=[], completed_quests=[]
-    
-    # Raise InvalidCharacterClassError if class not in valid list
-    valid_class = ["Warrior", "Rogue", "Cleric", "Mage"]
+    # Base stats come from the class definition (see get_class_info)
+    return build_character(name, get_class_info(character_class))
 
-    if character_class.capitalize() not in valid_class:
-        raise InvalidCharacterClassError(f"Invalid class {character_class}. Available classes are: {','.join(valid_class)}")
+def create_characters(specs):
+    """
+    Create many characters at once (e.g. for load tests)
     
-
-    character = { 
-        "name": name, 
-        "class": character_class.capitalize(), 
-        "level": 1, 
-        "experience": 0, 
-        "gold": 100, 
-        "inventory": [], 
-        "active_quests": [], 
+    Each distinct class name is looked up once, however many characters
+    use it.
+    
+    Args:
+        specs: Iterable of (name, character_class) pairs
+    
+    Returns: List of character dictionaries in the order given
+    Raises: InvalidCharacterClassError if any class is not valid
+    """
+    resolved = {}
+    characters = []
+    for name, character_class in specs:
+        class_info = resolved.get(character_class)
+        if class_info is None:
+            class_info = resolved[character_class] = get_class_info(character_class)
+        characters.append(build_character(name, class_info))
+    return characters
+
+def build_character(name, class_info):
+    """
+    Build a level 1 character from a class definition
+    
+    Returns: Character dictionary
+    """
+    return {
+        "name": name,
+        "class": class_info.class_name,
+        "level": 1,
+        "experience": 0,
+        "gold": 100,
+        "inventory": [],
+        "active_quests": [],
         "completed_quests": [],
         "equipped_weapon": None,
-        "equipped_armor": None
+        "equipped_armor": None,
+        "health": class_info.health,
+        "max_health": class_info.health,
+        "strength": class_info.strength,
+        "magic": class_info.magic
     }
 
-    if character_class.capitalize() == "Warrior":
-        class_stats = {"health": 120, "max_health": 120, "strength": 15, "magic": 5}
-    elif character_class.capitalize() == "Mage":
-        class_stats = {"health": 80, "max_health": 80, "strength": 8, "magic": 20}
-    elif character_class.capitalize() == "Rogue":
-        class_stats = {"health": 90, "max_health": 90, "strength": 12, "magic": 10}
-    elif character_class.capitalize() == "Cleric":
-        class_stats = {"health": 100, "max_health": 100, "strength": 10, "magic": 15}
-
-    character.update(class_stats)
-
-    return character
-
-def save_character(character, save_directory="data/save_games"):
+def save_character(character, save_directory="data/save_games", force=False):
     """
     Save character to file
     
-    Filename format: {character_name}_save.txt
+    Filename format: {character_name}_save.dat
     
-    File format:
+    File format: versioned binary save holding every field, including
+    equipped items (see save_format.py). Use export_character for the
+    readable text format:
     NAME: character_name
     CLASS: class_name
     LEVEL: 1
@@ -98,6 +141,15 @@ def save_character(character, save_directory="data/save_games"):
     INVENTORY: item1,item2,item3
     ACTIVE_QUESTS: quest1,quest2
     COMPLETED_QUESTS: quest1,quest2
+    EQUIPPED_WEAPON: item_id,effect
+    EQUIPPED_ARMOR: item_id,effect
+    
+    If none of the saved fields changed since this character was last
+    saved or loaded, nothing is written (use force=True to write anyway).
+    If another storage backend is configured (see set_storage_backend),
+    the character is saved there instead of in save_directory. While
+    async saves are enabled, a copy of the character is queued for the
+    background writer and write errors are raised by flush_saves().
     
     Returns: True if successful
     Raises: PermissionError, IOError (let them propagate or handle)
@@ -106,27 +158,34 @@ def save_character(character, save_directory="data/save_games"):
     # Create save_directory if it doesn't exist
     # Handle any file I/O errors appropriately
     # Lists should be saved as comma-separated values
+    save_if_changed(character, save_directory, force)
+    return True
+
+def save_if_changed(character, save_directory="data/save_games", force=False):
+    """
+    Save a character the way save_character does, reporting whether
+    anything was written
+
+    Returns: True if the save was written (or queued), False if the
+             character was unchanged and nothing was written
+    Raises: PermissionError, IOError, InvalidSaveDataError
+    """
     try:
-        os.makedirs(save_directory, exist_ok=True)
-
-        filename = f"{character["name"]}_save.txt"
-        filepath = os.path.join(save_directory, filename)
-
-        with open(filepath, 'w') as f:
-            f.write(f"NAME: {character['name']}\n")
-            f.write(f"CLASS: {character['class']}\n")
-            f.write(f"LEVEL: {character['level']}\n")
-            f.write(f"HEALTH: {character['health']}\n")
-            f.write(f"MAX_HEALTH: {character['max_health']}\n")
-            f.write(f"STRENGTH: {character['strength']}\n")
-            f.write(f"MAGIC: {character['magic']}\n")
-            f.write(f"EXPERIENCE: {character['experience']}\n")
-            f.write(f"GOLD: {character['gold']}\n")
-            f.write(f"INVENTORY: {','.join(character['inventory'])}\n")
-            f.write(f"ACTIVE_QUESTS: {','.join(character['active_quests'])}\n")
-            f.write(f"COMPLETED_QUESTS: {','.join(character['completed_quests'])}\n")
-
-            return True
+        backend = get_storage_backend(save_directory)
+        snapshot = get_character_snapshot(character)
+        if not force and is_saved(backend, character['name'], snapshot):
+            return False
+
+        location = backend.get_location(character['name'])
+        saved_locations[(backend, character['name'])] = location
+        load_cache.invalidate(location)
+        if async_writer is not None:
+            check_save_fields(character)
+            queue_save(backend, location, snapshot, character)
+        else:
+            backend.save_character(character)
+            saved_snapshots[location] = snapshot
+        return True
     except IOError as e:
         print(f"Error saving character {character['name']}: {e}")
         raise
@@ -154,58 +213,145 @@ def load_character(character_name, save_directory="data/save_games"):
     # Validate data format → InvalidSaveDataError
     # Parse comma-separated lists back into Python lists
 
-    file_name = f"{character_name}_save.txt"
-    file_path = os.path.join(save_directory, file_name)
-
-    if not os.path.exists(file_path):
-        raise CharacterNotFoundError(f"Save file not found for {character_name}")
-    
-    try:
-        data = {}
-        with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                if ": " in line:
-                    key, value = line.split(": ")
-                else:
-                    if line.endswith(":"):
-                        key = line[:-1]
-                        value = ""
-                    else:
-                        raise InvalidSaveDataError(f"Malformed line in save file: '{line}'")
-                    data[key] = value
-    except Exception as e:
-        raise SaveFileCorruptedError(f"Could not read save file: {e}")
-    try:
-        character = {
-            "name": data["NAME"], "class": data["CLASS"], "level": int(data["LEVEL"]), "experience": int(data["EXPERIENCE"]), "health": int(data["HEALTH"]), "strength": int(data["STRENGTH"]), "gold": int(data["GOLD"]), "inventory": data["INVENTORY"].split(",") if data["INVENTORY"] else [], "active_quests": data["ACTIVE_QUESTS"].split(",") if data["ACTIVE_QUESTS"] else [], "completed_quests": data["COMPLETED_QUESTS"].split(",") if data["COMPLETED_QUESTS"] else []}
-
+    backend = get_storage_backend(save_directory)
+    location = backend.get_location(character_name)
+    saved_locations[(backend, character_name)] = location
+    character = get_pending_save(location)
+    if character is not None:
+        saved_snapshots[location] = get_character_snapshot(character)
         return character
+    signature = backend.get_signature(character_name)
+    character = load_cache.get(location, signature)
+    if character is None:
+        character = backend.load_character(character_name)
+        load_cache.put(location, signature, character)
+    saved_snapshots[location] = get_character_snapshot(character)
+    return character
 
-    except Exception as e:
-        raise InvalidSaveDataError(f"Invalid save data: {e}")
+def save_characters(characters, save_directory="data/save_games", force=False):
+    """
+    Save many characters at once
+    
+    Unchanged characters are skipped (unless force=True); the rest are
+    written in one batch (one transaction for the SQLite backend), or
+    queued for the background writer while async saves are enabled.
+    
+    Returns: Number of characters written
+    Raises: IOError, InvalidSaveDataError if a character is missing fields
+    """
+    backend = get_storage_backend(save_directory)
+    pending = []
+    for character in characters:
+        try:
+            snapshot = get_character_snapshot(character)
+        except KeyError as e:
+            raise InvalidSaveDataError(f"Character data is missing key: {e}")
+        if force or not is_saved(backend, character['name'], snapshot):
+            location = backend.get_location(character['name'])
+            saved_locations[(backend, character['name'])] = location
+            pending.append((location, snapshot, character))
+
+    if pending:
+        for location, snapshot, character in pending:
+            load_cache.invalidate(location)
+        try:
+            if async_writer is not None:
+                for location, snapshot, character in pending:
+                    check_save_fields(character)
+                for location, snapshot, character in pending:
+                    queue_save(backend, location, snapshot, character)
+            else:
+                backend.save_characters([character for location, snapshot, character in pending])
+                for location, snapshot, character in pending:
+                    saved_snapshots[location] = snapshot
+        except KeyError as e:
+            raise InvalidSaveDataError(f"Character data is missing key: {e}")
+    return len(pending)
+
+def load_characters(character_names, save_directory="data/save_games"):
+    """
+    Load many characters at once (one transaction for the SQLite backend)
+    
+    Characters still valid in the load cache are not read again.
+    
+    Returns: List of character dictionaries in the order requested
+    Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+    """
+    backend = get_storage_backend(save_directory)
+    found = {}
+    missing = []
+    for name in character_names:
+        location = backend.get_location(name)
+        character = get_pending_save(location)
+        if character is not None:
+            found[name] = character
+            continue
+        signature = backend.get_signature(name)
+        character = load_cache.get(location, signature)
+        if character is None:
+            missing.append((name, location, signature))
+        else:
+            found[name] = character
+
+    if missing:
+        loaded = backend.load_characters([name for name, location, signature in missing])
+        for (name, location, signature), character in zip(missing, loaded):
+            load_cache.put(location, signature, character)
+            found[name] = character
+
+    characters = []
+    for name in character_names:
+        character = found[name]
+        location = backend.get_location(name)
+        saved_locations[(backend, name)] = location
+        saved_snapshots[location] = get_character_snapshot(character)
+        characters.append(character)
+    return characters
+
+def export_character(character_name, export_path=None, save_directory="data/save_games"):
+    """
+    Write a saved character in the readable text save format
+    
+    Args:
+        character_name: Name of character to export
+        export_path: File to write (default: data/exports/{name}_save.txt)
+        save_directory: Directory containing save files
+    
+    Returns: Path of the written file
+    Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+    """
+    character = get_storage_backend(save_directory).load_character(character_name)
+    return save_backends.export_text_save(character, export_path)
 
 def list_saved_characters(save_directory="data/save_games"):
     """
     Get list of all saved character names
     
-    Returns: List of character names (without _save.txt extension)
+    Names come from the save index (see save_index.py), which is
+    rebuilt from the directory if it is missing or out of date.
+    
+    Returns: List of character names (without the _save.dat/_save.txt extension)
     """
     # TODO: Implement this function
     # Return empty list if directory doesn't exist
     # Extract character names from filenames
-    try:
-        all_files = os.listdir(save_directory)
-        characters_save = []
-        for filename in all_files:
-            if filename.endswith("_save.txt"):
-                character_name = filename[:-10]
-                characters_save.append(character_name)
-        return characters_save
-    except FileNotFoundError:
-        return []
+    flush_saves()
+    return get_storage_backend(save_directory).list_names()
+
+def list_save_summaries(save_directory="data/save_games", sort_by="name", reverse=False):
+    """
+    Get name, class, level, gold and last-saved time for every save
+    
+    Args:
+        save_directory: Directory containing save files
+        sort_by: 'name', 'class', 'level', 'gold' or 'saved_at'
+        reverse: True for descending order
+    
+    Returns: List of dictionaries with 'name', 'class', 'level', 'gold'
+             and 'saved_at' (a time.time() timestamp)
+    """
+    flush_saves()
+    return get_storage_backend(save_directory).list_summaries(sort_by, reverse)
 
 def delete_character(character_name, save_directory="data/save_games"):
     """
@@ -216,23 +362,448 @@ def delete_character(character_name, save_directory="data/save_games"):
     """
     # TODO: Implement character deletion
     # Verify file exists before attempting deletion
-    filename = f"{character_name}_save.txt"
-    filepath = save_directory + "/" + filename
-    if not os.path.exists(filepath):
-        raise CharacterNotFoundError(f"No save file to delete for {character_name}")
-        
+    flush_saves()
+    backend = get_storage_backend(save_directory)
     try:
-        os.remove(filepath)
-        return True
+        backend.delete_character(character_name)
     except OSError as e:
-        print(f"Error deleting file {filepath}: {e}")
+        print(f"Error deleting save for {character_name}: {e}")
         raise
+    saved_snapshots.pop(backend.get_location(character_name), None)
+    load_cache.invalidate(backend.get_location(character_name))
+    return True
+
+# ============================================================================
+# CHARACTER CLASSES
+# ============================================================================
+
+def get_class_registry():
+    """
+    Get every character class, loading CLASSES_FILE on first use
+    
+    The built-in game_data.DEFAULT_CLASSES are used if the file does
+    not exist.
+    
+    Returns: Dictionary of class key -> CharacterClass
+    Raises: InvalidDataFormatError, CorruptedDataError for a bad class file
+    """
+    global class_registry
+    if class_registry is None:
+        try:
+            class_registry = game_data.load_classes(CLASSES_FILE)
+        except MissingDataFileError:
+            class_registry = dict(game_data.DEFAULT_CLASSES)
+    return class_registry
+
+def set_class_registry(classes):
+    """
+    Use a loaded set of classes (None to reload CLASSES_FILE on next use)
+    
+    Args:
+        classes: Result of game_data.load_classes, or None
+    """
+    global class_registry
+    class_registry = classes
+
+def get_class_info(character_class):
+    """
+    Look up a class by name, ignoring letter case
+    
+    Returns: CharacterClass with class_name, health, strength, magic
+             and ability
+    Raises: InvalidCharacterClassError if there is no such class
+    """
+    class_info = get_class_registry().get(game_data.get_class_key(character_class))
+    if class_info is None:
+        raise InvalidCharacterClassError(
+            f"Invalid class {character_class}. Available classes are: {','.join(get_class_names())}"
+        )
+    return class_info
+
+def get_class_names():
+    """
+    Returns: List of class display names (e.g. ["Warrior", "Mage", ...])
+    """
+    return [class_info.class_name for class_info in get_class_registry().values()]
+
+# ============================================================================
+# STORAGE BACKENDS
+# ============================================================================
+
+def set_storage_backend(backend):
+    """
+    Send every save, load, list and delete through one backend
+    
+    Args:
+        backend: A save_backends backend, or None to go back to text
+                 files in each call's save_directory
+    """
+    global storage_backend
+    flush_saves()
+    storage_backend = backend
+    if backend is not None:
+        backend.set_durability(save_durability)
+    saved_snapshots.clear()
+    saved_locations.clear()
+    load_cache.clear()
+
+def get_storage_backend(save_directory="data/save_games"):
+    """
+    Get the backend for a call
+    
+    Returns: The configured backend, or the text backend for save_directory
+    """
+    global storage_backend
+    if storage_backend is None:
+        spec = os.environ.get("QUEST_SAVE_BACKEND", "binary")
+        if spec not in ("binary", "text", "journal"):
+            storage_backend = save_backends.make_backend(spec)
+            storage_backend.set_durability(save_durability)
+            return storage_backend
+        backend = file_backends.get((spec, save_directory))
+        if backend is None:
+            backend = save_backends.make_backend(f"{spec}:{save_directory}")
+            backend.set_durability(save_durability)
+            file_backends[(spec, save_directory)] = backend
+        return backend
+    return storage_backend
+
+def close_storage_backends():
+    """
+    Close every backend opened so far (e.g. folding journals into their
+    snapshots); later calls open them again as needed
+    
+    Raises: IOError
+    """
+    global storage_backend
+    flush_saves()
+    backends = list(file_backends.values())
+    if storage_backend is not None:
+        backends.append(storage_backend)
+    file_backends.clear()
+    storage_backend = None
+    saved_snapshots.clear()
+    saved_locations.clear()
+    load_cache.clear()
+    for backend in backends:
+        backend.close()
+
+def set_save_durability(policy):
+    """
+    Choose when saves are forced to disk, for every backend
+    
+    Args:
+        policy: 'none', 'per-save' or 'periodic'
+                (see save_backends.DURABILITY_POLICIES)
+    
+    Raises: ValueError for an unknown policy
+    """
+    global save_durability
+    save_backends.check_durability(policy)
+    save_durability = policy
+    for backend in list(file_backends.values()) + [storage_backend]:
+        if backend is not None:
+            backend.set_durability(policy)
+
+def migrate_save_layout(save_directory="data/save_games"):
+    """
+    Move a flat save directory to the sharded layout (see save_layout.py)
+    
+    Saves, loads and deletes keep working while files are moved.
+    
+    Returns: Number of files moved
+    Raises: OSError
+    """
+    flush_saves()
+    moved = save_layout.migrate_to_sharded(save_directory)
+    flush_saves()
+    # Saves are tracked by file path, and the paths have changed
+    saved_snapshots.clear()
+    saved_locations.clear()
+    load_cache.clear()
+    return moved
+
+# ============================================================================
+# ASYNC SAVES
+# ============================================================================
+
+def enable_async_saves(fsync_policy="none", max_pending=save_writer.DEFAULT_MAX_PENDING):
+    """
+    Write saves on a background thread from now on
+    
+    save_character returns as soon as a copy of the character is queued.
+    Loads see queued saves immediately; listings, deletes and backend
+    changes wait for the queue to empty. The queue is flushed when the program exits.
+    
+    Args:
+        fsync_policy: 'none', 'per-save' or 'periodic'
+        max_pending: Characters that may wait in the queue at once
+    
+    Raises: ValueError for an unknown fsync policy
+    """
+    global async_writer
+    disable_async_saves()
+    set_save_durability(fsync_policy)
+    async_writer = save_writer.SaveWriter(max_pending, fsync_policy,
+                                          on_failure=forget_failed_save)
+    return async_writer
+
+def disable_async_saves():
+    """
+    Flush and stop the background writer; later saves are written directly
+    
+    Raises: IOError if any queued save could not be written
+    """
+    global async_writer
+    writer = async_writer
+    async_writer = None
+    if writer is not None:
+        writer.close()
+
+def flush_saves():
+    """
+    Wait until every queued save has been written
+    
+    Returns: True
+    Raises: IOError if any queued save could not be written since the
+            last flush
+    """
+    if async_writer is not None:
+        async_writer.flush()
+    return True
+
+def get_pending_save(location):
+    """
+    Returns: Copy of a character still waiting for the background writer,
+             or None
+    """
+    if async_writer is None:
+        return None
+    character = async_writer.get_pending(location)
+    return None if character is None else copy_character(character)
+
+def queue_save(backend, location, snapshot, character):
+    """
+    Queue a copy of a character for the background writer
+
+    The snapshot is recorded before the save is queued: a write that
+    fails on the writer thread (even straight away) removes it again
+    through forget_failed_save, so the next save rewrites the character.
+
+    Raises: IOError if the writer has been closed
+    """
+    saved_snapshots[location] = snapshot
+    try:
+        async_writer.submit(backend, location, copy_character(character))
+    except IOError:
+        saved_snapshots.pop(location, None)
+        raise
+
+def forget_failed_save(location, error):
+    """Make the next save of a character whose background write failed rewrite it"""
+    saved_snapshots.pop(location, None)
+    load_cache.invalidate(location)
+
+def check_save_fields(character):
+    """
+    Check a character has every field a save needs before it is queued
+    
+    Raises: KeyError naming the first missing field
+    """
+    for field in SAVE_FIELDS:
+        if field not in character and field not in EQUIPMENT_FIELDS:
+            raise KeyError(field)
+
+# Exit handlers run last-registered first: stop the writer, then close backends
+atexit.register(close_storage_backends)
+atexit.register(disable_async_saves)
+
+# ============================================================================
+# LOAD CACHE
+# ============================================================================
+
+# Characters kept by the load cache
+LOAD_CACHE_SIZE = 256
+
+def copy_character(character):
+    """
+    Copy a character deeply enough that edits cannot reach the original
+    
+    Lists and equipped-item dictionaries are copied; other values are
+    immutable.
+    
+    Returns: New character dictionary
+    """
+    copy = {}
+    for key, value in character.items():
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        copy[key] = value
+    return copy
+
+class CharacterCache:
+    """
+    Bounded LRU cache of loaded characters
+    
+    Entries are keyed by save location and remember the save's signature
+    (file size and mtime for file saves). An entry is only used while the
+    signature still matches. Characters are copied going in and coming
+    out, so callers can edit what they get without touching the cache.
+    """
+
+    def __init__(self, max_size=LOAD_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()    # location -> (signature, character)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, location, signature):
+        """
+        Returns: Copy of the cached character, or None if it is missing
+                 or out of date (signature None means the save is gone)
+        """
+        entry = self.entries.get(location)
+        if entry is None or signature is None or entry[0] != signature:
+            if entry is not None:
+                del self.entries[location]
+            self.misses += 1
+            return None
+        self.entries.move_to_end(location)
+        self.hits += 1
+        return copy_character(entry[1])
+
+    def put(self, location, signature, character):
+        """Remember a copy of a freshly loaded character"""
+        if signature is None or self.max_size <= 0:
+            return
+        self.entries[location] = (signature, copy_character(character))
+        self.entries.move_to_end(location)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, location):
+        """Forget one character (after it is saved or deleted)"""
+        self.entries.pop(location, None)
+
+    def clear(self):
+        """Forget every character"""
+        self.entries.clear()
+
+    def get_stats(self):
+        """
+        Returns: Dictionary with 'hits', 'misses', 'evictions', 'size'
+                 and 'max_size'
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'max_size': self.max_size
+        }
+
+load_cache = CharacterCache()
+
+def get_load_cache_stats():
+    """
+    Returns: Hit/miss statistics of the load_character cache
+    """
+    return load_cache.get_stats()
+
+# ============================================================================
+# CHANGE TRACKING
+# ============================================================================
+
+def get_save_path(character_name, save_directory="data/save_games"):
+    """
+    Returns: Where a character is saved (the file path for file saves)
+    """
+    return get_storage_backend(save_directory).get_location(character_name)
+
+def get_character_snapshot(character):
+    """
+    Take a copy of the fields save_character writes
+    
+    Lists and equipped items are stored as tuples so later changes to
+    the character cannot change the snapshot.
+    
+    Returns: Dictionary of field -> value (None for missing fields)
+    """
+    snapshot = {}
+    for field in SAVE_FIELDS:
+        value = character.get(field)
+        if isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, dict):
+            value = tuple(value.items())
+        snapshot[field] = value
+    return snapshot
+
+def is_saved(backend, character_name, snapshot):
+    """
+    Check a character against its last save or load without any file I/O
+
+    Returns: True if the snapshot matches what was last saved or loaded
+    """
+    location = saved_locations.get((backend, character_name))
+    return location is not None and saved_snapshots.get(location) == snapshot
+
+def get_changed_fields(character, save_directory="data/save_games"):
+    """
+    Find the saved fields that changed since the last save or load
+    
+    Returns: List of field names in file order (every field if this
+             character has not been saved or loaded yet)
+    """
+    saved = saved_snapshots.get(get_save_path(character['name'], save_directory))
+    if saved is None:
+        return list(SAVE_FIELDS)
+    snapshot = get_character_snapshot(character)
+    return [field for field in SAVE_FIELDS if snapshot[field] != saved[field]]
 
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
 
-def gain_experience(character, xp_amount):
+# Each level costs LEVEL_XP_STEP * current_level experience
+LEVEL_XP_STEP = 100
+LEVEL_HEALTH_GAIN = 10
+LEVEL_STAT_GAIN = 2
+
+def get_total_xp_for_level(level):
+    """
+    Get the experience needed to go from level 1 to a level
+    
+    Returns: LEVEL_XP_STEP * (1 + 2 + ... + (level - 1))
+    """
+    return LEVEL_XP_STEP * level * (level - 1) // 2
+
+def get_levels_gained(level, experience):
+    """
+    Count the level ups a character's experience pays for
+    
+    Going from level L up k levels costs
+    LEVEL_XP_STEP * (k*L + k*(k-1)/2), so k is the largest whole number
+    with k*k + (2L-1)*k <= experience * 2 / LEVEL_XP_STEP, found with
+    one integer square root instead of one step per level.
+    
+    Args:
+        level: Current level (1 or more)
+        experience: Experience carried toward the next level
+    
+    Returns: Number of levels gained (0 if experience is below level * 100)
+    """
+    budget = experience * 2 // LEVEL_XP_STEP
+    if budget < 2 * level:
+        return 0
+    b = 2 * level - 1
+    return (math.isqrt(b * b + 4 * budget) - b) // 2
+
+def gain_experience(character, xp_amount, quiet=False):
     """
     Add experience to character and handle level ups
     
@@ -244,6 +815,16 @@ def gain_experience(character, xp_amount):
     - Increase magic by 2
     - Restore health to max_health
     
+    Any number of level ups is applied at once (see get_levels_gained).
+    
+    Args:
+        character: Character dictionary
+        xp_amount: Experience to add
+        quiet: True to return the summary without printing anything
+    
+    Returns: Dictionary with 'xp_gained', 'old_level', 'new_level',
+             'levels_gained', 'max_health_gained', 'strength_gained'
+             and 'magic_gained'
     Raises: CharacterDeadError if character health is 0
     """
     # TODO: Implement experience gain and leveling
@@ -254,23 +835,34 @@ def gain_experience(character, xp_amount):
     if is_character_dead(character):
         raise CharacterDeadError(f"{character['name']} is dead and cannot gain XP.")
         
+    old_level = character['level']
     character['experience'] += xp_amount
-    print(f"{character['name']} gained {xp_amount} XP!")
-    
-    level_up_xp = character['level'] * 100
-    
-    while character['experience'] >= level_up_xp:
-        character['experience'] -= level_up_xp
-        character['level'] += 1
-        character['max_health'] += 10
-        character['strength'] += 2
-        character['magic'] += 2
+    levels = get_levels_gained(old_level, character['experience'])
+    if levels:
+        new_level = old_level + levels
+        character['experience'] -= get_total_xp_for_level(new_level) - get_total_xp_for_level(old_level)
+        character['level'] = new_level
+        character['max_health'] += LEVEL_HEALTH_GAIN * levels
+        character['strength'] += LEVEL_STAT_GAIN * levels
+        character['magic'] += LEVEL_STAT_GAIN * levels
         character['health'] = character['max_health'] # Full heal
-        
-        print(f"*** LEVEL UP! *** {character['name']} is now Level {character['level']}!")
-        print(f"HP: {character['max_health']}, STR: {character['strength']}, MAG: {character['magic']}")
-        
-        level_up_xp = character['level'] * 100
+
+    summary = {
+        'xp_gained': xp_amount,
+        'old_level': old_level,
+        'new_level': character['level'],
+        'levels_gained': levels,
+        'max_health_gained': LEVEL_HEALTH_GAIN * levels,
+        'strength_gained': LEVEL_STAT_GAIN * levels,
+        'magic_gained': LEVEL_STAT_GAIN * levels
+    }
+    if not quiet:
+        print(f"{character['name']} gained {xp_amount} XP!")
+        if levels:
+            gained = f" (+{levels} levels)" if levels > 1 else ""
+            print(f"*** LEVEL UP! *** {character['name']} is now Level {character['level']}!{gained}")
+            print(f"HP: {character['max_health']}, STR: {character['strength']}, MAG: {character['magic']}")
+    return summary
 
 def add_gold(character, amount):
     """
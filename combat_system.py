@@ -15,7 +15,8 @@ from custom_exceptions import (
     InvalidTargetError,
     CombatNotActiveError,
     CharacterDeadError,
-    AbilityOnCooldownError
+    AbilityOnCooldownError,
+    InvalidCharacterClassError
 )
 
 # ============================================================================
@@ -318,18 +319,14 @@ def use_special_ability(character, enemy, battle):
     # Check character class
     # Execute appropriate ability
     # Track cooldowns (optional advanced feature)
-    char_class = character['class']
-    
-    if char_class == 'Warrior':
-        return warrior_power_strike(character, enemy, battle)
-    elif char_class == 'Mage':
-        return mage_fireball(character, enemy, battle)
-    elif char_class == 'Rogue':
-        return rogue_critical_strike(character, enemy, battle)
-    elif char_class == 'Cleric':
-        return cleric_heal(character, battle)
-    else:
+    try:
+        ability_name = character_manager.get_class_info(character['class']).ability
+    except InvalidCharacterClassError:
         return "You have no special ability."
+    ability = SPECIAL_ABILITIES.get(ability_name)
+    if ability is None:
+        return "You have no special ability."
+    return ability(character, enemy, battle)
 
 def warrior_power_strike(character, enemy, battle):
     """Warrior special ability"""
@@ -368,6 +365,14 @@ def cleric_heal(character, battle):
     healed_amount = character_manager.heal_character(character, 30)
     return f"You use Heal, restoring {healed_amount} HP."
 
+# ABILITY names used in data/classes.txt -> function(character, enemy, battle)
+SPECIAL_ABILITIES = {
+    'power_strike': warrior_power_strike,
+    'fireball': mage_fireball,
+    'critical_strike': rogue_critical_strike,
+    'heal': lambda character, enemy, battle: cleric_heal(character, battle)
+}
+
 # ============================================================================
 # COMBAT UTILITIES
 # ============================================================================
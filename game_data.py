@@ -9,18 +9,184 @@ AI Usage: [Document any AI assistance used]
 This module handles loading and validating game data from text files.
 """
 
+import glob
 import os
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
+import catalog_cache
+import lazy_catalog
+
+# Schema tags stored in the sidecar cache header. Bump these whenever the
+# parsed record layout changes so stale caches are rebuilt.
+QUEST_CACHE_SCHEMA = "quests:3"
+ITEM_CACHE_SCHEMA = "items:3"
+
+# Record layouts: (field_name, type) in the order records are built
+QUEST_FIELDS = [
+    ('quest_id', str),
+    ('title', str),
+    ('description', str),
+    ('reward_xp', int),
+    ('reward_gold', int),
+    ('required_level', int),
+    ('prerequisite', str)
+]
+ITEM_FIELDS = [
+    ('item_id', str),
+    ('name', str),
+    ('type', str),
+    ('effect', str),
+    ('cost', int),
+    ('description', str)
+]
+CLASS_FIELDS = [
+    ('class_name', str),
+    ('health', int),
+    ('strength', int),
+    ('magic', int),
+    ('ability', str)
+]
+
+# Text fields whose values repeat across many records. The parsers intern
+# them (sys.intern), so every record shares one string object per distinct
+# value - e.g. a single 'consumable' - and comparisons against the same
+# literal in game code succeed on the identity check. IDs are pooled too,
+# so a quest's prerequisite shares the string of the quest it names.
+QUEST_POOLED_FIELDS = ('quest_id', 'prerequisite')
+ITEM_POOLED_FIELDS = ('item_id', 'type', 'effect')
+CLASS_POOLED_FIELDS = ('class_name', 'ability')
+
+# Allowed values checked by validate_item_data and catalog_validator
+VALID_ITEM_TYPES = ('weapon', 'armor', 'consumable')
+VALID_EFFECT_STATS = ('health', 'max_health', 'strength', 'magic')
+
+# ============================================================================
+# RECORD TYPES
+# ============================================================================
+
+class Record(Mapping):
+    """
+    Compact base class for quest and item records
+    
+    Field values live in __slots__ instead of a per-record dict, which
+    makes large catalogs several times smaller in memory. Records still
+    read like the dictionaries game_data used to return:
+    record['field'], record.get('field'), 'field' in record, iteration
+    over field names, .items(), and == against a dict.
+    """
+    __slots__ = ()
+    fields = ()
+    field_set = frozenset()
+    pooled_fields = ()
+
+    def __getitem__(self, key):
+        if key in self.field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.field_set:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.field_set
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __reduce__(self):
+        # Pickle as (class, values) - smaller and faster than slot state
+        return (rebuild_record, (type(self), tuple(getattr(self, name) for name in self.fields)))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values})"
+
+def rebuild_record(record_type, values):
+    """
+    Rebuild a pickled record (catalog caches, worker processes)
+
+    Unpickled strings are new objects, so the pooled fields are interned
+    again to share strings with freshly parsed records.
+
+    Returns: Record of record_type
+    """
+    record = record_type(*values)
+    for name in record_type.pooled_fields:
+        value = getattr(record, name)
+        if isinstance(value, str):
+            setattr(record, name, sys.intern(value))
+    return record
+
+class Quest(Record):
+    """One quest from data/quests.txt"""
+    __slots__ = ('quest_id', 'title', 'description', 'reward_xp',
+                 'reward_gold', 'required_level', 'prerequisite')
+    fields = __slots__
+    field_set = frozenset(__slots__)
+    pooled_fields = QUEST_POOLED_FIELDS
+
+    def __init__(self, quest_id, title, description, reward_xp,
+                 reward_gold, required_level, prerequisite):
+        self.quest_id = quest_id
+        self.title = title
+        self.description = description
+        self.reward_xp = reward_xp
+        self.reward_gold = reward_gold
+        self.required_level = required_level
+        self.prerequisite = prerequisite
+
+class CharacterClass(Record):
+    """One character class from data/classes.txt"""
+    __slots__ = ('class_name', 'health', 'strength', 'magic', 'ability')
+    fields = __slots__
+    field_set = frozenset(__slots__)
+    pooled_fields = CLASS_POOLED_FIELDS
+
+    def __init__(self, class_name, health, strength, magic, ability):
+        self.class_name = class_name
+        self.health = health
+        self.strength = strength
+        self.magic = magic
+        self.ability = ability
+
+class Item(Record):
+    """
+    One item from data/items.txt
+    
+    compiled_effect is not a field: it holds the item_effects.ItemEffect
+    an item catalog compiled from EFFECT (None until then), and is not
+    pickled into catalog caches.
+    """
+    __slots__ = ('item_id', 'name', 'type', 'effect', 'cost', 'description', 'compiled_effect')
+    fields = __slots__[:-1]
+    field_set = frozenset(fields)
+    pooled_fields = ITEM_POOLED_FIELDS
+
+    def __init__(self, item_id, name, type, effect, cost, description):
+        self.item_id = item_id
+        self.name = name
+        self.type = type
+        self.effect = effect
+        self.cost = cost
+        self.description = description
+        self.compiled_effect = None
 
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=False, workers=None):
     """
     Load quest data from file
     
@@ -33,42 +199,31 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
-    Returns: Dictionary of quests {quest_id: quest_data_dict}
+    Args:
+        filename: Path to the quest file, or a directory / glob pattern
+                  (e.g. "data/quests/*.txt") naming several quest shards
+        use_cache: If True, load through the binary sidecar cache
+                   (see catalog_cache) and rebuild it when the file changes
+        workers: Number of processes used to parse shards (default: one
+                 per CPU core). Ignored for a single file.
+    
+    Returns: Dictionary of quests {quest_id: Quest}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    # TODO: Implement this function
-    # Must handle:
-    # - FileNotFoundError → raise MissingDataFileError
-    # - Invalid format → raise InvalidDataFormatError
-    # - Corrupted/unreadable data → raise CorruptedDataError
+    if is_shard_path(filename):
+        return load_catalog_shards(filename, load_quest_shard, use_cache, workers)
 
     if not os.path.exists(filename):
         raise MissingDataFileError(f"Quest file not found: {filename}")
-    
-    quests = {}
-    current_block = []
-    
-    try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    if current_block:
-                        quest = parse_quest_block(current_block)
-                        quests[quest['quest_id']] = quest
-                        current_block = []
-                else:
-                    current_block.append(line)
-            # Catch the last block if file doesn't end with newline
-            if current_block:
-                quest = parse_quest_block(current_block)
-                quests[quest['quest_id']] = quest
-                
-        return quests
-    except IOError as e:
-        raise CorruptedDataError(f"Could not read quest file: {e}")
 
-def load_items(filename="data/items.txt"):
+    if use_cache:
+        try:
+            return catalog_cache.load_with_cache(filename, QUEST_CACHE_SCHEMA, parse_quest_file)
+        except IOError as e:
+            raise CorruptedDataError(f"Could not read quest file: {e}")
+    return parse_quest_file(filename)
+
+def load_items(filename="data/items.txt", use_cache=False, lazy=False, workers=None):
     """
     Load item data from file
     
@@ -76,39 +231,101 @@ def load_items(filename="data/items.txt"):
     ITEM_ID: unique_item_name
     NAME: Item Display Name
     TYPE: weapon|armor|consumable
-    EFFECT: stat_name:value (e.g., strength:5 or health:20)
+    EFFECT: stat_name:value[,stat_name:value...]
+            (e.g., strength:5 or strength:5,magic:3,max_health:10)
     COST: 100
     DESCRIPTION: Item description
     
-    Returns: Dictionary of items {item_id: item_data_dict}
+    Args:
+        filename: Path to the item file, or a directory / glob pattern
+                  (e.g. "data/items/*.txt") naming several item shards
+        use_cache: If True, load through the binary sidecar cache
+                   (see catalog_cache) and rebuild it when the file changes
+        lazy: If True, return a LazyCatalog that memory-maps the file and
+              only parses an item the first time it is looked up
+              (use_cache is ignored in this mode, and it needs a
+              single item file)
+        workers: Number of processes used to parse shards (default: one
+                 per CPU core). Ignored for a single file.
+    
+    Returns: Dictionary of items {item_id: Item}
+             (or a read-only LazyCatalog with the same interface)
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    # TODO: Implement this function
-    # Must handle same exceptions as load_quests
+    if is_shard_path(filename):
+        if lazy:
+            raise ValueError("Lazy item catalogs need a single item file, not shards")
+        return load_catalog_shards(filename, load_item_shard, use_cache, workers)
+
     if not os.path.exists(filename):
         raise MissingDataFileError(f"Item file not found: {filename}")
-        
-    items = {}
-    current_block = []
+
+    if lazy:
+        return lazy_catalog.LazyCatalog(filename, "ITEM_ID", parse_item_block)
+
+    if use_cache:
+        try:
+            return catalog_cache.load_with_cache(filename, ITEM_CACHE_SCHEMA, parse_item_file)
+        except IOError as e:
+            raise CorruptedDataError(f"Could not read item file: {e}")
+    return parse_item_file(filename)
+
+def load_classes(filename="data/classes.txt"):
+    """
+    Load character class definitions from file
     
-    try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    if current_block:
-                        item = parse_item_block(current_block)
-                        items[item['item_id']] = item
-                        current_block = []
-                else:
-                    current_block.append(line)
-            if current_block:
-                item = parse_item_block(current_block)
-                items[item['item_id']] = item
-                
-        return items
-    except IOError as e:
-        raise CorruptedDataError(f"Could not read item file: {e}")
+    Expected format per class (separated by blank lines):
+    CLASS_NAME: Warrior
+    HEALTH: 120
+    STRENGTH: 15
+    MAGIC: 5
+    ABILITY: power_strike (see combat_system.SPECIAL_ABILITIES)
+    
+    Returns: Dictionary of classes {class key: CharacterClass}, keyed by
+             get_class_key(class_name) so lookups ignore case
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Class file not found: {filename}")
+    classes = {}
+    for character_class in iter_parsed_blocks(filename, parse_class_block):
+        problems = find_record_problems(character_class, CLASS_FIELDS, CLASS_RULES)
+        if problems:
+            name, message = problems[0]
+            raise InvalidDataFormatError(f"Class {character_class['class_name']!r}: {name} {message}")
+        classes[get_class_key(character_class['class_name'])] = character_class
+    return classes
+
+def get_class_key(class_name):
+    """
+    Returns: Lookup key for a class name ("WARRIOR", "warrior" -> "warrior")
+    """
+    return class_name.lower()
+
+def iter_quests(filename="data/quests.txt"):
+    """
+    Stream quests from a quest file one at a time
+    
+    Uses the same block format as load_quests, but never builds the full
+    catalog, so large generated files can be scanned in constant memory.
+    
+    Yields: Quest records in file order
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Quest file not found: {filename}")
+    yield from iter_parsed_blocks(filename, parse_quest_block)
+
+def iter_items(filename="data/items.txt"):
+    """
+    Stream items from an item file one at a time
+    
+    Yields: Item records in file order
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Item file not found: {filename}")
+    yield from iter_parsed_blocks(filename, parse_item_block)
 
 def validate_quest_data(quest_dict):
     """
@@ -120,10 +337,11 @@ def validate_quest_data(quest_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields
     """
-    # TODO: Implement validation
-    # Check that all required keys exist
-    # Check that numeric values are actually numbers
-    pass
+    problems = find_record_problems(quest_dict, QUEST_FIELDS, QUEST_RULES)
+    if problems:
+        field, message = problems[0]
+        raise InvalidDataFormatError(f"Invalid quest field '{field}': {message}")
+    return True
 
 def validate_item_data(item_dict):
     """
@@ -135,8 +353,104 @@ def validate_item_data(item_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
-    # TODO: Implement validation
-    pass
+    problems = find_record_problems(item_dict, ITEM_FIELDS, ITEM_RULES)
+    if problems:
+        field, message = problems[0]
+        raise InvalidDataFormatError(f"Invalid item field '{field}': {message}")
+    return True
+
+def find_record_problems(record, fields, rules):
+    """
+    Check a quest or item against its field schema and value rules
+    
+    Unlike validate_quest_data/validate_item_data this does not stop at
+    the first problem, so batch tools can report everything at once.
+    
+    Args:
+        record: Quest/item record or dictionary
+        fields: QUEST_FIELDS or ITEM_FIELDS
+        rules: QUEST_RULES or ITEM_RULES
+    
+    Returns: List of (field_name, message) tuples (empty if valid)
+    """
+    problems = []
+    for name, converter in fields:
+        if name not in record:
+            problems.append((name, "missing required field"))
+            continue
+        value = record[name]
+        if converter is int and (not isinstance(value, int) or isinstance(value, bool)):
+            problems.append((name, f"expected a whole number, found {value!r}"))
+            continue
+        if converter is str and (not isinstance(value, str) or not value.strip()):
+            problems.append((name, f"expected text, found {value!r}"))
+            continue
+        if name in rules:
+            message = rules[name](value)
+            if message:
+                problems.append((name, message))
+    return problems
+
+def check_minimum(minimum):
+    """
+    Build a rule that rejects numbers below minimum
+    
+    Returns: Function(value) -> error message or None
+    """
+    def check(value):
+        if value < minimum:
+            return f"must be at least {minimum}, found {value}"
+        return None
+    return check
+
+def check_item_type(value):
+    """
+    Returns: Error message if value is not a valid item TYPE, else None
+    """
+    if value not in VALID_ITEM_TYPES:
+        return f"must be one of {', '.join(VALID_ITEM_TYPES)}, found {value!r}"
+    return None
+
+def parse_effect(value):
+    """
+    Split an EFFECT string into its stat changes
+    
+    EFFECT is one or more comma-separated "stat_name:value" pairs.
+    
+    Returns: List of (stat_name, value) tuples in the order written
+    Example: "strength:5,magic:3" → [("strength", 5), ("magic", 3)]
+    Raises: ValueError describing the first malformed pair
+    """
+    changes = []
+    for pair in value.split(","):
+        stat_name, separator, amount = pair.strip().partition(":")
+        if not separator:
+            raise ValueError(f"expected 'stat:value', found {pair!r}")
+        try:
+            changes.append((stat_name, int(amount)))
+        except ValueError:
+            raise ValueError(f"effect value must be a whole number, found {amount!r}") from None
+    return changes
+
+def check_effect(value):
+    """
+    Check EFFECT syntax: comma-separated "stat_name:value" pairs, each
+    with a known stat (at most once) and an integer
+    
+    Returns: Error message if the effect is malformed, else None
+    """
+    try:
+        changes = parse_effect(value)
+    except ValueError as e:
+        return str(e)
+    seen = set()
+    for stat_name, amount in changes:
+        if stat_name not in VALID_EFFECT_STATS:
+            return f"unknown stat {stat_name!r} (valid: {', '.join(VALID_EFFECT_STATS)})"
+        if stat_name in seen:
+            return f"stat {stat_name!r} appears more than once"
+        seen.add(stat_name)
+    return None
 
 def create_default_data_files():
     """
@@ -159,18 +473,313 @@ def create_default_data_files():
         f.write("ITEM_ID: potion_health\nNAME: Health Potion\nTYPE: consumable\nEFFECT: health:50\nCOST: 20\nDESCRIPTION: Restores 50 HP\n\n")
         f.write("ITEM_ID: sword_iron\nNAME: Iron Sword\nTYPE: weapon\nEFFECT: strength:5\nCOST: 100\nDESCRIPTION: A standard iron sword\n\n")
 
+    # Create default Classes
+    with open("data/classes.txt", "w") as f:
+        for character_class in DEFAULT_CLASSES.values():
+            f.write(format_class_block(character_class))
+
+def format_class_block(character_class):
+    """
+    Returns: One class in data file format, followed by a blank line
+    """
+    return "".join(f"{name.upper()}: {character_class[name]}\n" for name, converter in CLASS_FIELDS) + "\n"
+
+# Classes used when data/classes.txt does not exist
+DEFAULT_CLASSES = {
+    get_class_key(character_class.class_name): character_class
+    for character_class in (
+        CharacterClass("Warrior", 120, 15, 5, "power_strike"),
+        CharacterClass("Mage", 80, 8, 20, "fireball"),
+        CharacterClass("Rogue", 90, 12, 10, "critical_strike"),
+        CharacterClass("Cleric", 100, 10, 15, "heal")
+    )
+}
+
+# Per-field value rules: field_name -> function(value) returning an
+# error message or None
+QUEST_RULES = {
+    'reward_xp': check_minimum(0),
+    'reward_gold': check_minimum(0),
+    'required_level': check_minimum(1)
+}
+ITEM_RULES = {
+    'type': check_item_type,
+    'effect': check_effect,
+    'cost': check_minimum(0)
+}
+CLASS_RULES = {
+    'health': check_minimum(1),
+    'strength': check_minimum(0),
+    'magic': check_minimum(0)
+}
+
+# ============================================================================
+# SHARDED CATALOGS
+# ============================================================================
+
+def is_shard_path(path):
+    """
+    Check whether a data path names several shard files
+    
+    Returns: True for a directory or a glob pattern, False for a single file
+    """
+    return os.path.isdir(path) or any(char in path for char in "*?[")
+
+def find_shard_files(path):
+    """
+    List the shard files named by a directory or glob pattern
+    
+    A directory means every *.txt file directly inside it. Shards are
+    returned sorted by path so the merge order never depends on the
+    order the filesystem happens to list them in.
+    
+    Returns: Sorted list of file paths
+    Raises: MissingDataFileError if no shard files match
+    """
+    pattern = os.path.join(path, "*.txt") if os.path.isdir(path) else path
+    shard_files = sorted(name for name in glob.glob(pattern) if os.path.isfile(name))
+    if not shard_files:
+        raise MissingDataFileError(f"No data files found for: {path}")
+    return shard_files
+
+def load_quest_shard(filename, use_cache=False):
+    """Load one quest shard (top-level so worker processes can pickle it)"""
+    return load_quests(filename, use_cache)
+
+def load_item_shard(filename, use_cache=False):
+    """Load one item shard (top-level so worker processes can pickle it)"""
+    return load_items(filename, use_cache)
+
+def load_catalog_shards(path, load_shard, use_cache=False, workers=None):
+    """
+    Load and merge every shard named by a directory or glob pattern
+    
+    Shards are parsed in parallel in a process pool and merged in sorted
+    shard order, so the resulting dictionary is the same on every run.
+    
+    Args:
+        path: Directory or glob pattern naming the shard files
+        load_shard: load_quest_shard or load_item_shard
+        use_cache: Passed through to each shard load
+        workers: Number of worker processes (default: one per CPU core)
+    
+    Returns: Merged catalog dictionary {record_id: record}
+    Raises:
+        MissingDataFileError if no shards match
+        InvalidDataFormatError if a shard is invalid, or if the same ID
+        appears in more than one shard (every duplicate is listed)
+        CorruptedDataError if a shard cannot be read
+    """
+    shard_files = find_shard_files(path)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(shard_files)))
+
+    if workers == 1:
+        shard_catalogs = [load_shard(name, use_cache) for name in shard_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_catalogs = list(executor.map(
+                load_shard, shard_files, [use_cache] * len(shard_files)
+            ))
+
+    catalog = {}
+    sources = {}
+    duplicates = []
+    for shard_name, shard_catalog in zip(shard_files, shard_catalogs):
+        for record_id, record in shard_catalog.items():
+            if record_id in catalog:
+                duplicates.append(f"'{record_id}' in {sources[record_id]} and {shard_name}")
+                continue
+            catalog[record_id] = record
+            sources[record_id] = shard_name
+
+    if duplicates:
+        raise InvalidDataFormatError(
+            f"Duplicate IDs across shards: {'; '.join(duplicates)}"
+        )
+    return catalog
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def parse_quest_file(filename):
+    """
+    Parse every quest block in a quest file
+    
+    Returns: Dictionary of quests {quest_id: Quest}
+    Raises: InvalidDataFormatError, CorruptedDataError
+    """
+    return {quest['quest_id']: quest for quest in iter_quests(filename)}
+
+def parse_item_file(filename):
+    """
+    Parse every item block in an item file
+    
+    Returns: Dictionary of items {item_id: Item}
+    Raises: InvalidDataFormatError, CorruptedDataError
+    """
+    return {item['item_id']: item for item in iter_items(filename)}
+
+def iter_data_blocks(filename):
+    """
+    Read a data file one blank-line separated block at a time
+    
+    Only the current block is held in memory, so this works on data
+    files of any size.
+    
+    Yields: Tuples of (first_line_number, list_of_stripped_lines)
+    Raises: MissingDataFileError, CorruptedDataError
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Data file not found: {filename}")
+
+    current_block = []
+    start_line = 0
+    try:
+        with open(filename, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    if current_block:
+                        yield start_line, current_block
+                        current_block = []
+                else:
+                    if not current_block:
+                        start_line = line_number
+                    current_block.append(line)
+            # Catch the last block if file doesn't end with newline
+            if current_block:
+                yield start_line, current_block
+    except (IOError, UnicodeDecodeError) as e:
+        raise CorruptedDataError(f"Could not read data file {filename}: {e}")
+
+def iter_parsed_blocks(filename, parse_block):
+    """
+    Parse a data file block by block with the given block parser
+    
+    Parsing errors are re-raised with the file name and the line on
+    which the offending block starts.
+    
+    Yields: Parsed records, one per block
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    for start_line, lines in iter_data_blocks(filename):
+        yield parse_block_at(filename, start_line, lines, parse_block)
+
+def parse_block_at(filename, start_line, lines, parse_block):
+    """
+    Parse one block, adding its file name and starting line to any error
+    
+    Returns: Parsed record
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    try:
+        return parse_block(lines)
+    except InvalidDataFormatError as e:
+        raise InvalidDataFormatError(f"{filename}, line {start_line}: {e}") from e
+
+def compile_block_parser(fields, strict_parser, record_type, pooled_fields=()):
+    """
+    Build a single-pass parser for one record type
+    
+    Data files written by our tools list every field once, in the order
+    of the field schema ("QUEST_ID: ...", "TITLE: ...", ...). For that
+    layout the parser checks each line's key prefix, slices the value off
+    and converts it straight into the record - no intermediate dict and
+    no split()/lower() per line. The prefixes and converters are worked
+    out once here rather than for every block.
+    
+    Any other layout (reordered or lower-case keys, extra or missing
+    lines, a bad number) is handed to strict_parser, so results and
+    InvalidDataFormatError messages are exactly those of the reference
+    parser.
+    
+    Args:
+        fields: List of (field_name, converter) in record order
+        strict_parser: Reference parser for the same record type
+        record_type: Record class built from the values in field order
+        pooled_fields: Text fields whose values are interned (see
+                       QUEST_POOLED_FIELDS / ITEM_POOLED_FIELDS)
+    
+    Returns: Function that takes a list of lines and returns a record
+    """
+    # (key prefix, prefix length, converter or None to keep the text)
+    line_formats = []
+    for name, converter in fields:
+        prefix = name.upper() + ": "
+        if converter is str:
+            converter = sys.intern if name in pooled_fields else None
+        line_formats.append((prefix, len(prefix), converter))
+    field_count = len(line_formats)
+
+    def parse_block(lines):
+        if len(lines) != field_count:
+            return strict_parser(lines)
+        values = []
+        for line, (prefix, length, converter) in zip(lines, line_formats):
+            if not line.startswith(prefix):
+                return strict_parser(lines)
+            value = line[length:]
+            if converter:
+                try:
+                    value = converter(value)
+                except ValueError:
+                    return strict_parser(lines)
+            values.append(value)
+        return record_type(*values)
+
+    return parse_block
+
 def parse_quest_block(lines):
     """
-    Parse a block of lines into a quest dictionary
+    Parse a block of lines into a Quest record
     
     Args:
         lines: List of strings representing one quest
     
-    Returns: Dictionary with quest data
+    Returns: Quest record with quest data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    return QUEST_BLOCK_PARSER(lines)
+
+def parse_item_block(lines):
+    """
+    Parse a block of lines into an Item record
+    
+    Args:
+        lines: List of strings representing one item
+    
+    Returns: Item record with item data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    return ITEM_BLOCK_PARSER(lines)
+
+def parse_class_block(lines):
+    """
+    Parse a block of lines into a CharacterClass record
+    
+    Args:
+        lines: List of strings representing one class
+    
+    Returns: CharacterClass record
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    return CLASS_BLOCK_PARSER(lines)
+
+def parse_quest_block_strict(lines):
+    """
+    Parse a block of lines into a Quest record (two-step reference parser)
+    
+    Collects every key into a dict first and then builds the quest. It is
+    slower than parse_quest_block but defines the exact error messages,
+    so the fast parser falls back to it whenever a block is malformed.
+    
+    Args:
+        lines: List of strings representing one quest
+    
+    Returns: Quest record with quest data
     Raises: InvalidDataFormatError if parsing fails
     """
     # TODO: Implement parsing logic
@@ -184,27 +793,29 @@ def parse_quest_block(lines):
             data[key.lower()] = value
         
         # Validation and Type Conversion
-        quest = {
-            'quest_id': data['quest_id'],
-            'title': data['title'],
-            'description': data['description'],
-            'reward_xp': int(data['reward_xp']),
-            'reward_gold': int(data['reward_gold']),
-            'required_level': int(data['required_level']),
-            'prerequisite': data['prerequisite']
-        }
+        quest = Quest(
+            sys.intern(data['quest_id']),
+            data['title'],
+            data['description'],
+            int(data['reward_xp']),
+            int(data['reward_gold']),
+            int(data['required_level']),
+            sys.intern(data['prerequisite'])
+        )
         return quest
     except (ValueError, KeyError) as e:
         raise InvalidDataFormatError(f"Error parsing quest block: {e}")
 
-def parse_item_block(lines):
+def parse_item_block_strict(lines):
     """
-    Parse a block of lines into an item dictionary
+    Parse a block of lines into an Item record (two-step reference parser)
+    
+    See parse_quest_block_strict.
     
     Args:
         lines: List of strings representing one item
     
-    Returns: Dictionary with item data
+    Returns: Item record with item data
     Raises: InvalidDataFormatError if parsing fails
     """
     # TODO: Implement parsing logic
@@ -214,18 +825,57 @@ def parse_item_block(lines):
             key, value = line.split(": ", 1)
             data[key.lower()] = value
             
-        item = {
-            'item_id': data['item_id'],
-            'name': data['name'],
-            'type': data['type'],
-            'effect': data['effect'],
-            'cost': int(data['cost']),
-            'description': data['description']
-        }
+        item = Item(
+            sys.intern(data['item_id']),
+            data['name'],
+            sys.intern(data['type']),
+            sys.intern(data['effect']),
+            int(data['cost']),
+            data['description']
+        )
         return item
     except (ValueError, KeyError) as e:
         raise InvalidDataFormatError(f"Error parsing item block: {e}")
 
+def parse_class_block_strict(lines):
+    """
+    Parse a block of lines into a CharacterClass record (reference parser)
+    
+    See parse_quest_block_strict.
+    
+    Args:
+        lines: List of strings representing one class
+    
+    Returns: CharacterClass record
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    data = {}
+    try:
+        for line in lines:
+            key, value = line.split(": ", 1)
+            data[key.lower()] = value
+
+        return CharacterClass(
+            sys.intern(data['class_name']),
+            int(data['health']),
+            int(data['strength']),
+            int(data['magic']),
+            sys.intern(data['ability'])
+        )
+    except (ValueError, KeyError) as e:
+        raise InvalidDataFormatError(f"Error parsing class block: {e}")
+
+# Single-pass parsers built from the field schemas above
+QUEST_BLOCK_PARSER = compile_block_parser(
+    QUEST_FIELDS, parse_quest_block_strict, Quest, QUEST_POOLED_FIELDS
+)
+ITEM_BLOCK_PARSER = compile_block_parser(
+    ITEM_FIELDS, parse_item_block_strict, Item, ITEM_POOLED_FIELDS
+)
+CLASS_BLOCK_PARSER = compile_block_parser(
+    CLASS_FIELDS, parse_class_block_strict, CharacterClass, CLASS_POOLED_FIELDS
+)
+
 # ============================================================================
 # TESTING
 # ============================================================================
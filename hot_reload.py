@@ -0,0 +1,246 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Hot Reload Module
+
+This module watches data/quests.txt and data/items.txt while the game is
+running. When a file changes, only the blocks whose text changed are
+re-parsed, the new catalog is swapped in as a whole, and a diff of
+added, removed and changed IDs is reported.
+"""
+
+import os
+import threading
+import game_data
+import quest_handler
+from custom_exceptions import DataError
+
+# ============================================================================
+# SINGLE FILE WATCHER
+# ============================================================================
+
+class CatalogWatcher:
+    """
+    Keeps one data file's catalog up to date with block-level re-parsing
+
+    Parsed records are remembered by the exact text of their block, so a
+    reload only calls the block parser for blocks that are new or edited.
+    Unchanged records keep their identity between reloads.
+    """
+
+    def __init__(self, filename, parse_block, id_field):
+        """
+        Load the file for the first time
+
+        Args:
+            filename: Path to the data file
+            parse_block: game_data.parse_quest_block or parse_item_block
+            id_field: Record key holding the ID ('quest_id' or 'item_id')
+
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+        """
+        self.filename = filename
+        self.parse_block = parse_block
+        self.id_field = id_field
+        self.catalog = {}
+        self.block_texts = {}      # record_id -> block text
+        self.signature = None
+        self.blocks_parsed = 0     # blocks parsed by the most recent reload
+        self.reload()
+
+    def get_signature(self):
+        """
+        Returns: Tuple of (size, mtime_ns) for the file, or None if missing
+        """
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def has_changed(self):
+        """
+        Returns: True if the file's size or mtime differs from the last load
+        """
+        return self.get_signature() != self.signature
+
+    def reload(self):
+        """
+        Re-read the file and swap in a new catalog
+
+        The new catalog is built completely before it replaces the old
+        one, so readers always see either the old or the new catalog.
+        If any block fails to parse, the old catalog is kept.
+
+        Returns: Dictionary with lists of 'added', 'removed' and 'changed' IDs
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+        """
+        signature = self.get_signature()
+        known_records = {
+            self.block_texts[record_id]: record
+            for record_id, record in self.catalog.items()
+        }
+
+        catalog = {}
+        block_texts = {}
+        blocks_parsed = 0
+        for start_line, lines in game_data.iter_data_blocks(self.filename):
+            text = "\n".join(lines)
+            record = known_records.get(text)
+            if record is None:
+                record = game_data.parse_block_at(self.filename, start_line, lines, self.parse_block)
+                blocks_parsed += 1
+            record_id = record[self.id_field]
+            catalog[record_id] = record
+            block_texts[record_id] = text
+
+        changes = {
+            'added': [rid for rid in catalog if rid not in self.catalog],
+            'removed': [rid for rid in self.catalog if rid not in catalog],
+            'changed': [
+                rid for rid in catalog
+                if rid in self.block_texts and self.block_texts[rid] != block_texts[rid]
+            ]
+        }
+
+        self.catalog = catalog
+        self.block_texts = block_texts
+        self.signature = signature
+        self.blocks_parsed = blocks_parsed
+        return changes
+
+    def poll(self):
+        """
+        Reload the file if it changed since the last load
+
+        Returns: Changes dictionary from reload(), or None if unchanged
+        """
+        if not self.has_changed():
+            return None
+        return self.reload()
+
+# ============================================================================
+# GAME DATA WATCHER
+# ============================================================================
+
+class GameDataWatcher:
+    """
+    Watches the quest and item files and swaps reloaded catalogs into the game
+
+    After a quest reload, prerequisites are re-validated only for the
+    quests that were added or changed, plus the quests whose prerequisite
+    was removed.
+    """
+
+    def __init__(self, quest_file="data/quests.txt", item_file="data/items.txt", on_reload=None):
+        """
+        Load both files and remember which quests depend on which
+
+        Args:
+            quest_file: Path to the quest file
+            item_file: Path to the item file
+            on_reload: Optional function(all_quests, all_items, changes)
+                       called after any file is reloaded
+        """
+        self.quests = CatalogWatcher(quest_file, game_data.parse_quest_block, 'quest_id')
+        self.items = CatalogWatcher(item_file, game_data.parse_item_block, 'item_id')
+        self.on_reload = on_reload
+        self.dependents = {}       # prerequisite quest_id -> set of quest_ids
+        for quest_id, quest in self.quests.catalog.items():
+            self.dependents.setdefault(quest['prerequisite'], set()).add(quest_id)
+
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def affected_quests(self, old_quests, changes):
+        """
+        Update the dependents index and find quests that need re-validation
+
+        Returns: Set of quest IDs whose prerequisite link may have changed
+        """
+        new_quests = self.quests.catalog
+        for quest_id in changes['removed'] + changes['changed']:
+            self.dependents[old_quests[quest_id]['prerequisite']].discard(quest_id)
+        for quest_id in changes['added'] + changes['changed']:
+            self.dependents.setdefault(new_quests[quest_id]['prerequisite'], set()).add(quest_id)
+
+        affected = set(changes['added']) | set(changes['changed'])
+        for quest_id in changes['removed']:
+            affected |= self.dependents.get(quest_id, set())
+        return affected
+
+    def poll(self):
+        """
+        Check both files once and apply any changes
+
+        Returns: Dictionary {'quests': changes or None, 'items': changes or None}
+        Raises: DataError if a changed file cannot be parsed (the old
+                catalog stays in place), after the other file has been
+                polled and its changes applied
+        """
+        old_quests = self.quests.catalog
+        quest_changes = None
+        item_changes = None
+        error = None
+        # Each file is polled on its own, so a broken quest file does not
+        # hold back an item change (or the other way round)
+        try:
+            quest_changes = self.quests.poll()
+            if quest_changes:
+                affected = self.affected_quests(old_quests, quest_changes)
+                quest_handler.validate_quest_prerequisites(self.quests.catalog, affected)
+        except DataError as e:
+            error = e
+        try:
+            item_changes = self.items.poll()
+        except DataError as e:
+            error = error or e
+
+        # Publish whatever did reload, even if the other file is broken
+        if self.on_reload and (quest_changes or item_changes):
+            self.on_reload(self.quests.catalog, self.items.catalog,
+                           {'quests': quest_changes, 'items': item_changes})
+        if error is not None:
+            raise error
+        return {'quests': quest_changes, 'items': item_changes}
+
+    def start(self, interval=2.0):
+        """
+        Poll both files every interval seconds on a background thread
+        """
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval,), daemon=True)
+        self.thread.start()
+
+    def run(self, interval):
+        """Background polling loop used by start()"""
+        while not self.stop_event.wait(interval):
+            try:
+                self.poll()
+            except DataError as e:
+                # Keep serving the last good data until the file is fixed
+                print(f"WARNING: Data reload failed, keeping previous data: {e}")
+
+    def stop(self):
+        """Stop the background polling thread"""
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+def format_changes(changes):
+    """
+    Build a one-line summary of a reload for logging
+
+    Returns: String such as "quests: +1 -0 ~2 | items: unchanged"
+    """
+    parts = []
+    for label in ('quests', 'items'):
+        diff = changes.get(label)
+        if diff:
+            parts.append(f"{label}: +{len(diff['added'])} -{len(diff['removed'])} ~{len(diff['changed'])}")
+        else:
+            parts.append(f"{label}: unchanged")
+    return " | ".join(parts)
@@ -9,7 +9,8 @@ AI Usage: [Document any AI assistance used]
 This module handles inventory management, item usage, and equipment.
 """
 
-import character_manager
+from collections import Counter
+import item_effects
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
@@ -20,6 +21,122 @@ from custom_exceptions import (
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
 
+# ============================================================================
+# INVENTORY LIST
+# ============================================================================
+
+class Inventory(list):
+    """
+    List of item IDs that also keeps a count of each item
+    
+    It is still a list in the order items were added, so it saves
+    (comma-separated or binary), compares and copies like a plain list,
+    but membership tests and counts are dictionary lookups. counts lists
+    the distinct items in the order they were first added.
+    """
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.counts = Counter(self)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def __contains__(self, item):
+        return item in self.counts
+
+    def count(self, item):
+        return self.counts[item]
+
+    def copy(self):
+        return Inventory(self)
+
+    def discount(self, item):
+        """Lower an item's count by one, dropping it at zero"""
+        remaining = self.counts[item] - 1
+        if remaining:
+            self.counts[item] = remaining
+        else:
+            del self.counts[item]
+
+    # ------------------------------------------------------------------
+    # List changes, mirrored in counts
+    # ------------------------------------------------------------------
+
+    def append(self, item):
+        list.append(self, item)
+        counts = self.counts
+        counts[item] = counts.get(item, 0) + 1
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self.counts.update(items)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self.counts = Counter(self)
+        return self
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.counts[item] += 1
+
+    def remove(self, item):
+        counts = self.counts
+        remaining = counts.get(item, 0) - 1
+        if remaining < 0:
+            raise ValueError(f"{item!r} is not in the inventory")
+        list.remove(self, item)
+        if remaining:
+            counts[item] = remaining
+        else:
+            del counts[item]
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self.discount(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self.counts.clear()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed = self[index]
+        else:
+            removed = [self[index]]
+        super().__setitem__(index, value)
+        for item in removed:
+            self.discount(item)
+        self.counts.update(value if isinstance(index, slice) else [value])
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for item in removed:
+            self.discount(item)
+
+def get_inventory(character):
+    """
+    Get a character's inventory as an Inventory
+    
+    A plain list (a new or loaded character) is replaced by an Inventory
+    holding the same items the first time.
+    
+    Returns: Inventory
+    """
+    inventory = character['inventory']
+    if not isinstance(inventory, Inventory):
+        inventory = character['inventory'] = Inventory(inventory)
+    return inventory
+
 # ============================================================================
 # INVENTORY MANAGEMENT
 # ============================================================================
@@ -38,13 +155,14 @@ def add_item_to_inventory(character, item_id):
     # TODO: Implement adding items
     # Check if inventory is full (>= MAX_INVENTORY_SIZE)
     # Add item_id to character['inventory'] list
-    if len(character['inventory']) >= MAX_INVENTORY_SIZE:
+    inventory = get_inventory(character)
+    if len(inventory) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError(
             f"Cannot add {item_id}: Inventory is full "
-            f"({len(character['inventory'])}/{MAX_INVENTORY_SIZE})."
+            f"({len(inventory)}/{MAX_INVENTORY_SIZE})."
         )
     
-    character['inventory'].append(item_id)
+    inventory.append(item_id)
     return True
 
 def remove_item_from_inventory(character, item_id):
@@ -61,10 +179,11 @@ def remove_item_from_inventory(character, item_id):
     # TODO: Implement item removal
     # Check if item exists in inventory
     # Remove item from list
-    if item_id not in character['inventory']:
+    inventory = get_inventory(character)
+    if item_id not in inventory:
         raise ItemNotFoundError(f"Cannot remove: {item_id} not found in inventory.")
         
-    character['inventory'].remove(item_id)
+    inventory.remove(item_id)
     return True
 
 def has_item(character, item_id):
@@ -74,7 +193,7 @@ def has_item(character, item_id):
     Returns: True if item in inventory, False otherwise
     """
     # TODO: Implement item check
-    return item_id in character['inventory']
+    return item_id in get_inventory(character)
 
 def count_item(character, item_id):
     """
@@ -84,7 +203,7 @@ def count_item(character, item_id):
     """
     # TODO: Implement item counting
     # Use list.count() method
-    return character['inventory'].count(item_id)
+    return get_inventory(character).count(item_id)
 
 def get_inventory_space_remaining(character):
     """
@@ -99,13 +218,16 @@ def clear_inventory(character):
     """
     Remove all items from inventory
     
+    The character gets a new empty inventory; the old one is handed
+    back as-is rather than copied.
+    
     Returns: List of removed items
     """
     # TODO: Implement inventory clearing
     # Save current inventory before clearing
     # Clear character's inventory list
-    removed_items = character['inventory'].copy()
-    character['inventory'].clear()
+    removed_items = get_inventory(character)
+    character['inventory'] = Inventory()
     return removed_items
 
 # ============================================================================
@@ -143,13 +265,13 @@ def use_item(character, item_id, item_data):
         raise InvalidItemTypeError(f"Cannot 'use' item of type: {item_data['type']}.")
         
     try:
-        stat_name, value = parse_item_effect(item_data['effect'])
+        effect = item_effects.get_item_effect(item_data)
         
-        apply_stat_effect(character, stat_name, value)
+        effect.apply(character)
 
         remove_item_from_inventory(character, item_id)
         
-        return f"Used {item_data.get('name', item_id)}. {stat_name} increased by {value}."
+        return f"Used {item_data.get('name', item_id)}. {effect.describe()}."
         
     except ValueError as e:
         raise InvalidItemTypeError(f"Item {item_id} has invalid effect data: {e}")
@@ -165,7 +287,8 @@ def equip_weapon(character, item_id, item_data):
         item_id: Weapon to equip
         item_data: Item information dictionary
     
-    Weapon effect format: "strength:5" (adds 5 to strength)
+    Weapon effect format: "strength:5" (adds 5 to strength); several
+    stats may be listed, e.g. "strength:5,magic:3"
     
     If character already has weapon equipped:
     - Unequip current weapon (remove bonus)
@@ -196,8 +319,7 @@ def equip_weapon(character, item_id, item_data):
         except InventoryFullError:
             return "Cannot equip new weapon: Inventory is full!"
     try:
-        stat_name, value = parse_item_effect(item_data['effect'])
-        apply_stat_effect(character, stat_name, value)
+        item_effects.get_item_effect(item_data).apply(character)
 
         character['equipped_weapon'] = {'id': item_id, 'effect': item_data['effect']}
         
@@ -217,7 +339,8 @@ def equip_armor(character, item_id, item_data):
         item_id: Armor to equip
         item_data: Item information dictionary
     
-    Armor effect format: "max_health:10" (adds 10 to max_health)
+    Armor effect format: "max_health:10" (adds 10 to max_health); several
+    stats may be listed, e.g. "max_health:10,strength:2"
     
     If character already has armor equipped:
     - Unequip current armor (remove bonus)
@@ -244,8 +367,7 @@ def equip_armor(character, item_id, item_data):
             return "Cannot equip new armor: Inventory is full!"
             
     try:
-        stat_name, value = parse_item_effect(item_data['effect'])
-        apply_stat_effect(character, stat_name, value)
+        item_effects.get_item_effect(item_data).apply(character)
         
         character['equipped_armor'] = {'id': item_id, 'effect': item_data['effect']}
         remove_item_from_inventory(character, item_id)
@@ -278,8 +400,7 @@ def unequip_weapon(character):
     effect_string = equipped['effect']
 
     try:
-        stat_name, value = parse_item_effect(effect_string)
-        apply_stat_effect(character, stat_name, -value)
+        item_effects.compile_effect(effect_string).remove(character)
     except ValueError:
         print(f"Warning: Could not parse effect for equipped item {item_id}.")
         
@@ -308,8 +429,7 @@ def unequip_armor(character):
     effect_string = equipped['effect']
     
     try:
-        stat_name, value = parse_item_effect(effect_string)
-        apply_stat_effect(character, stat_name, -value)
+        item_effects.compile_effect(effect_string).remove(character)
     except ValueError:
         print(f"Warning: Could not parse effect for equipped item {item_id}.")
         
@@ -409,28 +529,18 @@ def apply_stat_effect(character, stat_name, value):
     Apply a stat modification to character
     
     Valid stats: health, max_health, strength, magic
+    (see item_effects.STAT_APPLIERS)
     
     Note: health cannot exceed max_health
     """
     # TODO: Implement stat application
     # Add value to character[stat_name]
     # If stat is health, ensure it doesn't exceed max_health
-    if stat_name == 'health':
-
-        character_manager.heal_character(character, value)
-    
-    elif stat_name == 'max_health':
-        character['max_health'] += value
-        character_manager.heal_character(character, value)
-        
-    elif stat_name == 'strength':
-        character['strength'] += value
-        
-    elif stat_name == 'magic':
-        character['magic'] += value
-        
-    else:
+    applier = item_effects.STAT_APPLIERS.get(stat_name)
+    if applier is None:
         print(f"Warning: Invalid stat name '{stat_name}' in apply_stat_effect")
+    else:
+        applier(character, value)
 
 def display_inventory(character, item_data_dict):
     """
@@ -452,10 +562,8 @@ def display_inventory(character, item_data_dict):
         print(" (Empty)")
         return
 
-    # 1. Count the items
-    item_counts = {}
-    for item_id in character['inventory']:
-        item_counts[item_id] = item_counts.get(item_id, 0) + 1
+    # 1. Count the items (kept up to date by the Inventory)
+    item_counts = get_inventory(character).counts
         
     # 2. Prepare a list of items to print so we can SORT them
     items_to_print = []
@@ -0,0 +1,169 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Item Effects Module
+
+This module turns an item's EFFECT string ("strength:5" or
+"strength:5,magic:3,max_health:10") into an ItemEffect once, so using,
+equipping and unequipping items does not split and int()-parse the
+string or compare stat names on every call.
+
+An item catalog (see item_index.IndexedItemCatalog) compiles each
+item's effect when the item is added and keeps it on the item record
+(Item.compiled_effect). Effects of other item dictionaries, and of the
+equipped items stored on characters, are compiled on first use and
+shared through compiled_effects.
+"""
+
+import character_manager
+import game_data
+
+# EFFECT string -> ItemEffect, for effects not attached to a catalog item
+compiled_effects = {}
+
+# ============================================================================
+# STAT APPLIERS
+# ============================================================================
+
+def add_max_health(character, amount):
+    """Raise (or lower) max_health and heal by the same amount"""
+    character['max_health'] += amount
+    character_manager.heal_character(character, amount)
+
+def add_strength(character, amount):
+    """Raise (or lower) strength"""
+    character['strength'] += amount
+
+def add_magic(character, amount):
+    """Raise (or lower) magic"""
+    character['magic'] += amount
+
+# Stat name -> function(character, amount) applying a single stat change
+# (inventory_system.apply_stat_effect); health never exceeds max_health
+STAT_APPLIERS = {
+    'health': character_manager.heal_character,
+    'max_health': add_max_health,
+    'strength': add_strength,
+    'magic': add_magic
+}
+
+# ============================================================================
+# COMPILED EFFECTS
+# ============================================================================
+
+class ItemEffect:
+    """
+    One parsed EFFECT as a vector of stat changes, ready to apply
+
+    Every stat the EFFECT names is applied in one step. max_health
+    changes first; health is then healed by the health and max_health
+    amounts together, capped at the new max_health. remove() reverses
+    the strength, magic and max_health changes exactly, so equipping
+    then unequipping an item leaves those stats as they were, and only
+    lowers health if it is above the restored max_health.
+
+    Attributes:
+        effect: The EFFECT string it was compiled from
+        changes: Tuple of (stat_name, value) in the order written
+        health, max_health, strength, magic: Amount added to each stat
+    """
+    __slots__ = ('effect', 'changes', 'health', 'max_health', 'strength', 'magic',
+                 'unknown_stats')
+
+    def __init__(self, effect, changes):
+        self.effect = effect
+        self.changes = tuple(changes)
+        totals = dict.fromkeys(game_data.VALID_EFFECT_STATS, 0)
+        unknown_stats = []
+        for stat_name, value in self.changes:
+            if stat_name in totals:
+                totals[stat_name] += value
+            else:
+                unknown_stats.append(stat_name)
+        self.health = totals['health']
+        self.max_health = totals['max_health']
+        self.strength = totals['strength']
+        self.magic = totals['magic']
+        self.unknown_stats = tuple(unknown_stats)
+
+    def apply(self, character):
+        """Add the effect to a character's stats"""
+        for stat_name in self.unknown_stats:
+            print(f"Warning: Invalid stat name '{stat_name}' in apply_stat_effect")
+        if self.strength:
+            character['strength'] += self.strength
+        if self.magic:
+            character['magic'] += self.magic
+        if self.max_health:
+            character['max_health'] += self.max_health
+        healing = self.health + self.max_health
+        if healing:
+            character_manager.heal_character(character, healing)
+
+    def remove(self, character):
+        """
+        Take an applied effect back off (e.g. when unequipping)
+
+        Only the stat changes are reversed; health healed on apply is
+        kept, down to the restored max_health.
+        """
+        if self.strength:
+            character['strength'] -= self.strength
+        if self.magic:
+            character['magic'] -= self.magic
+        if self.max_health:
+            character['max_health'] -= self.max_health
+            character['health'] = min(character['health'], character['max_health'])
+
+    def describe(self):
+        """
+        Returns: Text for a used item, e.g. "health increased by 20"
+        """
+        return ", ".join(f"{stat_name} increased by {value}" for stat_name, value in self.changes)
+
+    def __repr__(self):
+        return f"ItemEffect({self.effect!r})"
+
+def compile_effect(effect):
+    """
+    Get the ItemEffect for an EFFECT string, compiling it the first time
+
+    Args:
+        effect: String of "stat_name:value" pairs, comma-separated
+                (see game_data.parse_effect)
+
+    Returns: ItemEffect
+    Raises: ValueError if the string is malformed
+    """
+    compiled = compiled_effects.get(effect)
+    if compiled is None:
+        try:
+            changes = game_data.parse_effect(effect)
+        except ValueError:
+            raise ValueError(f"Invalid effect string format: '{effect}'") from None
+        compiled = compiled_effects[effect] = ItemEffect(effect, changes)
+    return compiled
+
+def attach_effect(item):
+    """
+    Compile a catalog item's effect and keep it on the item record
+
+    Items whose effect is malformed are left without one; using them
+    reports the error as before.
+    """
+    try:
+        item.compiled_effect = compile_effect(item['effect'])
+    except (AttributeError, TypeError, ValueError):
+        pass
+
+def get_item_effect(item_data):
+    """
+    Get the compiled effect of an item record or item dictionary
+
+    Returns: ItemEffect
+    Raises: ValueError if the item's effect is malformed
+    """
+    effect = item_data['effect']
+    compiled = getattr(item_data, 'compiled_effect', None)
+    if compiled is not None and compiled.effect == effect:
+        return compiled
+    return compile_effect(effect)
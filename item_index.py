@@ -0,0 +1,177 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Item Index Module
+
+This module wraps the item catalog with secondary indexes so the shop
+and other filtered lookups do not have to scan every item:
+- by TYPE (weapon, armor, consumable)
+- by the stat named in EFFECT (strength, magic, ...)
+- by COST, kept sorted for range queries
+
+Each item's EFFECT is also compiled once as it is added (see
+item_effects.py). Building the indexes reads every item, so main keeps
+the lazy catalog at startup and list_items_by_cost sorts whatever
+catalog it is given.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+import game_data
+import item_effects
+
+def get_effect_stats(effect):
+    """
+    Get the stat names an EFFECT string modifies
+
+    Returns: List of stat names (empty if the effect is malformed)
+    Example: "strength:5,magic:3" → ["strength", "magic"]
+    """
+    try:
+        return [stat_name for stat_name, value in game_data.parse_effect(effect)]
+    except ValueError:
+        return []
+
+def list_items_by_cost(items):
+    """
+    Get any item catalog's items sorted by cost (for the shop)
+
+    Uses the cost index of an IndexedItemCatalog; other catalogs (a
+    plain dictionary, or a lazy_catalog.LazyCatalog) are sorted here.
+
+    Returns: List of (item_id, item) tuples, cheapest first
+    """
+    if hasattr(items, 'items_by_cost'):
+        return items.items_by_cost()
+    return sorted(items.items(), key=lambda entry: (entry[1]['cost'], entry[0]))
+
+class IndexedItemCatalog(MutableMapping):
+    """
+    Item catalog (item_id -> item record) with secondary indexes
+
+    Behaves like the all_items dictionary everywhere it is used. Indexes
+    are built once when the catalog is created and updated on every
+    assignment or deletion, so they never go stale.
+    """
+
+    def __init__(self, items=None):
+        """
+        Build the catalog and its indexes
+
+        Args:
+            items: Optional mapping of item_id -> item record to copy in
+                   (e.g. the result of game_data.load_items)
+        """
+        self.items = {}
+        self.by_type = {}      # type -> {item_id: None} (insertion-ordered set)
+        self.by_stat = {}      # stat -> {item_id: None}
+        self.by_cost = []      # sorted list of (cost, item_id)
+        if items:
+            for item_id, item in items.items():
+                self.items[item_id] = item
+                self.index_item(item_id, item)
+            self.by_cost.sort()
+
+    # ------------------------------------------------------------------
+    # Dictionary interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, item_id):
+        return self.items[item_id]
+
+    def __setitem__(self, item_id, item):
+        if item_id in self.items:
+            self.unindex_item(item_id, self.items[item_id])
+        self.items[item_id] = item
+        self.index_item(item_id, item, keep_sorted=True)
+
+    def __delitem__(self, item_id):
+        item = self.items.pop(item_id)
+        self.unindex_item(item_id, item)
+
+    def __contains__(self, item_id):
+        return item_id in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return f"IndexedItemCatalog({len(self.items)} items)"
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def index_item(self, item_id, item, keep_sorted=False):
+        """Add one item to every index and compile its effect"""
+        item_effects.attach_effect(item)
+        self.by_type.setdefault(item['type'], {})[item_id] = None
+        for stat_name in get_effect_stats(item['effect']):
+            self.by_stat.setdefault(stat_name, {})[item_id] = None
+        if keep_sorted:
+            insort(self.by_cost, (item['cost'], item_id))
+        else:
+            self.by_cost.append((item['cost'], item_id))
+
+    def unindex_item(self, item_id, item):
+        """Remove one item from every index"""
+        self.discard(self.by_type, item['type'], item_id)
+        for stat_name in get_effect_stats(item['effect']):
+            self.discard(self.by_stat, stat_name, item_id)
+        position = bisect_left(self.by_cost, (item['cost'], item_id))
+        if position < len(self.by_cost) and self.by_cost[position] == (item['cost'], item_id):
+            del self.by_cost[position]
+
+    def discard(self, index, key, item_id):
+        """Remove item_id from one index bucket, dropping empty buckets"""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(item_id, None)
+            if not bucket:
+                del index[key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_item_types(self):
+        """
+        Returns: Sorted list of item types present in the catalog
+        """
+        return sorted(self.by_type)
+
+    def items_of_type(self, item_type):
+        """
+        Get every item of one TYPE (e.g. all weapons)
+
+        Returns: List of (item_id, item) tuples in catalog order
+        """
+        return [(item_id, self.items[item_id]) for item_id in self.by_type.get(item_type, {})]
+
+    def items_affecting(self, stat_name):
+        """
+        Get every item whose EFFECT modifies a stat (e.g. "strength")
+
+        Returns: List of (item_id, item) tuples in catalog order
+        """
+        return [(item_id, self.items[item_id]) for item_id in self.by_stat.get(stat_name, {})]
+
+    def items_by_cost(self, min_cost=None, max_cost=None):
+        """
+        Get items sorted by cost, optionally limited to a cost range
+
+        Args:
+            min_cost: Lowest cost to include (None for no lower bound)
+            max_cost: Highest cost to include (None for no upper bound)
+
+        Returns: List of (item_id, item) tuples, cheapest first
+        """
+        start = 0 if min_cost is None else bisect_left(self.by_cost, (min_cost,))
+        if max_cost is None:
+            stop = len(self.by_cost)
+        else:
+            # Every (max_cost, item_id) sorts before (max_cost + 1,)
+            stop = bisect_right(self.by_cost, (max_cost + 1,))
+        return [(item_id, self.items[item_id]) for cost, item_id in self.by_cost[start:stop]]
@@ -0,0 +1,164 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Lazy Catalog Module
+
+This module provides a read-only, dictionary-like view of a data file
+that is memory-mapped and indexed by record ID in one scan. A record is
+only parsed the first time it is looked up, and is cached after that.
+"""
+
+import mmap
+import os
+import re
+from collections.abc import Mapping
+from custom_exceptions import (
+    InvalidDataFormatError,
+    MissingDataFileError,
+    CorruptedDataError
+)
+
+class LazyCatalog(Mapping):
+    """
+    Mapping of record_id -> parsed record backed by a memory-mapped file
+
+    Can be used anywhere a catalog dictionary from game_data is expected
+    (item lookups, `in` checks, iteration, .items(), .get()).
+    The underlying file must not be edited while the catalog is open.
+    """
+
+    def __init__(self, filename, id_key, parse_block):
+        """
+        Map the file and build the record_id -> byte offset index
+
+        Args:
+            filename: Path to the data file
+            id_key: Key that names a record, e.g. "ITEM_ID"
+            parse_block: Function that turns a list of lines into a record
+
+        Raises: MissingDataFileError, CorruptedDataError
+        """
+        if not os.path.exists(filename):
+            raise MissingDataFileError(f"Data file not found: {filename}")
+
+        self.filename = filename
+        self.parse_block = parse_block
+        self.offsets = {}
+        self.parsed = {}
+        self.file = None
+        self.data = b""
+
+        try:
+            self.file = open(filename, 'rb')
+            if os.fstat(self.file.fileno()).st_size > 0:
+                self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError) as e:
+            self.close()
+            raise CorruptedDataError(f"Could not map data file {filename}: {e}")
+
+        pattern = re.compile(
+            rb"^[ \t]*" + re.escape(id_key.encode()) + rb": (.*?)[ \t\r]*$",
+            re.MULTILINE
+        )
+        for match in pattern.finditer(self.data):
+            # Later duplicates win, the same as a dict built by load_items
+            record_id = match.group(1).decode()
+            self.offsets.pop(record_id, None)
+            self.offsets[record_id] = match.start()
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, record_id):
+        record = self.parsed.get(record_id)
+        if record is None:
+            offset = self.offsets[record_id]     # KeyError for unknown IDs
+            record = self.parse_at(offset)
+            self.parsed[record_id] = record
+        return record
+
+    def __contains__(self, record_id):
+        return record_id in self.offsets
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return (f"LazyCatalog({self.filename!r}, {len(self.offsets)} records, "
+                f"{len(self.parsed)} parsed)")
+
+    # ------------------------------------------------------------------
+    # Block access
+    # ------------------------------------------------------------------
+
+    def block_bounds(self, offset):
+        """
+        Find the byte range of the block containing offset
+
+        Walks backwards and forwards line by line until a blank line or
+        the edge of the file is reached.
+
+        Returns: Tuple of (start, end) byte offsets
+        """
+        data = self.data
+        start = offset
+        while start > 0:
+            line_start = data.rfind(b"\n", 0, start - 1) + 1
+            if not data[line_start:start].strip():
+                break
+            start = line_start
+
+        end = offset
+        size = len(data)
+        while end < size:
+            line_end = data.find(b"\n", end)
+            if line_end == -1:
+                line_end = size
+            if not data[end:line_end].strip():
+                break
+            end = line_end + 1
+        return start, end
+
+    def parse_at(self, offset):
+        """
+        Parse the block that contains the given byte offset
+
+        Returns: Parsed record
+        Raises: InvalidDataFormatError (with file and line) if parsing fails
+        """
+        start, end = self.block_bounds(offset)
+        try:
+            text = self.data[start:end].decode()
+        except UnicodeDecodeError as e:
+            raise CorruptedDataError(f"Could not read data file {self.filename}: {e}")
+
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        try:
+            return self.parse_block(lines)
+        except InvalidDataFormatError as e:
+            line_number = self.data[:start].count(b"\n") + 1
+            raise InvalidDataFormatError(f"{self.filename}, line {line_number}: {e}") from e
+
+    def parsed_count(self):
+        """
+        Returns: Number of records parsed so far
+        """
+        return len(self.parsed)
+
+    def close(self):
+        """Release the memory map and file handle"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
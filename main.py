@@ -12,11 +12,17 @@ Demonstrates module integration and complete game flow.
 
 # Import all our custom modules
 import character_manager
+import autosave
 import inventory_system
 import quest_handler
 import combat_system
 import game_data
+import hot_reload
+import item_index
+import save_backends
+import save_journal
 from custom_exceptions import *
+import sys
 
 # ============================================================================
 # GAME STATE
@@ -27,6 +33,12 @@ current_character = None
 all_quests = {}
 all_items = {}
 game_running = False
+data_watcher = None
+autosaver = autosave.SaveScheduler()
+
+# Menu choices that never change the character (no save needed). View
+# Inventory is not one: items are used, equipped and sold from it
+READ_ONLY_CHOICES = (1,)
 
 # ============================================================================
 # MAIN MENU
@@ -88,12 +100,12 @@ def new_game():
         print("Name cannot be empty. Going back to main menu.")
         return
     
-    print(f"Valid classes are: {', '.join(character_manager.valid_class)}")
-    char_class = input("Choose your class: ").strip().capitalize()
+    print(f"Valid classes are: {', '.join(character_manager.get_class_names())}")
+    char_class = input("Choose your class: ").strip()
     
     try:
         current_character = character_manager.create_character(name, char_class)
-        print(f"\nCharacter {name} the {char_class} has been created!")
+        print(f"\nCharacter {name} the {current_character['class']} has been created!")
 
         save_game()
         print(f"Game saved. {name}, ENGAGE!")
@@ -124,15 +136,18 @@ def load_game():
     # Start game loop
     global current_character
     print("\n--- LOAD GAME ---")
-    saved_chars = character_manager.list_saved_characters()
+    saved_chars = character_manager.list_save_summaries(sort_by="saved_at", reverse=True)
     
     if not saved_chars:
         print("No saved games found.")
         return
         
-    print("Available characters:")
-    for i, name in enumerate(saved_chars, 1):
-        print(f"{i}. {name}")
+    print("Available characters (most recently saved first):")
+    for i, summary in enumerate(saved_chars, 1):
+        if summary['level'] is None:
+            print(f"{i}. {summary['name']} (unreadable save)")
+        else:
+            print(f"{i}. {summary['name']} - Level {summary['level']} {summary['class']}, {summary['gold']} G")
         
     choice = input("Enter the name of the character to load: ").strip()
     try:
@@ -164,34 +179,52 @@ def game_loop():
     #   Get player choice
     #   Execute chosen action
     #   Save game after each action
-    while game_running:
-        if current_character and character_manager.is_character_dead(current_character):
-            current_character, game_running = handle_character_death(current_character)
-            continue
+    try:
+        while game_running:
+            if current_character and character_manager.is_character_dead(current_character):
+                flush_autosave()
+                current_character, game_running = handle_character_death()
+                if current_character:
+                    autosave_character()
+                continue
 
-        choice = game_menu()
+            choice = game_menu()
+
+            if choice == 1:
+                view_character_stats()
+            elif choice == 2:
+                view_inventory()
+            elif choice == 3:
+                quest_menu()
+            elif choice == 4:
+                explore()
+            elif choice == 5:
+                shop()
+            elif choice == 6:
+                save_game()
+                print("\nGame saved. Goodbye!")
+                game_running = False
+            
+            if game_running and choice not in READ_ONLY_CHOICES:
+                autosave_character()
+    finally:
+        # Never leave coalesced changes unsaved (quit, death, Ctrl+C, errors)
+        flush_autosave()
+
+def autosave_character():
+    """Ask the autosave scheduler to save the current character"""
+    try:
+        autosaver.request_save(current_character)
+    except IOError as e:
+        print(f"!! CRITICAL: Failed to auto-save game: {e} !!")
 
-        if choice == 1:
-            view_character_stats()
-        elif choice == 2:
-            view_inventory()
-        elif choice == 3:
-            quest_menu()
-        elif choice == 4:
-            explore()
-        elif choice == 5:
-            shop()
-        elif choice == 6:
-            save_game()
-            print("\nGame saved. Goodbye!")
-            game_running = False
-        
-        if game_running:
-            try:
-                # We auto-save the character after every action
-                character_manager.save_character(current_character)
-            except IOError as e:
-                print(f"!! CRITICAL: Failed to auto-save game: {e} !!")
+def flush_autosave():
+    """Write any changes the autosave scheduler or save writer is still holding"""
+    try:
+        autosaver.flush()
+        character_manager.flush_saves()
+    except IOError as e:
+        print(f"!! CRITICAL: Failed to auto-save game: {e} !!")
 
 def game_menu():
     """
@@ -428,7 +461,7 @@ def shop():
         try:
             if choice == 'B':
                 print("\nItems for sale:")
-                for item_id, item_data in all_items.items():
+                for item_id, item_data in item_index.list_items_by_cost(all_items):
                     print(f"  - [{item_id}] {item_data['name']} (Cost: {item_data['cost']} G)")
                 
                 item_id = input("Enter Item ID to buy: ").strip()
@@ -476,7 +509,9 @@ def save_game():
     # Handle any file I/O exceptions
     if current_character:
         try:
-            character_manager.save_character(current_character)
+            autosaver.request_save(current_character)
+            autosaver.flush()
+            character_manager.flush_saves()
         except IOError as e:
             print(f"Error saving game: {e}")
     else:
@@ -491,12 +526,78 @@ def load_game_data():
     # Try to load items with game_data.load_items()
     # Handle MissingDataFileError, InvalidDataFormatError
     # If files missing, create defaults with game_data.create_default_data_files()
-    all_quests = game_data.load_quests()
-    all_items = game_data.load_items()
+    all_quests = game_data.load_quests(use_cache=True)
+    all_items = game_data.load_items(lazy=True)
+    # Load classes now so a bad class file is reported at startup
+    character_manager.set_class_registry(None)
+    character_manager.get_class_registry()
 
     quest_handler.validate_quest_prerequisites(all_quests)
     print("Game data and quest prerequisites validated.")
 
+def start_hot_reload(interval=2.0):
+    """
+    Watch the data files and swap in edited quests/items while running
+    
+    Replaces the loaded catalogs with ones owned by a
+    hot_reload.GameDataWatcher and polls every interval seconds.
+    """
+    global data_watcher, all_quests, all_items
+    
+    data_watcher = hot_reload.GameDataWatcher(on_reload=apply_data_reload)
+    all_quests = data_watcher.quests.catalog
+    all_items = item_index.IndexedItemCatalog(data_watcher.items.catalog)
+    data_watcher.start(interval)
+    print("Hot reload enabled for data files.")
+
+def apply_data_reload(quests, items, changes):
+    """Swap reloaded catalogs into the game (called by the data watcher)"""
+    global all_quests, all_items
+    
+    all_quests = quests
+    if changes['items']:
+        # Build the new indexes first, then swap the whole catalog at once
+        all_items = item_index.IndexedItemCatalog(items)
+    print(f"\n[Data reloaded] {hot_reload.format_changes(changes)}")
+
+def configure_autosave(args):
+    """
+    Set the autosave policy from command line options
+    
+    --autosave-interval SECONDS  (checked on each action; 0 = no time limit)
+    --autosave-actions COUNT     (1 = save after every action)
+    """
+    global autosaver
+    
+    options = {'--autosave-interval': autosave.DEFAULT_INTERVAL,
+               '--autosave-actions': autosave.DEFAULT_MAX_ACTIONS}
+    for i, arg in enumerate(args[:-1]):
+        if arg in options:
+            try:
+                options[arg] = float(args[i + 1])
+            except ValueError:
+                print(f"Ignoring invalid value for {arg}: {args[i + 1]}")
+    autosaver = autosave.SaveScheduler(interval=options['--autosave-interval'],
+                                       max_actions=int(options['--autosave-actions']))
+
+def configure_save_writer(args):
+    """
+    Set up background saving from command line options
+    
+    --fsync POLICY     none, per-save or periodic (default: periodic)
+    --no-async-saves   write saves on the game thread
+    """
+    policy = "periodic"
+    if "--fsync" in args[:-1]:
+        policy = args[args.index("--fsync") + 1]
+    if policy not in save_backends.DURABILITY_POLICIES:
+        print(f"Ignoring invalid value for --fsync: {policy}")
+        policy = "periodic"
+    if "--no-async-saves" in args:
+        character_manager.set_save_durability(policy)
+    else:
+        character_manager.enable_async_saves(policy)
+
 def handle_character_death():
     """Handle character death"""
     global current_character, game_running
@@ -569,6 +670,17 @@ def main():
         print(f"Error loading game data: {e}")
         print("Please check data files for errors.")
         return
+
+    if "--hot-reload" in sys.argv:
+        start_hot_reload()
+    configure_autosave(sys.argv[1:])
+    if "--save-backend" in sys.argv[1:-1]:
+        spec = sys.argv[sys.argv.index("--save-backend") + 1]
+        backend = save_backends.make_backend(spec)
+        if isinstance(backend, save_journal.JournalSaveBackend):
+            backend.start_compaction()
+        character_manager.set_storage_backend(backend)
+    configure_save_writer(sys.argv[1:])
     
     # Main menu loop
     while True:
@@ -579,6 +691,13 @@ def main():
         elif choice == 2:
             load_game()
         elif choice == 3:
+            stats = autosaver.get_stats()
+            print(f"Autosave: {stats['performed']} of {stats['requested']} save requests written.")
+            try:
+                character_manager.disable_async_saves()
+                character_manager.close_storage_backends()
+            except IOError as e:
+                print(f"!! CRITICAL: Failed to save game: {e} !!")
             print("\nThanks for playing Quest Chronicles!")
             break
         else:
@@ -380,19 +380,31 @@ def display_character_quest_progress(character, quest_data_dict):
 # VALIDATION
 # ============================================================================
 
-def validate_quest_prerequisites(quest_data_dict):
+def validate_quest_prerequisites(quest_data_dict, quest_ids=None):
     """
     Validate that all quest prerequisites exist
     
     Checks that every prerequisite (that's not "NONE") refers to a real quest
     
+    Args:
+        quest_data_dict: Dictionary of all quest data
+        quest_ids: Optional list of quest IDs to check instead of every
+                   quest (used by hot_reload to re-check only the quests a
+                   data file edit could have affected)
+    
     Returns: True if all valid
     Raises: QuestNotFoundError if invalid prerequisite found
     """
     # TODO: Implement prerequisite validation
     # Check each quest's prerequisite
     # Ensure prerequisite exists in quest_data_dict
-    for quest_id, quest_data in quest_data_dict.items():
+    if quest_ids is None:
+        quest_ids = quest_data_dict
+
+    for quest_id in quest_ids:
+        quest_data = quest_data_dict.get(quest_id)
+        if quest_data is None:
+            continue
         prereq = quest_data.get('prerequisite')
         if prereq != "NONE" and prereq not in quest_data_dict:
             print(f"WARNING: Quest '{quest_id}' requires missing quest '{prereq}'")
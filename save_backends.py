@@ -0,0 +1,816 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Backends Module
+
+This module holds the storage backends character_manager saves through:
+- BinarySaveBackend: one {name}_save.dat file per character in the
+  binary format from save_format.py (the default)
+- TextSaveBackend: one {name}_save.txt file per character
+- SQLiteSaveBackend: every character in one SQLite database, with batch
+  saves and loads done in a single transaction
+
+All backends have the same methods, so character_manager can switch
+between them without any change to its callers.
+
+Command line usage:
+    python save_backends.py migrate [--from DIR] [--to DB] [--batch-size N]
+    python save_backends.py export NAME [--from DIR] [--to PATH]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+import time
+import save_format
+import save_layout
+import save_index
+from custom_exceptions import (
+    CharacterNotFoundError,
+    SaveFileCorruptedError,
+    InvalidSaveDataError
+)
+
+# Character fields written to a save, in file order
+SAVE_FIELDS = [
+    "name", "class", "level", "health", "max_health", "strength", "magic",
+    "experience", "gold", "inventory", "active_quests", "completed_quests",
+    "equipped_weapon", "equipped_armor"
+]
+INT_FIELDS = ("level", "health", "max_health", "strength", "magic", "experience", "gold")
+LIST_FIELDS = ("inventory", "active_quests", "completed_quests")
+EQUIPMENT_FIELDS = ("equipped_weapon", "equipped_armor")
+
+# Fields every save listing can be sorted by
+SUMMARY_FIELDS = save_index.ENTRY_FIELDS
+
+# When saves are forced to disk with fsync:
+#   none      never (the operating system decides)
+#   per-save  before every save returns
+#   periodic  at most every sync_interval seconds, and on sync()
+DURABILITY_POLICIES = ("none", "per-save", "periodic")
+DEFAULT_SYNC_INTERVAL = 1.0
+
+def check_durability(policy):
+    """
+    Raises: ValueError if policy is not one of DURABILITY_POLICIES
+    """
+    if policy not in DURABILITY_POLICIES:
+        raise ValueError(f"Unknown fsync policy {policy!r} (expected one of {', '.join(DURABILITY_POLICIES)})")
+
+def fsync_directory(directory):
+    """Force a directory's entries (e.g. a rename) to disk where supported"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+# ============================================================================
+# TEXT SAVE FORMAT
+# ============================================================================
+
+def format_equipment(equipped):
+    """
+    Returns: "item_id,effect" for an equipped item, or "" for None
+    """
+    return f"{equipped['id']},{equipped['effect']}" if equipped else ""
+
+def parse_equipment(value):
+    """
+    Returns: {'id', 'effect'} dictionary for an "item_id,effect" string,
+             or None for an empty string
+    """
+    if not value:
+        return None
+    item_id, separator, effect = value.partition(",")
+    if not separator:
+        raise ValueError(f"expected 'item_id,effect', found {value!r}")
+    return {'id': item_id, 'effect': effect}
+
+def format_text_save(character):
+    """
+    Build the text of a save file
+
+    Returns: String with one "KEY: value" line per saved field
+             (lists are comma-separated, equipment is "item_id,effect")
+    Raises: KeyError if the character is missing a saved field
+    """
+    lines = []
+    for field in SAVE_FIELDS:
+        if field in EQUIPMENT_FIELDS:
+            value = format_equipment(character.get(field))
+        elif field in LIST_FIELDS:
+            value = ",".join(character[field])
+        else:
+            value = character[field]
+        lines.append(f"{field.upper()}: {value}\n")
+    return "".join(lines)
+
+def parse_text_save(lines):
+    """
+    Turn the lines of a save file back into a character dictionary
+
+    Returns: Character dictionary
+    Raises: InvalidSaveDataError if a line or field is malformed or missing
+    """
+    data = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if ": " in line:
+            key, value = line.split(": ", 1)
+        elif line.endswith(":"):
+            key, value = line[:-1], ""
+        else:
+            raise InvalidSaveDataError(f"Malformed line in save file: '{line}'")
+        data[key] = value
+
+    character = {}
+    try:
+        for field in SAVE_FIELDS:
+            if field in EQUIPMENT_FIELDS:
+                # Older text saves have no equipment lines
+                character[field] = parse_equipment(data.get(field.upper(), ""))
+                continue
+            value = data[field.upper()]
+            if field in INT_FIELDS:
+                value = int(value)
+            elif field in LIST_FIELDS:
+                value = value.split(",") if value else []
+            character[field] = value
+    except KeyError as e:
+        raise InvalidSaveDataError(f"Invalid save data: missing field {e}")
+    except ValueError as e:
+        raise InvalidSaveDataError(f"Invalid save data: {e}")
+    return character
+
+# ============================================================================
+# TEXT FILE BACKEND
+# ============================================================================
+
+class TextSaveBackend:
+    """
+    One text save file per character in a save directory
+
+    The save directory's index file (see save_index.py) is kept up to
+    date by every save and delete. Files are written to a temporary file
+    and renamed over the old save, so a crash never leaves half a save.
+    Where each file lives (flat or sharded) is decided by the directory's
+    save_layout.SaveLayout.
+    """
+
+    suffix = "_save.txt"
+
+    def __init__(self, save_directory="data/save_games"):
+        self.save_directory = save_directory
+        self.layout = save_layout.get_layout(save_directory)
+        self.durability = "none"
+        self.sync_interval = DEFAULT_SYNC_INTERVAL
+        self.unsynced = set()       # paths written since the last sync
+        self.unsynced_directories = set()   # directories created since the last sync
+        self.last_sync = time.monotonic()
+        self.lock = threading.Lock()
+
+    def set_durability(self, policy, sync_interval=DEFAULT_SYNC_INTERVAL):
+        """
+        Choose when saves are forced to disk (see DURABILITY_POLICIES)
+
+        Raises: ValueError for an unknown policy
+        """
+        check_durability(policy)
+        self.durability = policy
+        self.sync_interval = sync_interval
+
+    def get_location(self, character_name):
+        """
+        Returns: Path of the character's save file
+        """
+        return self.layout.locate(character_name, self.suffix)
+
+    def get_signature(self, character_name):
+        """
+        Returns: (size, mtime_ns) of the character's save file, or None
+                 if there is no save file
+        """
+        try:
+            stat = os.stat(self.get_location(character_name))
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def encode(self, character):
+        """
+        Returns: Save file contents (bytes) for a character
+        Raises: KeyError if the character is missing a saved field
+        """
+        return format_text_save(character).encode("utf-8")
+
+    def decode(self, data):
+        """
+        Returns: Character dictionary for save file contents
+        Raises: SaveFileCorruptedError, InvalidSaveDataError
+        """
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise SaveFileCorruptedError(f"Could not read save file: {e}")
+        return parse_text_save(text.splitlines())
+
+    def write_character(self, character):
+        """
+        Atomically replace one save file (without touching the index)
+
+        Raises: IOError, KeyError for incomplete characters
+        """
+        self.write_file(self.get_location(character['name']), self.encode(character))
+
+    def write_file(self, path, data):
+        """
+        Replace a file through a temporary file and a rename, applying
+        the durability policy
+
+        Raises: IOError
+        """
+        temp_path = path + ".tmp"
+        created_in = self.layout.make_directory(path)
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                if self.durability == "per-save":
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+        if self.durability == "per-save":
+            # The rename is in the file's own (shard) directory; new shard
+            # directories are entries in their parents
+            fsync_directory(os.path.dirname(path))
+            for directory in created_in:
+                fsync_directory(directory)
+        elif self.durability == "periodic":
+            with self.lock:
+                self.unsynced.add(path)
+                self.unsynced_directories.update(created_in)
+            if time.monotonic() - self.last_sync >= self.sync_interval:
+                self.sync()
+
+    def sync(self):
+        """
+        Force every save written since the last sync to disk
+
+        Raises: IOError if fsync fails
+        """
+        with self.lock:
+            paths = self.unsynced
+            directories = self.unsynced_directories
+            self.unsynced = set()
+            self.unsynced_directories = set()
+            self.last_sync = time.monotonic()
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue        # Deleted since it was written
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        directories.update(os.path.dirname(path) for path in paths)
+        for directory in directories:
+            try:
+                fsync_directory(directory)
+            except FileNotFoundError:
+                continue        # Emptied and removed since
+
+    def save_character(self, character):
+        """
+        Write one character's save file and update the index
+
+        Raises: IOError, KeyError for incomplete characters
+        """
+        os.makedirs(self.save_directory, exist_ok=True)
+        with self.layout.lock:
+            # Check the index before the rename below changes the directory
+            save_index.read_index(self.save_directory)
+            self.write_character(character)
+            save_index.record_save(self.save_directory, character)
+
+    def save_characters(self, characters):
+        """
+        Write many save files, updating the index once at the end
+
+        Raises: IOError, KeyError for incomplete characters
+        """
+        os.makedirs(self.save_directory, exist_ok=True)
+        with self.layout.lock:
+            save_index.read_index(self.save_directory)
+            written = []
+            try:
+                for character in characters:
+                    self.write_character(character)
+                    written.append(character)
+            finally:
+                if written:
+                    save_index.record_saves(self.save_directory, written)
+
+    def load_character(self, character_name):
+        """
+        Read one save file
+
+        Returns: Character dictionary
+        Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+        """
+        with self.layout.lock:
+            file_path = self.get_location(character_name)
+            if not os.path.exists(file_path):
+                raise CharacterNotFoundError(f"Save file not found for {character_name}")
+            try:
+                with open(file_path, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                raise SaveFileCorruptedError(f"Could not read save file: {e}")
+        return self.decode(data)
+
+    def load_characters(self, character_names):
+        """
+        Returns: List of character dictionaries in the order requested
+        Raises: Same as load_character
+        """
+        return [self.load_character(name) for name in character_names]
+
+    def list_names(self):
+        """
+        Returns: List of saved character names
+        """
+        return save_index.list_names(self.save_directory)
+
+    def list_summaries(self, sort_by="name", reverse=False):
+        """
+        Returns: List of save index entries sorted by one field
+        """
+        return save_index.list_summaries(self.save_directory, sort_by, reverse)
+
+    def delete_character(self, character_name):
+        """
+        Delete one save file
+
+        Raises: CharacterNotFoundError if there is no save file
+        """
+        with self.layout.lock:
+            file_path = self.get_location(character_name)
+            if not os.path.exists(file_path):
+                raise CharacterNotFoundError(f"No save file to delete for {character_name}")
+            save_index.read_index(self.save_directory)
+            os.remove(file_path)
+            save_index.record_delete(self.save_directory, character_name)
+
+    def close(self):
+        """Force outstanding periodic saves to disk"""
+        if self.durability == "periodic":
+            self.sync()
+
+class BinarySaveBackend(TextSaveBackend):
+    """
+    One binary save file per character (see save_format.py)
+
+    Text saves left over from older versions are still loaded; the next
+    save of that character replaces its text file with a binary one.
+    """
+
+    suffix = "_save.dat"
+
+    def __init__(self, save_directory="data/save_games"):
+        super().__init__(save_directory)
+        self.legacy = TextSaveBackend(save_directory)
+
+    def set_durability(self, policy, sync_interval=DEFAULT_SYNC_INTERVAL):
+        """Choose when saves are forced to disk (see DURABILITY_POLICIES)"""
+        super().set_durability(policy, sync_interval)
+        self.legacy.set_durability(policy, sync_interval)
+
+    def encode(self, character):
+        """
+        Returns: Binary save contents for a character
+        Raises: InvalidSaveDataError if a field is missing or invalid
+        """
+        return save_format.encode_character(character)
+
+    def decode(self, data):
+        """
+        Returns: Character dictionary for binary save contents
+        Raises: SaveFileCorruptedError, InvalidSaveDataError
+        """
+        return save_format.decode_character(data)
+
+    def get_signature(self, character_name):
+        """
+        Returns: (suffix, size, mtime_ns) of the binary save, or of the
+                 older text save if there is no binary one (None if neither)
+        """
+        for backend in (self, self.legacy):
+            signature = TextSaveBackend.get_signature(backend, character_name)
+            if signature is not None:
+                return (backend.suffix,) + signature
+        return None
+
+    def write_character(self, character):
+        """Write one binary save file and drop any older text save"""
+        super().write_character(character)
+        self.remove_legacy(character['name'])
+
+    def remove_legacy(self, character_name):
+        """Delete a character's older text save, if there is one"""
+        try:
+            os.remove(self.legacy.get_location(character_name))
+        except FileNotFoundError:
+            pass
+
+    def load_character(self, character_name):
+        """
+        Read one binary save file, or the character's older text save
+
+        Returns: Character dictionary
+        Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+        """
+        with self.layout.lock:
+            if not os.path.exists(self.get_location(character_name)) and \
+                    os.path.exists(self.legacy.get_location(character_name)):
+                return self.legacy.load_character(character_name)
+            return super().load_character(character_name)
+
+    def delete_character(self, character_name):
+        """
+        Delete a character's binary and/or text save file
+
+        Raises: CharacterNotFoundError if there is no save file
+        """
+        with self.layout.lock:
+            if os.path.exists(self.get_location(character_name)):
+                self.remove_legacy(character_name)
+                super().delete_character(character_name)
+            else:
+                self.legacy.delete_character(character_name)
+
+# ============================================================================
+# SQLITE BACKEND
+# ============================================================================
+
+SQLITE_COLUMNS = SAVE_FIELDS + ["saved_at"]
+
+# Names per SELECT ... IN (...) query, below SQLite's variable limit
+SQLITE_BATCH_SIZE = 500
+
+class SQLiteSaveBackend:
+    """
+    Every character as one row of an SQLite database
+
+    Lists and equipment are stored as in text saves. Batch saves and
+    loads run in a single transaction. The connection may be shared with
+    a background writer thread; every use of it holds self.lock.
+    """
+
+    def __init__(self, db_path="data/save_games.db"):
+        """
+        Open (and create if needed) the save database
+
+        Raises: SaveFileCorruptedError if the file is not a usable database
+        """
+        self.db_path = db_path
+        self.durability = "none"
+        self.sync_interval = DEFAULT_SYNC_INTERVAL
+        self.last_sync = time.monotonic()
+        self.lock = threading.RLock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            self.connection = sqlite3.connect(db_path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            with self.connection:
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS characters ("
+                    "name TEXT PRIMARY KEY, class TEXT NOT NULL, "
+                    "level INTEGER NOT NULL, health INTEGER NOT NULL, "
+                    "max_health INTEGER NOT NULL, strength INTEGER NOT NULL, "
+                    "magic INTEGER NOT NULL, experience INTEGER NOT NULL, "
+                    "gold INTEGER NOT NULL, inventory TEXT NOT NULL, "
+                    "active_quests TEXT NOT NULL, completed_quests TEXT NOT NULL, "
+                    "equipped_weapon TEXT NOT NULL DEFAULT '', "
+                    "equipped_armor TEXT NOT NULL DEFAULT '', "
+                    "saved_at REAL NOT NULL)"
+                )
+                # Databases created before equipment was saved
+                columns = [row[1] for row in self.connection.execute("PRAGMA table_info(characters)")]
+                for field in EQUIPMENT_FIELDS:
+                    if field not in columns:
+                        self.connection.execute(
+                            f"ALTER TABLE characters ADD COLUMN {field} TEXT NOT NULL DEFAULT ''"
+                        )
+        except sqlite3.DatabaseError as e:
+            raise SaveFileCorruptedError(f"Could not open save database {db_path}: {e}")
+
+        placeholders = ", ".join("?" for _ in SQLITE_COLUMNS)
+        self.insert_sql = (f"INSERT OR REPLACE INTO characters ({', '.join(SQLITE_COLUMNS)}) "
+                           f"VALUES ({placeholders})")
+        self.select_sql = f"SELECT {', '.join(SAVE_FIELDS)} FROM characters"
+
+    def set_durability(self, policy, sync_interval=DEFAULT_SYNC_INTERVAL):
+        """
+        Choose when commits are forced to disk (see DURABILITY_POLICIES)
+
+        per-save uses synchronous=FULL; none and periodic use
+        synchronous=NORMAL, and periodic checkpoints the write-ahead log
+        into the database file at most every sync_interval seconds.
+
+        Raises: ValueError for an unknown policy
+        """
+        check_durability(policy)
+        with self.lock:
+            self.durability = policy
+            self.sync_interval = sync_interval
+            level = "FULL" if policy == "per-save" else "NORMAL"
+            self.connection.execute(f"PRAGMA synchronous={level}")
+
+    def sync(self):
+        """Checkpoint the write-ahead log so every commit is on disk"""
+        with self.lock:
+            self.last_sync = time.monotonic()
+            try:
+                self.connection.execute("PRAGMA wal_checkpoint(FULL)")
+            except sqlite3.Error as e:
+                raise IOError(f"Could not sync save database {self.db_path}: {e}") from e
+
+    def get_location(self, character_name):
+        """
+        Returns: String naming the character's row ("db_path#name")
+        """
+        return f"{self.db_path}#{character_name}"
+
+    def get_signature(self, character_name):
+        """
+        Returns: Database change counter; it moves whenever another
+                 connection commits (this connection's own saves are
+                 reported by character_manager invalidating its cache)
+        """
+        with self.lock:
+            return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def character_row(self, character, saved_at):
+        """
+        Returns: Tuple of column values for one character
+        Raises: KeyError if the character is missing a saved field
+        """
+        row = []
+        for field in SAVE_FIELDS:
+            if field in EQUIPMENT_FIELDS:
+                row.append(format_equipment(character.get(field)))
+            elif field in LIST_FIELDS:
+                row.append(",".join(character[field]))
+            else:
+                row.append(character[field])
+        row.append(saved_at)
+        return tuple(row)
+
+    def row_character(self, row):
+        """
+        Returns: Character dictionary for one SELECT row
+        """
+        character = dict(zip(SAVE_FIELDS, row))
+        for field in LIST_FIELDS:
+            character[field] = character[field].split(",") if character[field] else []
+        for field in EQUIPMENT_FIELDS:
+            character[field] = parse_equipment(character[field])
+        return character
+
+    def save_character(self, character):
+        """Save one character (its own transaction)"""
+        self.save_characters([character])
+
+    def save_characters(self, characters):
+        """
+        Save many characters in one transaction (all or nothing)
+
+        Raises: IOError if the database write fails, KeyError for
+                incomplete characters
+        """
+        saved_at = time.time()
+        rows = [self.character_row(character, saved_at) for character in characters]
+        with self.lock:
+            try:
+                with self.connection:
+                    self.connection.executemany(self.insert_sql, rows)
+            except sqlite3.Error as e:
+                raise IOError(f"Could not write to save database {self.db_path}: {e}") from e
+            if self.durability == "periodic" and \
+                    time.monotonic() - self.last_sync >= self.sync_interval:
+                self.sync()
+
+    def load_character(self, character_name):
+        """
+        Returns: Character dictionary
+        Raises: CharacterNotFoundError, SaveFileCorruptedError
+        """
+        return self.load_characters([character_name])[0]
+
+    def load_characters(self, character_names):
+        """
+        Load many characters in one transaction
+
+        Returns: List of character dictionaries in the order requested
+        Raises: CharacterNotFoundError naming every missing character,
+                SaveFileCorruptedError if the database cannot be read
+        """
+        character_names = list(character_names)
+        found = {}
+        try:
+            with self.lock, self.connection:
+                for start in range(0, len(character_names), SQLITE_BATCH_SIZE):
+                    batch = character_names[start:start + SQLITE_BATCH_SIZE]
+                    placeholders = ", ".join("?" for _ in batch)
+                    for row in self.connection.execute(
+                        f"{self.select_sql} WHERE name IN ({placeholders})", batch
+                    ):
+                        found[row[0]] = row
+        except sqlite3.DatabaseError as e:
+            raise SaveFileCorruptedError(f"Could not read save database {self.db_path}: {e}")
+
+        missing = [name for name in character_names if name not in found]
+        if missing:
+            raise CharacterNotFoundError(f"Save not found for: {', '.join(missing)}")
+        return [self.row_character(found[name]) for name in character_names]
+
+    def list_names(self):
+        """
+        Returns: List of saved character names
+        """
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT name FROM characters ORDER BY name")]
+
+    def list_summaries(self, sort_by="name", reverse=False):
+        """
+        Returns: List of summary dictionaries ('name', 'class', 'level',
+                 'gold', 'saved_at') sorted by one field
+        Raises: ValueError for an unknown sort field
+        """
+        if sort_by not in SUMMARY_FIELDS:
+            raise ValueError(f"Cannot sort saves by {sort_by!r}")
+        order = "DESC" if reverse else "ASC"
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT {', '.join(SUMMARY_FIELDS)} FROM characters ORDER BY {sort_by} {order}, name"
+            ).fetchall()
+        return [dict(zip(SUMMARY_FIELDS, row)) for row in rows]
+
+    def delete_character(self, character_name):
+        """
+        Delete one character
+
+        Raises: CharacterNotFoundError if there is no such character
+        """
+        with self.lock, self.connection:
+            cursor = self.connection.execute("DELETE FROM characters WHERE name = ?", (character_name,))
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"No save to delete for {character_name}")
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.connection.close()
+
+# ============================================================================
+# BACKEND SELECTION AND MIGRATION
+# ============================================================================
+
+def make_backend(spec):
+    """
+    Create a backend from a "kind" or "kind:location" string
+
+    Examples: "binary", "text:data/save_games", "journal",
+              "sqlite:data/save_games.db"
+
+    Returns: Backend instance
+    Raises: ValueError for an unknown backend kind
+    """
+    kind, separator, location = spec.partition(":")
+    if kind == "binary":
+        return BinarySaveBackend(location or "data/save_games")
+    if kind == "text":
+        return TextSaveBackend(location or "data/save_games")
+    if kind == "journal":
+        import save_journal     # save_journal builds on this module
+        return save_journal.JournalSaveBackend(location or "data/save_games")
+    if kind == "sqlite":
+        return SQLiteSaveBackend(location or "data/save_games.db")
+    raise ValueError(f"Unknown save backend {kind!r} (expected 'binary', 'text', 'journal' or 'sqlite')")
+
+def migrate_file_saves(save_directory, backend, batch_size=1000):
+    """
+    Copy every binary or text save in a directory into another backend
+
+    Saves are copied in batches of batch_size characters. Binary saves
+    are read with their journal replayed (see save_journal.py), so
+    changes not yet compacted into the snapshot are copied too.
+    Unreadable save files are skipped and reported.
+
+    Returns: Dictionary with 'migrated' (count) and 'failed' (list of
+             (name, error message))
+    """
+    source = make_backend(f"journal:{save_directory}")
+    result = {'migrated': 0, 'failed': []}
+    batch = []
+    for name in sorted(save_index.list_save_names(save_directory)):
+        try:
+            batch.append(source.load_character(name))
+        except (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError) as e:
+            result['failed'].append((name, str(e)))
+        # Only reading: do not keep journal state for every character
+        source.states.pop(name, None)
+        if len(batch) >= batch_size:
+            backend.save_characters(batch)
+            result['migrated'] += len(batch)
+            batch = []
+    if batch:
+        backend.save_characters(batch)
+        result['migrated'] += len(batch)
+    return result
+
+def export_text_save(character, export_path=None):
+    """
+    Write a character in the text save format (e.g. for reading or editing)
+
+    Args:
+        character: Character dictionary
+        export_path: File to write (default: data/exports/{name}_save.txt)
+
+    Returns: Path of the written file
+    """
+    if export_path is None:
+        export_path = os.path.join("data", "exports", character['name'] + TextSaveBackend.suffix)
+    directory = os.path.dirname(export_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(export_path, "w") as f:
+        f.write(format_text_save(character))
+    return export_path
+
+def main(argv=None):
+    """
+    Run a save maintenance command
+
+    Returns: Exit status (0 on success, 1 if any save failed)
+    """
+    parser = argparse.ArgumentParser(description="Quest Chronicles save storage tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate = commands.add_parser("migrate", help="copy file saves into an SQLite database")
+    migrate.add_argument("--from", dest="source", default="data/save_games",
+                         help="directory of save files (default: %(default)s)")
+    migrate.add_argument("--to", dest="target", default="data/save_games.db",
+                         help="SQLite database to write (default: %(default)s)")
+    migrate.add_argument("--batch-size", type=int, default=1000,
+                         help="characters per transaction (default: %(default)s)")
+    export = commands.add_parser("export", help="write one character as a text save")
+    export.add_argument("name", help="character to export")
+    export.add_argument("--from", dest="source", default="data/save_games",
+                        help="directory of save files (default: %(default)s)")
+    export.add_argument("--to", dest="target", default=None,
+                        help="text file to write (default: data/exports/NAME_save.txt)")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        try:
+            character = make_backend(f"journal:{args.source}").load_character(args.name)
+        except (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError) as e:
+            print(f"{args.name}: {e}")
+            return 1
+        print(f"Exported {args.name} to {export_text_save(character, args.target)}")
+        return 0
+
+    if not os.path.isdir(args.source):
+        print(f"No save directory at {args.source}")
+        return 1
+    backend = SQLiteSaveBackend(args.target)
+    try:
+        result = migrate_file_saves(args.source, backend, args.batch_size)
+    finally:
+        backend.close()
+
+    for name, message in result['failed']:
+        print(f"{name}: {message}")
+    print(f"Migrated {result['migrated']} character(s) to {args.target}, "
+          f"{len(result['failed'])} failed.")
+    return 1 if result['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
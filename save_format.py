@@ -0,0 +1,151 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Format Module
+
+This module encodes characters in the versioned binary save format
+({name}_save.dat). Every field of the character dictionary round-trips,
+including equipped items.
+
+Layout (little-endian, version 1):
+    header      4s magic b"QCSV", H format version, H flags (0)
+    numbers     7 x q: level, health, max_health, strength, magic,
+                experience, gold
+    counts      3 x I: lengths of inventory, active_quests, completed_quests
+    equipment   2 x B: 1 if a weapon / armor is equipped, else 0
+    lengths     one H per string below (UTF-8 byte length)
+    strings     name, class, every list item in list order, then id and
+                effect of each equipped item, as UTF-8 bytes back to back
+"""
+
+import struct
+from itertools import accumulate
+from custom_exceptions import SaveFileCorruptedError, InvalidSaveDataError
+
+SAVE_MAGIC = b"QCSV"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<4sHH")
+FIXED_V1 = struct.Struct("<4sHH7q3I2B")
+
+NUMBER_FIELDS = ("level", "health", "max_health", "strength", "magic", "experience", "gold")
+LIST_FIELDS = ("inventory", "active_quests", "completed_quests")
+EQUIPMENT_FIELDS = ("equipped_weapon", "equipped_armor")
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def encode_character(character):
+    """
+    Encode a character dictionary as a version 1 binary save
+
+    Returns: bytes
+    Raises: InvalidSaveDataError if a field is missing, has the wrong
+            type or does not fit (e.g. a string over 65535 bytes)
+    """
+    try:
+        strings = [character['name'], character['class']]
+        counts = []
+        for field in LIST_FIELDS:
+            values = character[field]
+            counts.append(len(values))
+            strings.extend(values)
+        flags = []
+        for field in EQUIPMENT_FIELDS:
+            equipped = character.get(field)
+            if equipped:
+                flags.append(1)
+                strings.append(equipped['id'])
+                strings.append(equipped['effect'])
+            else:
+                flags.append(0)
+
+        joined = "".join(strings)
+        blob = joined.encode("utf-8")
+        if len(blob) == len(joined):
+            # Pure ASCII: character lengths are byte lengths
+            sizes = map(len, strings)
+        else:
+            sizes = [len(value.encode("utf-8")) for value in strings]
+        fixed = FIXED_V1.pack(SAVE_MAGIC, FORMAT_VERSION, 0,
+                              *[character[field] for field in NUMBER_FIELDS], *counts, *flags)
+        lengths = struct.pack(f"<{len(strings)}H", *sizes)
+    except KeyError as e:
+        raise InvalidSaveDataError(f"Character data is missing key: {e}")
+    except (struct.error, AttributeError, TypeError) as e:
+        raise InvalidSaveDataError(f"Character data cannot be saved: {e}")
+    return fixed + lengths + blob
+
+# ============================================================================
+# DECODING
+# ============================================================================
+
+def decode_character(data):
+    """
+    Decode a binary save (any supported version)
+
+    Returns: Character dictionary
+    Raises:
+        SaveFileCorruptedError if the data is not a save or is damaged
+        InvalidSaveDataError if the save was written by an unknown version
+    """
+    if len(data) < HEADER.size:
+        raise SaveFileCorruptedError("Save data is too short")
+    magic, version, flags = HEADER.unpack_from(data, 0)
+    if magic != SAVE_MAGIC:
+        raise SaveFileCorruptedError("Save data does not start with the save header")
+    decoder = DECODERS.get(version)
+    if decoder is None:
+        raise InvalidSaveDataError(f"Unsupported save format version {version}")
+    try:
+        return decoder(data)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SaveFileCorruptedError(f"Save data is truncated or damaged: {e}")
+
+def decode_v1(data):
+    """
+    Decode a version 1 save
+
+    Returns: Character dictionary
+    Raises: struct.error, UnicodeDecodeError, SaveFileCorruptedError
+    """
+    values = FIXED_V1.unpack_from(data, 0)
+    counts = values[10:13]
+    flags = values[13:15]
+    string_count = 2 + sum(counts) + 2 * sum(1 for flag in flags if flag)
+
+    offset = FIXED_V1.size
+    lengths = struct.unpack_from(f"<{string_count}H", data, offset)
+    offset += 2 * string_count
+    if offset + sum(lengths) != len(data):
+        raise SaveFileCorruptedError("Save data is truncated or has trailing bytes")
+
+    region = bytes(data[offset:])
+    text = region.decode("utf-8")
+    ends = list(accumulate(lengths))
+    starts = [0] + ends[:-1]
+    if len(text) == len(region):
+        # Pure ASCII: byte offsets are character offsets
+        strings = [text[start:end] for start, end in zip(starts, ends)]
+    else:
+        strings = [region[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+
+    character = dict(zip(NUMBER_FIELDS, values[3:10]))
+    character['name'] = strings[0]
+    character['class'] = strings[1]
+    position = 2
+    for field, count in zip(LIST_FIELDS, counts):
+        character[field] = strings[position:position + count]
+        position += count
+    for field, flag in zip(EQUIPMENT_FIELDS, flags):
+        if flag:
+            character[field] = {'id': strings[position], 'effect': strings[position + 1]}
+            position += 2
+        else:
+            character[field] = None
+    return character
+
+# Format version -> decoder (older versions stay readable)
+DECODERS = {
+    1: decode_v1
+}
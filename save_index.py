@@ -0,0 +1,345 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Index Module
+
+This module keeps a small index file in the save directory with one line
+per saved character (name, class, level, gold and last-saved time), so
+load menus can list and sort saves with one read instead of opening
+every save file.
+
+The index is updated by character_manager.save_character and
+delete_character, which append one line per change (the last line for a
+name wins); the file is compacted once old lines pile up. If it is missing or corrupted it is rebuilt from the
+save files; if save files were added or removed behind its back (the
+directory changed after the index was written) it is reconciled with
+the directory listing. In a sharded directory (see save_layout.py) only
+changes to the top level are noticed this way; files copied straight
+into a shard directory show up once the index is rebuilt.
+"""
+
+import os
+import threading
+import time
+import save_format
+import save_layout
+from custom_exceptions import SaveFileCorruptedError, InvalidSaveDataError
+
+INDEX_FILENAME = "save_index.txt"
+INDEX_HEADER = "# QUEST CHRONICLES SAVE INDEX 1"
+BINARY_SUFFIX = "_save.dat"
+TEXT_SUFFIX = "_save.txt"
+SAVE_SUFFIXES = (BINARY_SUFFIX, TEXT_SUFFIX)
+
+# Fields of an index entry, each of which list_summaries can sort by
+ENTRY_FIELDS = ("name", "class", "level", "gold", "saved_at")
+
+# saved_at value marking a line that removes a character from the index
+DELETED_MARK = "-"
+
+# The index is compacted once it holds this many lines per live entry
+COMPACT_FACTOR = 2
+COMPACT_SLACK = 100
+
+# Index path -> (index mtime_ns, entries, line count) for the last index
+# read or written
+index_cache = {}
+
+# Saves may run on a background writer thread (see save_writer.py)
+index_lock = threading.RLock()
+
+# ============================================================================
+# ENTRIES
+# ============================================================================
+
+def make_entry(name, character_class, level, gold, saved_at):
+    """
+    Build one index entry
+
+    Returns: Dictionary with 'name', 'class', 'level', 'gold', 'saved_at'
+             (class, level and gold are None for unreadable save files)
+    """
+    return {'name': name, 'class': character_class, 'level': level,
+            'gold': gold, 'saved_at': saved_at}
+
+def entry_for_character(character, saved_at=None):
+    """
+    Returns: Index entry for a character dictionary that was just saved
+    """
+    return make_entry(character['name'], character['class'], character['level'],
+                      character['gold'], time.time() if saved_at is None else saved_at)
+
+def read_save_summary(save_directory, name):
+    """
+    Read the index fields from one save file (binary or text)
+
+    Returns: Index entry (with None fields if the file cannot be read)
+    """
+    layout = save_layout.get_layout(save_directory)
+    filepath = layout.locate(name, BINARY_SUFFIX)
+    if os.path.exists(filepath):
+        try:
+            saved_at = os.stat(filepath).st_mtime
+            with open(filepath, "rb") as f:
+                character = save_format.decode_character(f.read())
+            return entry_for_character(character, saved_at)
+        except (OSError, SaveFileCorruptedError, InvalidSaveDataError):
+            return make_entry(name, None, None, None, None)
+
+    filepath = layout.locate(name, TEXT_SUFFIX)
+    values = {}
+    try:
+        saved_at = os.stat(filepath).st_mtime
+        with open(filepath, "r") as f:
+            for line in f:
+                key, separator, value = line.strip().partition(": ")
+                if separator and key in ("CLASS", "LEVEL", "GOLD"):
+                    values[key] = value
+        return make_entry(name, values.get("CLASS"), int(values["LEVEL"]),
+                          int(values["GOLD"]), saved_at)
+    except (OSError, UnicodeDecodeError, KeyError, ValueError):
+        return make_entry(name, values.get("CLASS"), None, None, None)
+
+# ============================================================================
+# INDEX FILE
+# ============================================================================
+
+def get_index_path(save_directory):
+    """
+    Returns: Path of the index file for a save directory
+    """
+    return os.path.join(save_directory, INDEX_FILENAME)
+
+def list_save_names(save_directory):
+    """
+    Returns: Character names of every save file in the directory, flat
+             or sharded (a character with both a binary and a text save
+             is listed once)
+    """
+    names = {}
+    for path in save_layout.get_layout(save_directory).iter_files(SAVE_SUFFIXES):
+        filename = os.path.basename(path)
+        for suffix in SAVE_SUFFIXES:
+            if filename.endswith(suffix):
+                names[filename[:-len(suffix)]] = None
+    return list(names)
+
+def format_value(value):
+    """Format one index field ('' for None)"""
+    return "" if value is None else str(value)
+
+def parse_index_line(line):
+    """
+    Parse one "name<TAB>class<TAB>level<TAB>gold<TAB>saved_at" line
+
+    Returns: Index entry
+    Raises: ValueError if the line is malformed
+    """
+    # Split from the right so a name containing a tab survives
+    name, character_class, level, gold, saved_at = line.rsplit("\t", 4)
+    return make_entry(
+        name,
+        character_class or None,
+        int(level) if level else None,
+        int(gold) if gold else None,
+        float(saved_at) if saved_at else None
+    )
+
+def format_index_line(entry):
+    """
+    Returns: One index line (with newline) for an entry
+    """
+    return "\t".join([
+        entry['name'], format_value(entry['class']), format_value(entry['level']),
+        format_value(entry['gold']), format_value(entry['saved_at'])
+    ]) + "\n"
+
+def write_index(save_directory, entries):
+    """
+    Write the whole index file (one line per entry)
+
+    The file is rewritten in place (not replaced), so updating an
+    existing index does not change the directory's modification time.
+    """
+    index_path = get_index_path(save_directory)
+    with open(index_path, "w") as f:
+        f.write(INDEX_HEADER + "\n")
+        f.writelines(format_index_line(entry) for entry in entries.values())
+    index_cache[index_path] = (os.stat(index_path).st_mtime_ns, entries, len(entries))
+
+def append_index(save_directory, changes):
+    """
+    Apply changes to the index by appending lines
+
+    Callers check the index with read_index before changing save files,
+    so the directory is not rescanned here.
+
+    Args:
+        save_directory: Directory containing save files
+        changes: Dictionary of name -> new entry (None to remove the name)
+    """
+    with index_lock:
+        entries = read_index(save_directory, check_directory=False)
+        index_path = get_index_path(save_directory)
+        line_count = index_cache[index_path][2]
+
+        lines = []
+        for name, entry in changes.items():
+            if entry is None:
+                lines.append(f"{name}\t\t\t\t{DELETED_MARK}\n")
+            else:
+                lines.append(format_index_line(entry))
+        with open(index_path, "a") as f:
+            f.writelines(lines)
+
+        for name, entry in changes.items():
+            if entry is None:
+                entries.pop(name, None)
+            else:
+                entries[name] = entry
+        line_count += len(lines)
+        if line_count > COMPACT_FACTOR * len(entries) + COMPACT_SLACK:
+            write_index(save_directory, entries)
+        else:
+            index_cache[index_path] = (os.stat(index_path).st_mtime_ns, entries, line_count)
+
+def parse_index(index_path):
+    """
+    Read an index file, applying its lines in order
+
+    Returns: Tuple of (dictionary of name -> entry, line count), or None
+             if the file is corrupted
+    """
+    try:
+        with open(index_path, "r") as f:
+            if f.readline().rstrip("\n") != INDEX_HEADER:
+                return None
+            entries = {}
+            line_count = 0
+            for line in f:
+                line_count += 1
+                line = line.rstrip("\n")
+                if line.endswith(f"\t\t\t\t{DELETED_MARK}"):
+                    entries.pop(line[:-len(DELETED_MARK) - 4], None)
+                    continue
+                entry = parse_index_line(line)
+                entries[entry['name']] = entry
+            return entries, line_count
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+
+def rebuild_index(save_directory):
+    """
+    Rebuild the index by reading every save file
+
+    Returns: Dictionary of name -> entry
+    """
+    entries = {}
+    for name in sorted(list_save_names(save_directory)):
+        entries[name] = read_save_summary(save_directory, name)
+    write_index(save_directory, entries)
+    return entries
+
+def reconcile_index(save_directory, entries):
+    """
+    Bring an index up to date with save files added or removed behind its back
+
+    Only new save files are read; entries for missing files are dropped.
+
+    Returns: Dictionary of name -> entry
+    """
+    names = list_save_names(save_directory)
+    present = set(names)
+    reconciled = {name: entry for name, entry in entries.items() if name in present}
+    for name in sorted(names):
+        if name not in reconciled:
+            reconciled[name] = read_save_summary(save_directory, name)
+    write_index(save_directory, reconciled)
+    return reconciled
+
+def read_index(save_directory, check_directory=True):
+    """
+    Get the index for a save directory, repairing it if needed
+
+    Args:
+        save_directory: Directory containing save files
+        check_directory: False to skip looking for save files added or
+                         removed since the index was written
+
+    Returns: Dictionary of name -> entry (empty if the directory does
+             not exist)
+    """
+    with index_lock:
+        try:
+            directory_mtime = os.stat(save_directory).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        index_path = get_index_path(save_directory)
+        try:
+            index_mtime = os.stat(index_path).st_mtime_ns
+        except FileNotFoundError:
+            return rebuild_index(save_directory)
+
+        cached = index_cache.get(index_path)
+        if cached is not None and cached[0] == index_mtime:
+            entries = cached[1]
+        else:
+            parsed = parse_index(index_path)
+            if parsed is None:
+                return rebuild_index(save_directory)
+            entries, line_count = parsed
+            index_cache[index_path] = (index_mtime, entries, line_count)
+
+        if check_directory and directory_mtime > index_mtime:
+            # A save file was created or removed after the index was written
+            return reconcile_index(save_directory, entries)
+        return entries
+
+# ============================================================================
+# UPDATES AND QUERIES
+# ============================================================================
+
+def record_save(save_directory, character):
+    """Add or update a character's entry after it was saved"""
+    append_index(save_directory, {character['name']: entry_for_character(character)})
+
+def record_saves(save_directory, characters):
+    """Add or update the entries for many characters with one index write"""
+    saved_at = time.time()
+    append_index(save_directory, {
+        character['name']: entry_for_character(character, saved_at)
+        for character in characters
+    })
+
+def record_delete(save_directory, name):
+    """Remove a character's entry after its save file was deleted"""
+    append_index(save_directory, {name: None})
+
+def list_names(save_directory):
+    """
+    Returns: List of character names in the index
+    """
+    with index_lock:
+        return list(read_index(save_directory))
+
+def list_summaries(save_directory, sort_by="name", reverse=False):
+    """
+    List every save with its index fields
+
+    Args:
+        save_directory: Directory containing save files
+        sort_by: 'name', 'class', 'level', 'gold' or 'saved_at'
+        reverse: True for descending order (e.g. most recent first)
+
+    Returns: List of index entries (copies; unknown values sort last)
+    Raises: ValueError for an unknown sort_by
+    """
+    if sort_by not in ENTRY_FIELDS:
+        raise ValueError(f"Cannot sort saves by {sort_by!r}")
+    with index_lock:
+        # Copies, so callers cannot edit the cached entries
+        entries = [dict(entry) for entry in read_index(save_directory).values()]
+    known = [entry for entry in entries if entry[sort_by] is not None]
+    unknown = [entry for entry in entries if entry[sort_by] is None]
+    known.sort(key=lambda entry: entry[sort_by], reverse=reverse)
+    return known + unknown
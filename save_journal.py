@@ -0,0 +1,418 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Journal Module
+
+This module provides a journaling save backend. Instead of rewriting a
+character's whole save file, each save appends one small record with
+only what changed since the last save to the character's journal
+({name}_save.log):
+- a field that changed (level, gold, health, equipment...) is stored
+  with its new value
+- a list that only grew (items picked up, quests accepted or
+  completed) is stored as the entries added
+
+Loading reads the binary snapshot ({name}_save.dat, see save_format.py)
+and replays the journal on top of it. A journal is folded back into the
+snapshot (compacted) once it holds compact_records records, by the
+background compaction thread (start_compaction), and on close().
+
+Crash safety:
+- each record carries its length and a CRC32, so a record torn by a
+  crash is detected and dropped on load
+- each journal starts with the CRC32 of the snapshot it applies to, so
+  a journal left behind by a crash during compaction is ignored rather
+  than replayed onto the newer snapshot
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+import save_backends
+from save_backends import SAVE_FIELDS, INT_FIELDS, LIST_FIELDS, EQUIPMENT_FIELDS
+from custom_exceptions import InvalidSaveDataError, SaveFileCorruptedError
+
+JOURNAL_SUFFIX = "_save.log"
+
+# Record framing: payload length and CRC32 of the payload
+RECORD_HEADER = struct.Struct("<II")
+
+# Journal records per character before a save compacts instead of appending
+COMPACT_RECORDS = 64
+
+# Background compaction: every COMPACT_INTERVAL seconds, compact journals
+# holding at least COMPACT_MIN_RECORDS records
+COMPACT_INTERVAL = 30.0
+COMPACT_MIN_RECORDS = 8
+
+# ============================================================================
+# RECORDS
+# ============================================================================
+
+def encode_record(record):
+    """
+    Returns: One framed journal record (header + JSON payload) as bytes
+    """
+    payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def decode_records(data):
+    """
+    Split journal contents into records, stopping at the first torn or
+    corrupted record
+
+    Returns: (list of records, number of bytes holding valid records)
+    """
+    records = []
+    position = 0
+    while position + RECORD_HEADER.size <= len(data):
+        length, checksum = RECORD_HEADER.unpack_from(data, position)
+        start = position + RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            break
+        try:
+            records.append(json.loads(payload))
+        except ValueError:
+            break
+        position = start + length
+    return records, position
+
+def copy_value(value):
+    """Copy a saved field value so later edits to the character cannot change it"""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+def make_delta(saved_fields, character):
+    """
+    Compare a character with its last saved fields
+
+    Args:
+        saved_fields: Dictionary of field -> value as last saved
+        character: Character dictionary being saved
+
+    Returns: Record dictionary with 'set' (field -> new value) and/or
+             'add' (list field -> entries appended), or None if nothing
+             changed
+    Raises: KeyError if the character is missing a saved field,
+            InvalidSaveDataError if a number field is not a whole number
+    """
+    changed = {}
+    added = {}
+    for field in SAVE_FIELDS:
+        value = character.get(field) if field in EQUIPMENT_FIELDS else character[field]
+        old = saved_fields[field]
+        if value == old:
+            continue
+        if field in LIST_FIELDS and isinstance(old, list) and \
+                len(value) > len(old) and value[:len(old)] == old:
+            added[field] = value[len(old):]
+        else:
+            if field in INT_FIELDS and not isinstance(value, int):
+                raise InvalidSaveDataError(f"Field '{field}' is not a whole number: {value!r}")
+            changed[field] = value
+    record = {}
+    if changed:
+        record['set'] = changed
+    if added:
+        record['add'] = added
+    return record or None
+
+def apply_delta(fields, record):
+    """
+    Apply one journal record to a character or saved-field dictionary
+
+    Raises: InvalidSaveDataError if the record does not fit the character
+    """
+    try:
+        for field, value in record.get('set', {}).items():
+            fields[field] = copy_value(value)
+        for field, entries in record.get('add', {}).items():
+            fields[field] = fields[field] + entries
+    except (AttributeError, KeyError, TypeError) as e:
+        raise InvalidSaveDataError(f"Journal record does not match the save: {e}")
+
+# ============================================================================
+# JOURNAL BACKEND
+# ============================================================================
+
+class JournalSaveBackend(save_backends.BinarySaveBackend):
+    """
+    Binary snapshots plus an append-only journal of changes per character
+
+    Only characters this backend has loaded or saved can be journaled;
+    the first save of any other character writes a full snapshot. The
+    save index is updated on every save, but an index rebuilt from the
+    save files shows the snapshot values until the journal is compacted.
+    """
+
+    journal_suffix = JOURNAL_SUFFIX
+
+    def __init__(self, save_directory="data/save_games", compact_records=COMPACT_RECORDS):
+        super().__init__(save_directory)
+        self.compact_records = compact_records
+        # The layout lock also keeps a migration from moving files mid-save
+        self.journal_lock = self.layout.lock
+        # name -> {'fields': saved fields, 'base': snapshot CRC32,
+        #          'records': journal records, 'length': valid journal bytes}
+        self.states = {}
+        self.compactor = None
+        self.stop_compactor = threading.Event()
+        self.compaction_error = None
+
+        self.appends = 0
+        self.journal_bytes = 0
+        self.snapshots = 0
+
+    def get_journal_path(self, character_name):
+        """
+        Returns: Path of the character's journal file
+        """
+        return self.layout.locate(character_name, self.journal_suffix)
+
+    def get_signature(self, character_name):
+        """
+        Returns: Snapshot signature plus the journal's (size, mtime_ns),
+                 or None if there is no save
+        """
+        signature = super().get_signature(character_name)
+        if signature is None:
+            return None
+        try:
+            stat = os.stat(self.get_journal_path(character_name))
+        except OSError:
+            return signature
+        return signature + (stat.st_size, stat.st_mtime_ns)
+
+    # ------------------------------------------------------------------
+    # Saving
+    # ------------------------------------------------------------------
+
+    def write_character(self, character):
+        """
+        Append a character's changes to its journal, or write a snapshot
+        if it is not journaled yet or its journal is full
+
+        Raises: IOError, KeyError for incomplete characters
+        """
+        with self.journal_lock:
+            state = self.states.get(character['name'])
+            if state is None or state['records'] >= self.compact_records:
+                self.write_snapshot(character)
+                return
+            record = make_delta(state['fields'], character)
+            if record is not None:
+                self.append_record(character['name'], state, record)
+                apply_delta(state['fields'], record)
+
+    def write_snapshot(self, character):
+        """
+        Write a full snapshot and start an empty journal for it
+
+        Raises: IOError, KeyError for incomplete characters
+        """
+        name = character['name']
+        data = self.encode(character)
+        self.write_file(self.get_location(name), data)
+        self.remove_legacy(name)
+        # A crash before this removal leaves a journal whose base no
+        # longer matches the snapshot, which load_character ignores
+        try:
+            os.remove(self.get_journal_path(name))
+        except FileNotFoundError:
+            pass
+        self.states[name] = {
+            'fields': {field: copy_value(character.get(field)) for field in SAVE_FIELDS},
+            'base': zlib.crc32(data),
+            'records': 0,
+            'length': 0
+        }
+        self.snapshots += 1
+
+    def append_record(self, character_name, state, record):
+        """
+        Append one record to a character's journal, applying the
+        durability policy
+
+        Raises: IOError
+        """
+        data = encode_record(record)
+        new_journal = state['length'] == 0
+        if new_journal:
+            data = encode_record({'base': state['base']}) + data
+        path = self.get_journal_path(character_name)
+        with open(path, "ab") as f:
+            if f.tell() != state['length']:
+                f.truncate(state['length'])     # Drop a torn or stale tail
+            f.write(data)
+            if self.durability == "per-save":
+                f.flush()
+                os.fsync(f.fileno())
+        state['length'] += len(data)
+        state['records'] += 1
+        self.appends += 1
+        self.journal_bytes += len(data)
+
+        if self.durability == "per-save":
+            if new_journal:
+                save_backends.fsync_directory(os.path.dirname(path))
+        elif self.durability == "periodic":
+            with self.lock:
+                self.unsynced.add(path)
+            if time.monotonic() - self.last_sync >= self.sync_interval:
+                self.sync()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load_character(self, character_name):
+        """
+        Read a character's snapshot and replay its journal
+
+        Returns: Character dictionary
+        Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+        """
+        with self.journal_lock:
+            path = self.get_location(character_name)
+            if not os.path.exists(path):
+                self.states.pop(character_name, None)
+                return super().load_character(character_name)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                raise SaveFileCorruptedError(f"Could not read save file: {e}")
+            character = self.decode(data)
+            base = zlib.crc32(data)
+
+            records, length = self.read_journal(character_name, base)
+            for record in records:
+                apply_delta(character, record)
+
+            self.states[character_name] = {
+                'fields': {field: copy_value(character.get(field)) for field in SAVE_FIELDS},
+                'base': base,
+                'records': len(records),
+                'length': length
+            }
+            return character
+
+    def read_journal(self, character_name, base):
+        """
+        Read the journal records that apply to a snapshot
+
+        Returns: (list of change records, bytes of the journal to keep);
+                 ([], 0) if there is no journal or it belongs to an
+                 older snapshot
+        """
+        try:
+            with open(self.get_journal_path(character_name), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+        except OSError as e:
+            raise SaveFileCorruptedError(f"Could not read save journal: {e}")
+        records, length = decode_records(data)
+        if not records or records[0].get('base') != base:
+            return [], 0
+        return records[1:], length
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self, character_name):
+        """
+        Fold a character's journal into a new snapshot
+
+        Returns: True if there was a journal to compact
+        Raises: IOError
+        """
+        with self.journal_lock:
+            state = self.states.get(character_name)
+            if state is None or state['records'] == 0:
+                return False
+            character = {field: copy_value(value) for field, value in state['fields'].items()}
+            self.write_snapshot(character)
+            return True
+
+    def compact_all(self, min_records=1):
+        """
+        Compact every journal holding at least min_records records
+
+        Returns: Number of journals compacted
+        Raises: IOError
+        """
+        with self.journal_lock:
+            names = [name for name, state in self.states.items() if state['records'] >= min_records]
+        return sum(self.compact(name) for name in names)
+
+    def start_compaction(self, interval=COMPACT_INTERVAL, min_records=COMPACT_MIN_RECORDS):
+        """
+        Compact journals on a background thread every interval seconds
+
+        Errors are kept in compaction_error; the journals they affect stay
+        valid and are compacted on a later pass.
+        """
+        if self.compactor is not None:
+            return
+        self.stop_compactor.clear()
+
+        def run():
+            while not self.stop_compactor.wait(interval):
+                try:
+                    self.compact_all(min_records)
+                except (IOError, InvalidSaveDataError) as e:
+                    self.compaction_error = e
+
+        self.compactor = threading.Thread(target=run, name="journal-compactor", daemon=True)
+        self.compactor.start()
+
+    def stop_compaction(self):
+        """Stop the background compaction thread, if it is running"""
+        if self.compactor is not None:
+            self.stop_compactor.set()
+            self.compactor.join()
+            self.compactor = None
+
+    # ------------------------------------------------------------------
+    # Other operations
+    # ------------------------------------------------------------------
+
+    def delete_character(self, character_name):
+        """
+        Delete a character's snapshot and journal
+
+        Raises: CharacterNotFoundError if there is no save file
+        """
+        with self.journal_lock:
+            super().delete_character(character_name)
+            self.states.pop(character_name, None)
+            try:
+                os.remove(self.get_journal_path(character_name))
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        """Stop background compaction and fold every journal into its snapshot"""
+        self.stop_compaction()
+        self.compact_all()
+        super().close()
+
+    def get_stats(self):
+        """
+        Returns: Dictionary with 'appends' (journal records written),
+                 'journal_bytes' (bytes appended), 'snapshots' (full
+                 snapshots written) and 'journaled' (characters with a
+                 non-empty journal)
+        """
+        with self.journal_lock:
+            journaled = sum(1 for state in self.states.values() if state['records'])
+        return {'appends': self.appends, 'journal_bytes': self.journal_bytes,
+                'snapshots': self.snapshots, 'journaled': journaled}
@@ -0,0 +1,262 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Layout Module
+
+This module decides where a character's save files live in a save
+directory. Two layouts are supported:
+- flat: every file directly in the save directory
+  (data/save_games/Ayla_save.dat)
+- sharded: files spread over two levels of hash-prefix subdirectories
+  (data/save_games/3f/a2/Ayla_save.dat), so no directory holds more
+  than a few files even with millions of saves
+
+The layout of a directory is recorded in its LAYOUT_FILENAME file (no
+file means flat). migrate_to_sharded moves a flat directory over while
+it stays in use: lookups fall back to the flat path for files that are
+not in their shard, and each character's files are moved under the
+layout's lock, which every backend in the process holds while it reads
+or writes that directory.
+
+Other processes (e.g. the game while the command line tool migrates)
+notice the change the first time a flat lookup misses. Files they wrote
+flat in the meantime stay readable through the fallback, and running
+the migration again moves them.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import threading
+
+LAYOUT_FILENAME = "save_layout.txt"
+
+FLAT = "flat"
+MIGRATING = "migrating"     # Sharded, with some files still flat
+SHARDED = "sharded"
+LAYOUT_MODES = (FLAT, MIGRATING, SHARDED)
+
+# Subdirectory levels and hex digits per level in the sharded layout
+SHARD_LEVELS = 2
+SHARD_WIDTH = 2
+
+# Every file that belongs to a character, moved together by migrations
+CHARACTER_SUFFIXES = ("_save.dat", "_save.txt", "_save.log")
+
+# Where each shard level's digits start in the hex digest of a name
+SHARD_STARTS = tuple(range(0, SHARD_LEVELS * SHARD_WIDTH, SHARD_WIDTH))
+
+# Save directory -> SaveLayout shared by everything in this process
+layouts = {}
+layouts_lock = threading.Lock()
+
+def get_shard_path(character_name):
+    """
+    Returns: Relative shard directory for a name (e.g. "3f/a2")
+    """
+    digest = hashlib.blake2b(character_name.encode("utf-8"),
+                             digest_size=SHARD_LEVELS * SHARD_WIDTH // 2).hexdigest()
+    return os.sep.join([digest[start:start + SHARD_WIDTH] for start in SHARD_STARTS])
+
+def is_shard_name(name):
+    """
+    Returns: True if a directory name could be one shard level
+    """
+    return len(name) == SHARD_WIDTH and all(c in "0123456789abcdef" for c in name)
+
+class SaveLayout:
+    """
+    Path resolver for one save directory
+
+    Get instances with get_layout() so every backend in the process
+    shares the same mode and lock.
+    """
+
+    def __init__(self, save_directory):
+        self.save_directory = save_directory
+        self.prefix = os.path.join(save_directory, "")     # Paths are built on every lookup
+        self.lock = threading.RLock()
+        self.created = set()        # shard directories known to exist
+        self.mode = self.read_mode()
+
+    def refresh_mode(self):
+        """
+        Pick up a layout change made by another process
+
+        Returns: The current mode
+        """
+        if os.path.exists(os.path.join(self.save_directory, LAYOUT_FILENAME)):
+            self.mode = self.read_mode()
+        return self.mode
+
+    def read_mode(self):
+        """
+        Returns: Layout mode recorded in the directory (FLAT if none)
+        """
+        try:
+            with open(os.path.join(self.save_directory, LAYOUT_FILENAME)) as f:
+                mode = f.read().strip()
+        except FileNotFoundError:
+            return FLAT
+        return mode if mode in LAYOUT_MODES else FLAT
+
+    def set_mode(self, mode):
+        """Record a new layout mode in the directory"""
+        os.makedirs(self.save_directory, exist_ok=True)
+        path = os.path.join(self.save_directory, LAYOUT_FILENAME)
+        with open(path + ".tmp", "w") as f:
+            f.write(mode + "\n")
+        os.replace(path + ".tmp", path)
+        self.mode = mode
+
+    def get_flat_path(self, filename):
+        """
+        Returns: Path of a file directly in the save directory
+        """
+        return self.prefix + filename
+
+    def get_sharded_path(self, character_name, filename):
+        """
+        Returns: Path of a character's file in its shard directory
+        """
+        return self.prefix + get_shard_path(character_name) + os.sep + filename
+
+    def locate(self, character_name, suffix):
+        """
+        Resolve where one of a character's files lives (or would be written)
+
+        Args:
+            character_name: Character name
+            suffix: File suffix, e.g. "_save.dat"
+
+        Returns: File path
+        """
+        filename = character_name + suffix
+        flat_path = self.get_flat_path(filename)
+        if self.mode == FLAT:
+            if os.path.exists(flat_path) or self.refresh_mode() == FLAT:
+                return flat_path
+        sharded_path = self.get_sharded_path(character_name, filename)
+        if not os.path.exists(sharded_path) and os.path.exists(flat_path):
+            # Not moved yet, or written by a process still using the flat layout
+            return flat_path
+        return sharded_path
+
+    def make_directory(self, path):
+        """
+        Create the directory a file will be written to, if needed
+
+        Returns: List of directories that gained an entry (the parents of
+                 the directories created), for callers that fsync them
+        """
+        directory = os.path.dirname(path)
+        if directory in self.created:
+            return []
+        missing = []
+        parent = directory
+        while parent and not os.path.isdir(parent):
+            missing.append(parent)
+            parent = os.path.dirname(parent)
+        os.makedirs(directory, exist_ok=True)
+        self.created.add(directory)
+        return [os.path.dirname(created) or os.curdir for created in missing]
+
+    def iter_files(self, suffixes):
+        """
+        Walk every character file in the directory, flat or sharded
+
+        Args:
+            suffixes: Tuple of file suffixes to include
+
+        Yields: Paths relative to the save directory
+        """
+        if not os.path.isdir(self.save_directory):
+            return
+        yield from self.iter_level(self.save_directory, "", 0, suffixes)
+
+    def iter_level(self, directory, prefix, level, suffixes):
+        """Walk one directory level (files, then shard subdirectories)"""
+        subdirectories = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffixes) and entry.is_file():
+                    yield prefix + entry.name
+                elif level < SHARD_LEVELS and is_shard_name(entry.name) and entry.is_dir():
+                    subdirectories.append(entry.name)
+        for name in subdirectories:
+            yield from self.iter_level(os.path.join(directory, name), prefix + name + os.sep,
+                                       level + 1, suffixes)
+
+def get_layout(save_directory):
+    """
+    Returns: The shared SaveLayout for a save directory
+    """
+    key = os.path.abspath(save_directory)
+    with layouts_lock:
+        layout = layouts.get(key)
+        if layout is None:
+            layout = layouts[key] = SaveLayout(save_directory)
+        return layout
+
+# ============================================================================
+# MIGRATION
+# ============================================================================
+
+def migrate_to_sharded(save_directory="data/save_games"):
+    """
+    Move a flat save directory to the sharded layout
+
+    Safe to run while the game uses the directory, and to run again
+    after an interruption or to move files that another process wrote
+    flat while it ran. New saves go to shard directories as soon as it
+    starts.
+
+    Returns: Number of files moved
+    """
+    layout = get_layout(save_directory)
+    if layout.refresh_mode() != SHARDED:
+        layout.set_mode(MIGRATING)
+
+    moved = 0
+    filenames = [name for name in os.listdir(save_directory) if name.endswith(CHARACTER_SUFFIXES)]
+    for filename in filenames:
+        suffix = next(suffix for suffix in CHARACTER_SUFFIXES if filename.endswith(suffix))
+        character_name = filename[:-len(suffix)]
+        with layout.lock:
+            flat_path = layout.get_flat_path(filename)
+            sharded_path = layout.get_sharded_path(character_name, filename)
+            if not os.path.exists(flat_path):
+                continue
+            if os.path.exists(sharded_path):
+                # Both copies exist when another process saved during the
+                # migration; keep whichever was written last
+                if os.stat(flat_path).st_mtime_ns > os.stat(sharded_path).st_mtime_ns:
+                    os.replace(flat_path, sharded_path)
+                    moved += 1
+                else:
+                    os.remove(flat_path)
+                continue
+            layout.make_directory(sharded_path)
+            os.replace(flat_path, sharded_path)
+            moved += 1
+
+    layout.set_mode(SHARDED)
+    return moved
+
+def main(argv=None):
+    """
+    Move a save directory to the sharded layout
+
+    Returns: Exit status
+    """
+    parser = argparse.ArgumentParser(description="Shard a Quest Chronicles save directory.")
+    parser.add_argument("--save-dir", default="data/save_games",
+                        help="save directory to migrate (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    moved = migrate_to_sharded(args.save_dir)
+    print(f"Moved {moved} file(s); {args.save_dir} now uses the sharded layout.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
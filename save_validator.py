@@ -0,0 +1,250 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Validator Module
+
+Checks every save file in a save directory for the problems
+load_character would raise (SaveFileCorruptedError,
+InvalidSaveDataError) and writes a JSON report. Optionally moves bad
+saves into a quarantine directory so the game no longer lists them.
+
+Sharded save directories (see save_layout.py) are walked shard by shard.
+
+Command line usage:
+    python save_validator.py [--save-dir DIR] [--workers N] [--report PATH] [--quarantine]
+
+The directory is read in chunks of file names, and with --workers the
+chunks are checked in parallel worker processes.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+import character_manager
+import save_index
+import save_journal
+import save_layout
+from custom_exceptions import SaveFileCorruptedError, InvalidSaveDataError
+
+# Save files handed to a worker at a time
+CHUNK_SIZE = 500
+
+# Subdirectory of the save directory that bad saves are moved into
+QUARANTINE_DIR = "quarantine"
+
+# ============================================================================
+# CHECKING SAVE FILES
+# ============================================================================
+
+def make_problem(filename, name, error):
+    """
+    Build one report entry for a bad save
+
+    Returns: Dictionary with 'file', 'name', 'error' (exception class
+             name) and 'message'
+    """
+    return {'file': filename, 'name': name, 'error': type(error).__name__, 'message': str(error)}
+
+def check_save_file(backend, filename):
+    """
+    Read and validate one save file the way load_character would
+
+    Binary saves are checked together with their journal, if any. A
+    text save is skipped when the character also has a binary save,
+    since load_character never reads it.
+
+    Args:
+        backend: save_journal.JournalSaveBackend for the save directory
+        filename: Save file path relative to the directory
+
+    Returns: Report entry if the save is bad, None if it loads (or is
+             a text save shadowed by a binary one)
+    """
+    binary = filename.endswith(save_index.BINARY_SUFFIX)
+    basename = os.path.basename(filename)
+    if binary:
+        name = basename[:-len(save_index.BINARY_SUFFIX)]
+    else:
+        name = basename[:-len(save_index.TEXT_SUFFIX)]
+        if os.path.exists(backend.get_location(name)):
+            return None
+    try:
+        try:
+            with open(os.path.join(backend.save_directory, filename), "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise SaveFileCorruptedError(f"Could not read save file: {e}")
+        if binary:
+            character = backend.decode(data)
+            records, length = backend.read_journal(name, zlib.crc32(data))
+            for record in records:
+                save_journal.apply_delta(character, record)
+        else:
+            character = backend.legacy.decode(data)
+        character_manager.validate_character_data(character)
+    except (SaveFileCorruptedError, InvalidSaveDataError) as e:
+        return make_problem(filename, name, e)
+    return None
+
+def check_save_chunk(save_directory, filenames):
+    """
+    Check a chunk of save files (runs in a worker process)
+
+    Returns: List of report entries for the bad saves
+    """
+    backend = save_journal.JournalSaveBackend(save_directory)
+    problems = []
+    for filename in filenames:
+        problem = check_save_file(backend, filename)
+        if problem is not None:
+            problems.append(problem)
+    return problems
+
+def iter_save_chunks(save_directory, chunk_size=CHUNK_SIZE):
+    """
+    Stream the save file names of a directory in chunks
+
+    Yields: Lists of up to chunk_size file paths relative to the
+            directory (none if the directory does not exist)
+    """
+    chunk = []
+    for filename in save_layout.get_layout(save_directory).iter_files(save_index.SAVE_SUFFIXES):
+        chunk.append(filename)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# ============================================================================
+# DIRECTORY VALIDATION
+# ============================================================================
+
+def validate_save_directory(save_directory="data/save_games", workers=1, quarantine=False,
+                            chunk_size=CHUNK_SIZE):
+    """
+    Check every save in a directory and collect the bad ones
+
+    Args:
+        save_directory: Directory containing save files
+        workers: Worker processes (1 = check in this process,
+                 0 = one per CPU core)
+        quarantine: True to move bad saves (and their journals) into
+                    save_directory/quarantine
+        chunk_size: Save files per worker task
+
+    Returns: Report dictionary with 'save_directory', 'checked',
+             'bad', 'problems' (report entries in file order),
+             'quarantined' (file names moved) and 'seconds'
+    """
+    start = time.perf_counter()
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    checked = 0
+    problems = []
+    if workers == 1:
+        for chunk in iter_save_chunks(save_directory, chunk_size):
+            checked += len(chunk)
+            problems.extend(check_save_chunk(save_directory, chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep a few chunks per worker in flight so the file list is
+            # never held in memory all at once
+            pending = []
+            for chunk in iter_save_chunks(save_directory, chunk_size):
+                checked += len(chunk)
+                pending.append(executor.submit(check_save_chunk, save_directory, chunk))
+                if len(pending) >= 2 * workers:
+                    problems.extend(pending.pop(0).result())
+            for future in pending:
+                problems.extend(future.result())
+    problems.sort(key=lambda problem: problem['file'])
+
+    quarantined = quarantine_saves(save_directory, problems) if quarantine and problems else []
+    return {
+        'save_directory': save_directory,
+        'checked': checked,
+        'bad': len(problems),
+        'problems': problems,
+        'quarantined': quarantined,
+        'seconds': round(time.perf_counter() - start, 3)
+    }
+
+def get_quarantine_path(quarantine_directory, filename):
+    """
+    Pick a free name in the quarantine directory, so a file quarantined
+    earlier under the same name is kept ("Ayla_save.dat", then
+    "Ayla_save.dat.1", "Ayla_save.dat.2", ...)
+
+    Returns: Path to move the file to
+    """
+    path = os.path.join(quarantine_directory, filename)
+    counter = 0
+    while os.path.exists(path):
+        counter += 1
+        path = os.path.join(quarantine_directory, f"{filename}.{counter}")
+    return path
+
+def quarantine_saves(save_directory, problems):
+    """
+    Move bad save files, and the journals of bad binary saves, aside
+
+    The save index is brought up to date afterwards, so the moved
+    characters disappear from the load menu.
+
+    Returns: List of file paths moved (relative to the save directory)
+    """
+    quarantine_directory = os.path.join(save_directory, QUARANTINE_DIR)
+    os.makedirs(quarantine_directory, exist_ok=True)
+    layout = save_layout.get_layout(save_directory)
+    moved = []
+    for problem in problems:
+        paths = [os.path.join(save_directory, problem['file'])]
+        if problem['file'].endswith(save_index.BINARY_SUFFIX):
+            paths.append(layout.locate(problem['name'], save_journal.JOURNAL_SUFFIX))
+        for path in paths:
+            try:
+                os.replace(path, get_quarantine_path(quarantine_directory, os.path.basename(path)))
+            except FileNotFoundError:
+                continue
+            moved.append(os.path.relpath(path, save_directory))
+    save_index.read_index(save_directory)
+    return moved
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main(argv=None):
+    """
+    Validate a save directory and write the JSON report
+
+    Returns: Exit status (0 if every save loads, 1 otherwise)
+    """
+    parser = argparse.ArgumentParser(description="Validate Quest Chronicles save files.")
+    parser.add_argument("--save-dir", default="data/save_games",
+                        help="save directory to check (default: %(default)s)")
+    parser.add_argument("-j", "--workers", type=int, default=0,
+                        help="worker processes (0 = one per core, the default)")
+    parser.add_argument("--report", help="write the JSON report here instead of to stdout")
+    parser.add_argument("--quarantine", action="store_true",
+                        help=f"move bad saves into SAVE_DIR/{QUARANTINE_DIR}")
+    args = parser.parse_args(argv)
+
+    report = validate_save_directory(args.save_dir, args.workers, args.quarantine)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"{report['bad']} bad save(s) out of {report['checked']} in {args.save_dir}; "
+              f"report written to {args.report}")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 1 if report['bad'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
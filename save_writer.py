@@ -0,0 +1,222 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Writer Module
+
+This module moves save writes off the game thread. Saves are handed to
+a background writer thread through a bounded queue:
+- a save for a character already waiting in the queue replaces the
+  waiting copy instead of queueing a second write
+- when max_pending different characters are waiting, submit() blocks
+  until the writer catches up, so memory use stays bounded
+- flush() waits until every submitted save is written (and, with the
+  periodic fsync policy, forced to disk) and reports any failed writes
+
+Write failures cannot be raised where the save was requested, so they
+are kept and raised as an IOError by the next flush().
+"""
+
+import queue
+import threading
+import save_backends
+
+DEFAULT_MAX_PENDING = 64
+
+# Queued in place of a location to stop the writer thread
+STOP = None
+
+class SaveWriter:
+    """
+    Background thread that writes saves in the order they were submitted
+
+    Counters:
+        submitted: saves handed to the writer
+        written: saves written by the writer thread
+        coalesced: saves that replaced a copy still waiting in the queue
+        failed: writes that raised an error
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING, fsync_policy="none",
+                 sync_interval=save_backends.DEFAULT_SYNC_INTERVAL, on_failure=None):
+        """
+        Start the writer thread
+
+        Args:
+            max_pending: Characters that may wait in the queue at once
+            fsync_policy: 'none', 'per-save' or 'periodic' (the backends
+                          apply it to each write; with 'periodic' the
+                          writer also syncs when idle and on flush)
+            sync_interval: Seconds between periodic syncs
+            on_failure: Optional function(location, error) called on the
+                        writer thread when a write fails
+
+        Raises: ValueError for an unknown fsync policy
+        """
+        save_backends.check_durability(fsync_policy)
+        self.fsync_policy = fsync_policy
+        self.sync_interval = sync_interval
+        self.on_failure = on_failure
+
+        self.queue = queue.Queue(max_pending)
+        self.lock = threading.Lock()
+        self.pending = {}       # location -> (backend, character) waiting in the queue
+        self.in_flight = {}     # location -> character being written right now
+        self.unsynced = {}      # id(backend) -> backend written since its last sync
+        self.errors = []        # (location, error) not yet reported by flush()
+        self.closed = False
+
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+
+        self.thread = threading.Thread(target=self.run, name="save-writer", daemon=True)
+        self.thread.start()
+
+    # ------------------------------------------------------------------
+    # Game thread
+    # ------------------------------------------------------------------
+
+    def submit(self, backend, location, character):
+        """
+        Queue a character to be written
+
+        The character is kept as given, so pass a copy if the caller
+        will keep changing it.
+
+        Args:
+            backend: save_backends backend to write through
+            location: backend.get_location(name) for the character
+            character: Character dictionary to save
+
+        Raises: IOError if the writer has been closed
+        """
+        with self.lock:
+            if self.closed:
+                raise IOError("Save writer is closed")
+            self.submitted += 1
+            if location in self.pending:
+                self.pending[location] = (backend, character)
+                self.coalesced += 1
+                return
+            self.pending[location] = (backend, character)
+        # Blocks while the queue is full
+        self.queue.put(location)
+
+    def get_pending(self, location):
+        """
+        Get the newest copy of a character that is not on disk yet
+
+        Returns: Character dictionary, or None if nothing is waiting
+        """
+        with self.lock:
+            if location in self.pending:
+                return self.pending[location][1]
+            return self.in_flight.get(location)
+
+    def flush(self):
+        """
+        Wait until every submitted save has been written
+
+        With the periodic fsync policy the written saves are also
+        forced to disk before this returns.
+
+        Returns: Number of saves written so far
+        Raises: IOError if any write failed since the last flush
+        """
+        self.queue.join()
+        if self.fsync_policy == "periodic":
+            self.sync()
+        with self.lock:
+            errors = self.errors
+            self.errors = []
+        if errors:
+            location, error = errors[0]
+            raise IOError(f"{len(errors)} background save(s) failed; "
+                          f"first was {location}: {error}") from error
+        return self.written
+
+    def close(self):
+        """
+        Flush and stop the writer thread (safe to call more than once)
+
+        Raises: IOError if any write failed since the last flush
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+        try:
+            self.flush()
+        finally:
+            self.queue.put(STOP)
+            self.thread.join()
+
+    def get_stats(self):
+        """
+        Returns: Dictionary with 'submitted', 'written', 'coalesced',
+                 'failed' and 'pending' counts
+        """
+        with self.lock:
+            return {
+                'submitted': self.submitted,
+                'written': self.written,
+                'coalesced': self.coalesced,
+                'failed': self.failed,
+                'pending': len(self.pending)
+            }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def run(self):
+        """Write queued saves until STOP is queued"""
+        while True:
+            try:
+                location = self.queue.get(timeout=self.sync_interval if self.unsynced else None)
+            except queue.Empty:
+                # Idle with periodic writes not yet on disk
+                self.sync()
+                continue
+            try:
+                if location is STOP:
+                    return
+                self.write(location)
+            finally:
+                self.queue.task_done()
+
+    def write(self, location):
+        """Write the newest copy of one queued character"""
+        with self.lock:
+            backend, character = self.pending.pop(location)
+            self.in_flight[location] = character
+        try:
+            backend.save_character(character)
+        except Exception as e:
+            # Any error (e.g. InvalidSaveDataError from encoding a bad
+            # field) is reported by flush(); the thread must keep running
+            with self.lock:
+                self.failed += 1
+                self.errors.append((location, e))
+            if self.on_failure is not None:
+                self.on_failure(location, e)
+        else:
+            with self.lock:
+                self.written += 1
+                if self.fsync_policy == "periodic":
+                    self.unsynced[id(backend)] = backend
+        finally:
+            with self.lock:
+                self.in_flight.pop(location, None)
+
+    def sync(self):
+        """Force every backend written since its last sync to disk"""
+        with self.lock:
+            backends = list(self.unsynced.values())
+            self.unsynced = {}
+        for backend in backends:
+            try:
+                backend.sync()
+            except IOError as e:
+                with self.lock:
+                    self.errors.append((f"sync of {type(backend).__name__}", e))
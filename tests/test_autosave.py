@@ -0,0 +1,111 @@
+"""
+Test Autosave
+Tests that the write-behind save scheduler coalesces saves and never
+drops pending changes
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from autosave import SaveScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_scheduler(**policy):
+    saves = []
+    clock = FakeClock()
+    scheduler = SaveScheduler(save_function=lambda character: saves.append(dict(character)),
+                              clock=clock, **policy)
+    return scheduler, saves, clock
+
+def test_action_count_coalesces_saves():
+    """Test that saves happen once every max_actions requests"""
+    scheduler, saves, clock = make_scheduler(interval=0, max_actions=3)
+    character = {'name': 'Hero', 'gold': 0}
+
+    for gold in range(7):
+        character['gold'] = gold
+        scheduler.request_save(character)
+
+    assert [save['gold'] for save in saves] == [2, 5]
+    assert scheduler.get_stats() == {'requested': 7, 'performed': 2, 'coalesced': 5}
+
+def test_interval_triggers_save():
+    """Test that a change is written once the interval has passed"""
+    scheduler, saves, clock = make_scheduler(interval=5, max_actions=0)
+    character = {'name': 'Hero'}
+
+    assert scheduler.request_save(character) is False
+    clock.now = 4.9
+    assert scheduler.request_save(character) is False
+    clock.now = 5.0
+    assert scheduler.request_save(character) is True
+    assert len(saves) == 1
+
+def test_flush_writes_pending_changes_once():
+    """Test that flush saves dirty state and is a no-op when clean"""
+    scheduler, saves, clock = make_scheduler(interval=0, max_actions=0)
+    scheduler.request_save({'name': 'Hero'})
+
+    assert scheduler.flush() is True
+    assert scheduler.flush() is False
+    assert len(saves) == 1
+
+def test_switching_characters_saves_previous():
+    """Test that a pending save is not lost when another character is requested"""
+    scheduler, saves, clock = make_scheduler(interval=0, max_actions=0)
+    scheduler.request_save({'name': 'First'})
+    scheduler.request_save({'name': 'Second'})
+
+    assert [save['name'] for save in saves] == ['First']
+    scheduler.flush()
+    assert [save['name'] for save in saves] == ['First', 'Second']
+
+def test_failed_save_stays_dirty():
+    """Test that a failed write is retried by the next flush"""
+    attempts = []
+
+    def flaky_save(character):
+        attempts.append(character['name'])
+        if len(attempts) == 1:
+            raise IOError("disk full")
+
+    scheduler = SaveScheduler(interval=0, max_actions=1, save_function=flaky_save)
+    with pytest.raises(IOError):
+        scheduler.request_save({'name': 'Hero'})
+    assert scheduler.flush() is True
+    assert scheduler.get_stats()['performed'] == 1
+
+def test_default_save_function_writes_file(tmp_path):
+    """Test flushing through character_manager.save_character"""
+    character = character_manager.create_character("AutoHero", "Mage")
+    scheduler = SaveScheduler(interval=0, max_actions=0,
+                              save_function=lambda c: character_manager.save_character(c, str(tmp_path)))
+    scheduler.request_save(character)
+    assert not os.path.exists(tmp_path / "AutoHero_save.dat")
+
+    scheduler.flush()
+    assert os.path.exists(tmp_path / "AutoHero_save.dat")
+
+def test_unchanged_character_is_not_counted(tmp_path):
+    """Test that a flush the save function skips is not counted as a write"""
+    character = character_manager.create_character("SameHero", "Rogue")
+    scheduler = SaveScheduler(interval=0, max_actions=1,
+                              save_function=lambda c: character_manager.save_if_changed(c, str(tmp_path)))
+    assert scheduler.request_save(character) is True
+    assert scheduler.request_save(character) is False
+    character['gold'] += 5
+    assert scheduler.request_save(character) is True
+    assert scheduler.get_stats() == {'requested': 3, 'performed': 2, 'coalesced': 1}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,64 @@
+"""
+Test Block Parser
+Tests that the single-pass block parsers agree with the reference parsers
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError
+import game_data
+
+QUEST_LINES = [
+    "QUEST_ID: test_quest",
+    "TITLE: Test: The Sequel",
+    "DESCRIPTION: A test",
+    "REWARD_XP: 50",
+    "REWARD_GOLD: 25",
+    "REQUIRED_LEVEL: 1",
+    "PREREQUISITE: NONE"
+]
+
+def parse_both(lines):
+    """Run the fast and reference quest parsers and return both outcomes"""
+    outcomes = []
+    for parser in (game_data.parse_quest_block, game_data.parse_quest_block_strict):
+        try:
+            outcomes.append(parser(lines))
+        except InvalidDataFormatError as e:
+            outcomes.append(str(e))
+    return outcomes
+
+@pytest.mark.parametrize("lines", [
+    QUEST_LINES,
+    QUEST_LINES[::-1],
+    [line.lower() if line.startswith("TITLE") else line for line in QUEST_LINES],
+    QUEST_LINES + ["EXTRA_FIELD: ignored"],
+    QUEST_LINES[:-1],
+    QUEST_LINES[:3] + ["REWARD_XP: lots"] + QUEST_LINES[4:],
+    QUEST_LINES[:3] + ["REWARD_XP 50"] + QUEST_LINES[4:],
+])
+def test_fast_parser_matches_reference(lines):
+    """Test that results and error messages match the reference parser"""
+    fast, reference = parse_both(lines)
+    assert fast == reference
+
+def test_fast_parser_keeps_field_order():
+    """Test that parsed quests list fields in schema order"""
+    quest = game_data.parse_quest_block(QUEST_LINES[::-1])
+    assert list(quest) == [name for name, converter in game_data.QUEST_FIELDS]
+
+def test_item_parser_types():
+    """Test that item cost is converted to an integer"""
+    item = game_data.parse_item_block([
+        "ITEM_ID: iron_sword", "NAME: Iron Sword", "TYPE: weapon",
+        "EFFECT: strength:5", "COST: 100", "DESCRIPTION: A sword"
+    ])
+    assert item['cost'] == 100
+    assert item['effect'] == "strength:5"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,89 @@
+"""
+Test Catalog Cache
+Tests that the binary sidecar cache returns the same catalog as a parse
+and is rebuilt when the source file changes
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catalog_cache
+import game_data
+
+QUEST_TEXT = """QUEST_ID: first_quest
+TITLE: First Quest
+DESCRIPTION: The first quest
+REWARD_XP: 50
+REWARD_GOLD: 25
+REQUIRED_LEVEL: 1
+PREREQUISITE: NONE
+"""
+
+def test_cache_matches_parse(tmp_path):
+    """Test that a cached load returns the same catalog as a plain parse"""
+    quest_file = str(tmp_path / "quests.txt")
+    with open(quest_file, "w") as f:
+        f.write(QUEST_TEXT)
+
+    parsed = game_data.load_quests(quest_file)
+    first = game_data.load_quests(quest_file, use_cache=True)
+    assert os.path.exists(catalog_cache.get_cache_path(quest_file))
+
+    second = game_data.load_quests(quest_file, use_cache=True)
+    assert first == parsed
+    assert second == parsed
+
+def test_cache_rebuilds_when_source_changes(tmp_path):
+    """Test that editing the source file invalidates the cache"""
+    quest_file = str(tmp_path / "quests.txt")
+    with open(quest_file, "w") as f:
+        f.write(QUEST_TEXT)
+    game_data.load_quests(quest_file, use_cache=True)
+
+    with open(quest_file, "w") as f:
+        f.write(QUEST_TEXT.replace("REWARD_XP: 50", "REWARD_XP: 75"))
+
+    quests = game_data.load_quests(quest_file, use_cache=True)
+    assert quests['first_quest']['reward_xp'] == 75
+
+def test_cache_survives_touch(tmp_path):
+    """Test that a changed mtime with unchanged content still uses the cache"""
+    quest_file = str(tmp_path / "quests.txt")
+    with open(quest_file, "w") as f:
+        f.write(QUEST_TEXT)
+    expected = game_data.load_quests(quest_file, use_cache=True)
+
+    stat = os.stat(quest_file)
+    os.utime(quest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert catalog_cache.read_cache(quest_file, game_data.QUEST_CACHE_SCHEMA) == expected
+
+def test_cached_records_keep_pooled_strings(tmp_path):
+    """Test that a warm cache load re-interns the pooled fields"""
+    quest_file = str(tmp_path / "quests.txt")
+    with open(quest_file, "w") as f:
+        f.write(QUEST_TEXT + "\n" + QUEST_TEXT.replace("first_quest", "second_quest")
+                .replace("PREREQUISITE: NONE", "PREREQUISITE: first_quest"))
+    game_data.load_quests(quest_file, use_cache=True)
+    quests = game_data.load_quests(quest_file, use_cache=True)
+
+    first_id = quests['first_quest']['quest_id']
+    assert first_id is sys.intern("first_quest")
+    assert quests['second_quest']['prerequisite'] is first_id
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    """Test that a damaged sidecar falls back to parsing"""
+    quest_file = str(tmp_path / "quests.txt")
+    with open(quest_file, "w") as f:
+        f.write(QUEST_TEXT)
+    with open(catalog_cache.get_cache_path(quest_file), "wb") as f:
+        f.write(b"not a cache")
+
+    quests = game_data.load_quests(quest_file, use_cache=True)
+    assert 'first_quest' in quests
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Test Catalog Validator
+Tests that data validation reports every error with file, line and field
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError
+import catalog_validator
+import game_data
+
+def test_validate_item_data_rejects_bad_type():
+    """Test that validate_item_data raises for an unknown TYPE"""
+    item = {'item_id': 'x', 'name': 'X', 'type': 'food', 'effect': 'health:5',
+            'cost': 5, 'description': 'X'}
+    with pytest.raises(InvalidDataFormatError):
+        game_data.validate_item_data(item)
+
+def test_validate_quest_data_rejects_text_numbers():
+    """Test that validate_quest_data requires numeric rewards"""
+    quest = {'quest_id': 'x', 'title': 'X', 'description': 'X', 'reward_xp': '50',
+             'reward_gold': 5, 'required_level': 1, 'prerequisite': 'NONE'}
+    with pytest.raises(InvalidDataFormatError):
+        game_data.validate_quest_data(quest)
+
+def test_shipped_catalogs_are_valid():
+    """Test that the provided data files have no errors"""
+    assert catalog_validator.validate_catalog("data/quests.txt", 'quests') == []
+    assert catalog_validator.validate_catalog("data/items.txt", 'items') == []
+
+def test_every_item_error_is_reported(tmp_path):
+    """Test that one pass finds all errors with their lines and fields"""
+    item_file = str(tmp_path / "items.txt")
+    with open(item_file, "w") as f:
+        f.write("ITEM_ID: sword\nNAME: Sword\nTYPE: blade\nEFFECT: strength:5\n"
+                "COST: 10\nDESCRIPTION: Sharp\n\n"
+                "ITEM_ID: sword\nNAME: Sword Again\nTYPE: weapon\nEFFECT: strength=5\n"
+                "COST: cheap\nDESCRIPTION: Duplicate\n")
+
+    errors = catalog_validator.validate_catalog(item_file, 'items')
+    found = [(error['line'], error['field']) for error in errors]
+    assert found == [(3, 'type'), (8, 'item_id'), (11, 'effect'), (12, 'cost')]
+
+def test_duplicates_across_shards_in_parallel(tmp_path):
+    """Test that parallel mode still finds IDs repeated across shards"""
+    for shard in ("a", "b"):
+        with open(str(tmp_path / f"{shard}.txt"), "w") as f:
+            f.write("QUEST_ID: shared\nTITLE: T\nDESCRIPTION: D\nREWARD_XP: 1\n"
+                    "REWARD_GOLD: 1\nREQUIRED_LEVEL: 1\nPREREQUISITE: NONE\n")
+
+    errors = catalog_validator.validate_catalog(str(tmp_path), 'quests', workers=2)
+    assert len(errors) == 1
+    assert errors[0]['file'].endswith("b.txt")
+    assert "duplicate ID 'shared'" in errors[0]['message']
+
+def test_command_line_exit_status(tmp_path, capsys):
+    """Test that the CLI exits non-zero and prints errors for bad data"""
+    quest_file = str(tmp_path / "quests.txt")
+    with open(quest_file, "w") as f:
+        f.write("QUEST_ID: q\nTITLE: T\nDESCRIPTION: D\nREWARD_XP: 1\n"
+                "REWARD_GOLD: 1\nREQUIRED_LEVEL: 0\nPREREQUISITE: NONE\n")
+
+    assert catalog_validator.main(["--quests", quest_file]) == 1
+    assert "quests.txt:6: required_level" in capsys.readouterr().out
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,76 @@
+"""
+Test Class Registry
+Tests that character classes load from data files and drive creation
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import game_data
+from custom_exceptions import InvalidCharacterClassError, InvalidDataFormatError
+
+@pytest.fixture
+def classes_file(tmp_path):
+    filename = str(tmp_path / "classes.txt")
+    with open(filename, "w") as f:
+        for class_info in game_data.DEFAULT_CLASSES.values():
+            f.write(game_data.format_class_block(class_info))
+        f.write("CLASS_NAME: Paladin\nHEALTH: 110\nSTRENGTH: 13\nMAGIC: 9\nABILITY: heal\n")
+    yield filename
+    character_manager.set_class_registry(None)
+
+def test_load_classes_keys_are_normalized(classes_file):
+    """Test that classes are keyed by lower-case name"""
+    classes = game_data.load_classes(classes_file)
+    assert list(classes) == ["warrior", "mage", "rogue", "cleric", "paladin"]
+    assert classes["paladin"]['health'] == 110
+    assert classes["mage"].ability == "fireball"
+
+def test_new_class_from_data_file(classes_file):
+    """Test that a class added to the data file can be created in any case"""
+    character_manager.set_class_registry(game_data.load_classes(classes_file))
+    char = character_manager.create_character("Sera", "PALADIN")
+    assert char['class'] == "Paladin"
+    assert char['health'] == char['max_health'] == 110
+    assert char['strength'] == 13
+    assert "Paladin" in character_manager.get_class_names()
+
+    char['health'] = 50
+    combat_system.use_special_ability(char, None, None)
+    assert char['health'] == 80
+
+def test_default_classes_match_original_stats():
+    """Test the built-in classes used when no class file exists"""
+    char = character_manager.create_character("Tam", "mage")
+    assert (char['class'], char['health'], char['strength'], char['magic']) == ("Mage", 80, 8, 20)
+    with pytest.raises(InvalidCharacterClassError):
+        character_manager.create_character("Tam", "Bard")
+
+def test_create_characters_bulk():
+    """Test bulk creation returns independent characters in order"""
+    specs = [(f"hero_{index}", "Warrior" if index % 2 else "cleric") for index in range(100)]
+    characters = character_manager.create_characters(specs)
+    assert [char['name'] for char in characters] == [name for name, char_class in specs]
+    assert characters[0]['class'] == "Cleric"
+    assert characters[1]['health'] == 120
+    characters[0]['inventory'].append("potion")
+    assert characters[2]['inventory'] == []
+
+    with pytest.raises(InvalidCharacterClassError):
+        character_manager.create_characters([("a", "Warrior"), ("b", "Bard")])
+
+def test_bad_class_file_is_rejected(tmp_path):
+    """Test that invalid class stats raise InvalidDataFormatError"""
+    filename = str(tmp_path / "classes.txt")
+    with open(filename, "w") as f:
+        f.write("CLASS_NAME: Ghost\nHEALTH: 0\nSTRENGTH: 1\nMAGIC: 1\nABILITY: heal\n")
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_classes(filename)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,51 @@
+"""
+Test Data Streaming
+Tests that quest and item files can be streamed one record at a time
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError, MissingDataFileError
+import game_data
+
+def test_iter_quests_matches_load_quests():
+    """Test that streaming yields the same quests as load_quests"""
+    streamed = list(game_data.iter_quests("data/quests.txt"))
+    loaded = game_data.load_quests("data/quests.txt")
+
+    assert [quest['quest_id'] for quest in streamed] == list(loaded)
+    assert streamed == list(loaded.values())
+
+def test_iter_items_is_lazy():
+    """Test that iter_items yields records before reading the whole file"""
+    items = game_data.iter_items("data/items.txt")
+    first = next(items)
+
+    assert first['item_id'] == 'health_potion'
+    items.close()
+
+def test_iter_reports_file_and_line(tmp_path):
+    """Test that a bad block is reported with file name and line number"""
+    item_file = str(tmp_path / "items.txt")
+    with open(item_file, "w") as f:
+        f.write("ITEM_ID: ok\nNAME: Ok\nTYPE: armor\nEFFECT: max_health:5\n"
+                "COST: 10\nDESCRIPTION: Fine\n\n\n"
+                "ITEM_ID: bad\nNAME: Bad\nTYPE: armor\nEFFECT: max_health:5\n"
+                "COST: lots\nDESCRIPTION: Broken cost\n")
+
+    items = game_data.iter_items(item_file)
+    assert next(items)['item_id'] == 'ok'
+    with pytest.raises(InvalidDataFormatError, match=r"items\.txt, line 9"):
+        next(items)
+
+def test_iter_missing_file():
+    """Test that streaming a missing file raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        next(game_data.iter_quests("nonexistent_file.txt"))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,83 @@
+"""
+Test Dirty Tracking
+Tests that unchanged characters are not rewritten and that changed
+fields are reported
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_layout
+
+@pytest.fixture
+def save_dir(tmp_path):
+    return str(tmp_path)
+
+def test_unchanged_save_does_no_io(save_dir):
+    """Test that saving an unchanged character writes nothing"""
+    character = character_manager.create_character("DirtyHero", "Warrior")
+    character_manager.save_character(character, save_dir)
+    save_path = character_manager.get_save_path("DirtyHero", save_dir)
+
+    # Remove the file behind the tracker's back: a no-op save must not recreate it
+    os.remove(save_path)
+    assert character_manager.save_character(character, save_dir) is True
+    assert not os.path.exists(save_path)
+
+    assert character_manager.save_character(character, save_dir, force=True) is True
+    assert os.path.exists(save_path)
+
+def test_unchanged_save_skips_location_lookup(save_dir, monkeypatch):
+    """Test that an unchanged save does not stat files to find its location"""
+    character = character_manager.create_character("StillHero", "Mage")
+    character_manager.save_character(character, save_dir)
+    character_manager.save_characters([character], save_dir)
+
+    def no_lookups(*args):
+        raise AssertionError("save location resolved for an unchanged character")
+    monkeypatch.setattr(save_layout.SaveLayout, "locate", no_lookups)
+    assert character_manager.save_character(character, save_dir) is True
+    assert character_manager.save_characters([character], save_dir) == 0
+
+def test_changed_fields_are_reported(save_dir):
+    """Test that field and list changes are detected and cleared by saving"""
+    character = character_manager.create_character("DirtyHero", "Mage")
+    assert character_manager.get_changed_fields(character, save_dir) == character_manager.SAVE_FIELDS
+
+    character_manager.save_character(character, save_dir)
+    assert character_manager.get_changed_fields(character, save_dir) == []
+
+    character['gold'] += 10
+    character['inventory'].append('health_potion')
+    assert character_manager.get_changed_fields(character, save_dir) == ['gold', 'inventory']
+
+    character_manager.save_character(character, save_dir)
+    assert character_manager.get_changed_fields(character, save_dir) == []
+
+def test_changed_character_is_written(save_dir):
+    """Test that a real change is written to disk"""
+    character = character_manager.create_character("DirtyHero", "Rogue")
+    character_manager.save_character(character, save_dir)
+    character['gold'] = 555
+    character_manager.save_character(character, save_dir)
+
+    # Load from a fresh backend so nothing comes from memory
+    backend = save_backends.BinarySaveBackend(save_dir)
+    assert backend.load_character("DirtyHero")['gold'] == 555
+
+def test_delete_forgets_snapshot(save_dir):
+    """Test that a deleted character is written again on the next save"""
+    character = character_manager.create_character("DirtyHero", "Cleric")
+    character_manager.save_character(character, save_dir)
+    character_manager.delete_character("DirtyHero", save_dir)
+
+    character_manager.save_character(character, save_dir)
+    assert os.path.exists(character_manager.get_save_path("DirtyHero", save_dir))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
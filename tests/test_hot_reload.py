@@ -0,0 +1,101 @@
+"""
+Test Hot Reload
+Tests that edited data files are reloaded block by block with a diff
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError
+import game_data
+import hot_reload
+
+def quest_text(quest_id, prerequisite="NONE", reward_xp=50):
+    """Build the text for one quest block"""
+    return (f"QUEST_ID: {quest_id}\nTITLE: {quest_id}\nDESCRIPTION: Test\n"
+            f"REWARD_XP: {reward_xp}\nREWARD_GOLD: 10\nREQUIRED_LEVEL: 1\n"
+            f"PREREQUISITE: {prerequisite}\n\n")
+
+def write_file(filename, text):
+    """Write text and bump the mtime so the change is always noticed"""
+    old_mtime = os.stat(filename).st_mtime_ns if os.path.exists(filename) else 0
+    with open(filename, "w") as f:
+        f.write(text)
+    os.utime(filename, ns=(old_mtime + 10**9, old_mtime + 10**9))
+
+def test_only_changed_blocks_are_parsed(tmp_path):
+    """Test that a reload reuses unchanged records and reports the diff"""
+    quest_file = str(tmp_path / "quests.txt")
+    write_file(quest_file, quest_text("a") + quest_text("b", "a") + quest_text("c"))
+    watcher = hot_reload.CatalogWatcher(quest_file, game_data.parse_quest_block, 'quest_id')
+    quest_a = watcher.catalog['a']
+
+    assert watcher.poll() is None
+
+    write_file(quest_file, quest_text("a") + quest_text("b", "a", 99) + quest_text("d"))
+    changes = watcher.poll()
+
+    assert changes == {'added': ['d'], 'removed': ['c'], 'changed': ['b']}
+    assert watcher.blocks_parsed == 2
+    assert watcher.catalog['a'] is quest_a
+    assert watcher.catalog['b']['reward_xp'] == 99
+
+def test_bad_edit_keeps_old_catalog(tmp_path):
+    """Test that a broken edit raises and leaves the previous data in place"""
+    quest_file = str(tmp_path / "quests.txt")
+    write_file(quest_file, quest_text("a"))
+    watcher = hot_reload.CatalogWatcher(quest_file, game_data.parse_quest_block, 'quest_id')
+
+    write_file(quest_file, quest_text("a").replace("REWARD_XP: 50", "REWARD_XP: many"))
+    with pytest.raises(InvalidDataFormatError):
+        watcher.poll()
+    assert watcher.catalog['a']['reward_xp'] == 50
+
+def test_prerequisites_checked_for_affected_quests(tmp_path, capsys):
+    """Test that removing a quest re-validates only the quests depending on it"""
+    quest_file = str(tmp_path / "quests.txt")
+    item_file = str(tmp_path / "items.txt")
+    write_file(quest_file, quest_text("a") + quest_text("b", "a") + quest_text("c"))
+    write_file(item_file, "ITEM_ID: potion\nNAME: Potion\nTYPE: consumable\n"
+                          "EFFECT: health:5\nCOST: 5\nDESCRIPTION: Heals\n")
+    reloads = []
+    watcher = hot_reload.GameDataWatcher(
+        quest_file, item_file,
+        on_reload=lambda quests, items, changes: reloads.append(changes)
+    )
+
+    write_file(quest_file, quest_text("b", "a") + quest_text("c"))
+    changes = watcher.poll()
+
+    assert changes['quests']['removed'] == ['a']
+    assert changes['items'] is None
+    assert reloads == [changes]
+    assert "Quest 'b' requires missing quest 'a'" in capsys.readouterr().out
+
+def test_broken_quest_file_does_not_block_item_reload(tmp_path):
+    """Test that items still reload when the quest file fails to parse"""
+    quest_file = str(tmp_path / "quests.txt")
+    item_file = str(tmp_path / "items.txt")
+    item_text = ("ITEM_ID: potion\nNAME: Potion\nTYPE: consumable\n"
+                 "EFFECT: health:5\nCOST: 5\nDESCRIPTION: Heals\n")
+    write_file(quest_file, quest_text("a"))
+    write_file(item_file, item_text)
+    reloads = []
+    watcher = hot_reload.GameDataWatcher(
+        quest_file, item_file,
+        on_reload=lambda quests, items, changes: reloads.append(changes)
+    )
+
+    write_file(quest_file, quest_text("a").replace("REWARD_XP: 50", "REWARD_XP: many"))
+    write_file(item_file, item_text.replace("COST: 5", "COST: 7"))
+    with pytest.raises(InvalidDataFormatError):
+        watcher.poll()
+    assert watcher.items.catalog['potion']['cost'] == 7
+    assert watcher.quests.catalog['a']['reward_xp'] == 50
+    assert reloads == [{'quests': None, 'items': {'added': [], 'removed': [], 'changed': ['potion']}}]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
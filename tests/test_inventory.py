@@ -0,0 +1,86 @@
+"""
+Test Inventory
+Tests that the counted Inventory list stays in step with its items and
+still saves like a plain list
+"""
+
+import pytest
+import sys
+import os
+import pickle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from inventory_system import Inventory
+from custom_exceptions import ItemNotFoundError
+
+def test_counts_follow_list_changes():
+    """Test that every list operation keeps the counts correct"""
+    inventory = Inventory(["potion", "sword", "potion"])
+    inventory.append("shield")
+    inventory.insert(0, "potion")
+    inventory.extend(["gem", "gem"])
+    inventory += ["sword"]
+    inventory.remove("sword")
+    inventory.pop()
+    inventory[1] = "gem"
+    inventory[2:4] = ["rope"]
+    del inventory[0]
+    del inventory[-2:]
+    assert inventory.counts == {item: inventory[:].count(item) for item in set(inventory)}
+    assert "sword" not in inventory
+    with pytest.raises(ValueError):
+        inventory.remove("sword")
+
+    inventory *= 3
+    assert inventory.count("gem") == list(inventory).count("gem")
+    inventory.clear()
+    assert inventory == [] and not inventory.counts
+
+def test_inventory_functions_convert_plain_lists():
+    """Test that characters with plain-list inventories still work"""
+    char = {'inventory': ["potion", "sword", "potion"], 'gold': 0}
+    assert inventory_system.count_item(char, "potion") == 2
+    assert isinstance(char['inventory'], Inventory)
+    assert char['inventory'] == ["potion", "sword", "potion"]
+
+    inventory_system.remove_item_from_inventory(char, "potion")
+    assert char['inventory'] == ["sword", "potion"]
+    assert not inventory_system.has_item(char, "gem")
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.remove_item_from_inventory(char, "gem")
+
+    removed = inventory_system.clear_inventory(char)
+    assert removed == ["sword", "potion"]
+    assert char['inventory'] == []
+    assert inventory_system.get_inventory_space_remaining(char) == inventory_system.MAX_INVENTORY_SIZE
+
+def test_display_groups_counts(capsys):
+    """Test that display_inventory shows one line per item with its count"""
+    char = {'inventory': Inventory(["potion", "sword", "potion"])}
+    inventory_system.display_inventory(char, {'potion': {'name': "Potion"}})
+    output = capsys.readouterr().out
+    assert "- Potion (x2)" in output
+    assert "- sword [Unknown Item] (x1)" in output
+
+def test_inventory_saves_like_a_list(tmp_path):
+    """Test that an Inventory saves and loads in both save formats"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Packer", "Rogue")
+    for item in ("potion", "sword", "potion"):
+        inventory_system.add_item_to_inventory(char, item)
+    character_manager.save_character(char, save_dir)
+    character_manager.export_character("Packer", str(tmp_path / "Packer.txt"), save_dir)
+    with open(tmp_path / "Packer.txt") as f:
+        assert "INVENTORY: potion,sword,potion\n" in f.read()
+
+    character_manager.load_cache.clear()
+    loaded = character_manager.load_character("Packer", save_dir)
+    assert loaded['inventory'] == ["potion", "sword", "potion"]
+    assert inventory_system.count_item(loaded, "potion") == 2
+    assert pickle.loads(pickle.dumps(char['inventory'])).counts == char['inventory'].counts
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+Test Item Effects
+Tests that item effects, including multi-stat effects, are compiled once
+per catalog item and applied the same way as the parsed effect strings
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import inventory_system
+import item_effects
+import item_index
+from game_data import Item
+from custom_exceptions import InvalidItemTypeError
+
+def make_catalog():
+    return item_index.IndexedItemCatalog({
+        'iron_sword': Item('iron_sword', "Iron Sword", 'weapon', 'strength:5', 100, "Sharp"),
+        'chainmail': Item('chainmail', "Chainmail", 'armor', 'max_health:15', 120, "Heavy"),
+        'potion': Item('potion', "Potion", 'consumable', 'health:20', 20, "Heals"),
+        'broken': Item('broken', "Broken", 'consumable', 'health:lots', 1, "Bad")
+    })
+
+def test_catalog_compiles_each_effect_once():
+    """Test that catalog items carry a shared compiled effect"""
+    catalog = make_catalog()
+    sword = catalog['iron_sword']
+    assert sword.compiled_effect is item_effects.compile_effect("strength:5")
+    assert sword.compiled_effect.changes == (("strength", 5),)
+    assert catalog['broken'].compiled_effect is None
+    assert 'compiled_effect' not in sword
+    assert list(sword) == ['item_id', 'name', 'type', 'effect', 'cost', 'description']
+
+    # A changed EFFECT is picked up rather than using the stale compiled one
+    sword['effect'] = "strength:7"
+    assert item_effects.get_item_effect(sword).strength == 7
+    with pytest.raises(ValueError):
+        item_effects.compile_effect("strength")
+
+def test_equip_and_unequip_restore_stats():
+    """Test that compiled effects apply on equip and come off on unequip"""
+    catalog = make_catalog()
+    char = character_manager.create_character("Gearhead", "Warrior")
+    before = dict(char)
+    for item_id in ('iron_sword', 'chainmail'):
+        inventory_system.add_item_to_inventory(char, item_id)
+    inventory_system.equip_weapon(char, 'iron_sword', catalog['iron_sword'])
+    inventory_system.equip_armor(char, 'chainmail', catalog['chainmail'])
+    assert char['strength'] == before['strength'] + 5
+    assert char['max_health'] == before['max_health'] + 15
+    assert char['health'] == before['health'] + 15
+
+    assert inventory_system.unequip_weapon(char) == 'iron_sword'
+    assert inventory_system.unequip_armor(char) == 'chainmail'
+    for stat in ('strength', 'max_health', 'health', 'magic'):
+        assert char[stat] == before[stat]
+
+def test_use_item_with_compiled_and_plain_items():
+    """Test that use_item works for catalog records and plain dictionaries"""
+    catalog = make_catalog()
+    char = character_manager.create_character("Drinker", "Mage")
+    char['health'] = 10
+    inventory_system.add_item_to_inventory(char, 'potion')
+    assert inventory_system.use_item(char, 'potion', catalog['potion']).endswith("health increased by 20.")
+    assert char['health'] == 30
+
+    inventory_system.add_item_to_inventory(char, 'tonic')
+    inventory_system.use_item(char, 'tonic', {'type': 'consumable', 'effect': 'magic:3'})
+    assert char['magic'] == 23
+
+    inventory_system.add_item_to_inventory(char, 'broken')
+    with pytest.raises(InvalidItemTypeError):
+        inventory_system.use_item(char, 'broken', catalog['broken'])
+
+def test_multi_stat_effect_grammar():
+    """Test that EFFECT accepts several stats and still rejects bad ones"""
+    assert game_data.parse_effect("strength:5, magic:3,max_health:10") == \
+        [("strength", 5), ("magic", 3), ("max_health", 10)]
+    assert game_data.check_effect("strength:5,magic:-3") is None
+    assert "unknown stat" in game_data.check_effect("strength:5,luck:2")
+    assert "more than once" in game_data.check_effect("strength:5,strength:2")
+    assert "whole number" in game_data.check_effect("strength:5,magic:x")
+    assert "stat:value" in game_data.check_effect("strength:5,")
+    assert item_index.get_effect_stats("strength:5,magic:3") == ["strength", "magic"]
+
+    catalog = make_catalog()
+    catalog['runeblade'] = Item('runeblade', "Runeblade", 'weapon', 'strength:5,magic:3,max_health:10',
+                                300, "Glows")
+    assert [item_id for item_id, item in catalog.items_affecting('magic')] == ['runeblade']
+    effect = catalog['runeblade'].compiled_effect
+    assert (effect.strength, effect.magic, effect.max_health, effect.health) == (5, 3, 10, 0)
+    assert effect.describe() == \
+        "strength increased by 5, magic increased by 3, max_health increased by 10"
+
+def test_multi_stat_gear_is_reversible_and_saved(tmp_path):
+    """Test that multi-stat gear comes off cleanly, including after a reload"""
+    save_dir = str(tmp_path)
+    blade = Item('runeblade', "Runeblade", 'weapon', 'strength:5,magic:3,max_health:10', 300, "")
+    char = character_manager.create_character("Spellsword", "Mage")
+    char['health'] = 50
+    before = dict(char)
+    inventory_system.add_item_to_inventory(char, 'runeblade')
+    inventory_system.equip_weapon(char, 'runeblade', blade)
+    assert (char['strength'], char['magic'], char['max_health'], char['health']) == \
+        (before['strength'] + 5, before['magic'] + 3, before['max_health'] + 10, 60)
+
+    character_manager.save_character(char, save_dir)
+    character_manager.export_character("Spellsword", str(tmp_path / "export.txt"), save_dir)
+    with open(tmp_path / "export.txt") as f:
+        exported = character_manager.save_backends.parse_text_save(f)
+    character_manager.load_cache.clear()
+    for loaded in (character_manager.load_character("Spellsword", save_dir), exported):
+        assert loaded['equipped_weapon'] == {'id': 'runeblade', 'effect': 'strength:5,magic:3,max_health:10'}
+        inventory_system.unequip_weapon(loaded)
+        for stat in ('strength', 'magic', 'max_health'):
+            assert loaded[stat] == before[stat]
+        assert loaded['health'] == 60       # Healing from equipping is kept
+
+def test_healing_gear_round_trip_at_full_health():
+    """Test that equipping and unequipping healing armor loses no health"""
+    armor = Item('blessed_mail', "Blessed Mail", 'armor', 'health:20,max_health:10', 150, "")
+    char = character_manager.create_character("Chaplain", "Cleric")
+    before = dict(char)
+    inventory_system.add_item_to_inventory(char, 'blessed_mail')
+    for _ in range(3):
+        inventory_system.equip_armor(char, 'blessed_mail', armor)
+        assert (char['health'], char['max_health']) == \
+            (before['max_health'] + 10, before['max_health'] + 10)
+        inventory_system.unequip_armor(char)
+        for stat in ('strength', 'magic', 'max_health', 'health'):
+            assert char[stat] == before[stat]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""
+Test Item Index
+Tests that the indexed item catalog answers type, stat and cost queries
+and keeps its indexes in sync with edits
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from item_index import IndexedItemCatalog, get_effect_stats, list_items_by_cost
+
+def make_item(item_id, item_type, effect, cost):
+    return game_data.Item(item_id, item_id.title(), item_type, effect, cost, "Test item")
+
+@pytest.fixture
+def catalog():
+    return IndexedItemCatalog({
+        'sword': make_item('sword', 'weapon', 'strength:5', 100),
+        'staff': make_item('staff', 'weapon', 'magic:4', 80),
+        'mail': make_item('mail', 'armor', 'max_health:20', 150),
+        'potion': make_item('potion', 'consumable', 'health:20', 25),
+        'elixir': make_item('elixir', 'consumable', 'health:50', 80)
+    })
+
+def test_get_effect_stats():
+    """Test that the stat name is taken from EFFECT"""
+    assert get_effect_stats("strength:5") == ["strength"]
+    assert get_effect_stats("bad effect") == []
+
+def test_catalog_acts_like_dict(catalog):
+    """Test lookups, membership and iteration order"""
+    assert len(catalog) == 5
+    assert 'sword' in catalog and 'axe' not in catalog
+    assert catalog['potion']['cost'] == 25
+    assert list(catalog) == ['sword', 'staff', 'mail', 'potion', 'elixir']
+
+def test_type_and_stat_buckets(catalog):
+    """Test grouping by TYPE and by the stat in EFFECT"""
+    assert catalog.get_item_types() == ['armor', 'consumable', 'weapon']
+    assert [item_id for item_id, item in catalog.items_of_type('weapon')] == ['sword', 'staff']
+    assert [item_id for item_id, item in catalog.items_affecting('health')] == ['potion', 'elixir']
+    assert catalog.items_of_type('ring') == []
+
+def test_cost_range_queries(catalog):
+    """Test cost ordering and inclusive range bounds"""
+    assert [item_id for item_id, item in catalog.items_by_cost()] == \
+        ['potion', 'elixir', 'staff', 'sword', 'mail']
+    assert [item_id for item_id, item in catalog.items_by_cost(80, 100)] == \
+        ['elixir', 'staff', 'sword']
+    assert [item_id for item_id, item in catalog.items_by_cost(max_cost=80)] == \
+        ['potion', 'elixir', 'staff']
+    assert catalog.items_by_cost(min_cost=200) == []
+
+def test_indexes_follow_edits(catalog):
+    """Test that adding, replacing and removing items updates every index"""
+    catalog['axe'] = make_item('axe', 'weapon', 'strength:7', 90)
+    assert [item_id for item_id, item in catalog.items_by_cost(85, 95)] == ['axe']
+
+    catalog['staff'] = make_item('staff', 'armor', 'max_health:5', 10)
+    assert 'staff' not in [item_id for item_id, item in catalog.items_of_type('weapon')]
+    assert catalog.items_affecting('magic') == []
+    assert catalog.items_by_cost()[0][0] == 'staff'
+
+    del catalog['mail']
+    del catalog['staff']
+    assert catalog.get_item_types() == ['consumable', 'weapon']
+    assert len(catalog.by_cost) == len(catalog) == 4
+    with pytest.raises(KeyError):
+        del catalog['mail']
+
+def test_indexes_real_catalog():
+    """Test indexing the shipped item file"""
+    catalog = IndexedItemCatalog(game_data.load_items("data/items.txt"))
+    costs = [item['cost'] for item_id, item in catalog.items_by_cost()]
+    assert costs == sorted(costs)
+    assert sum(len(catalog.items_of_type(t)) for t in catalog.get_item_types()) == len(catalog)
+
+def test_shop_listing_for_any_catalog():
+    """Test that the shop's cost listing also works for lazy and plain catalogs"""
+    indexed = list_items_by_cost(IndexedItemCatalog(game_data.load_items("data/items.txt")))
+    lazy = list_items_by_cost(game_data.load_items("data/items.txt", lazy=True))
+    plain = list_items_by_cost(dict(game_data.load_items("data/items.txt")))
+    assert [item_id for item_id, item in lazy] == [item_id for item_id, item in indexed]
+    assert plain == indexed
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
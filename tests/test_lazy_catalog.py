@@ -0,0 +1,62 @@
+"""
+Test Lazy Catalog
+Tests that the memory-mapped item catalog behaves like the item dictionary
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError
+import game_data
+import inventory_system
+
+def test_lazy_catalog_matches_dict():
+    """Test that the lazy catalog has the same keys and records as load_items"""
+    items = game_data.load_items("data/items.txt")
+    with game_data.load_items("data/items.txt", lazy=True) as lazy_items:
+        assert len(lazy_items) == len(items)
+        assert list(lazy_items) == list(items)
+        assert dict(lazy_items.items()) == items
+
+def test_lazy_catalog_parses_on_access():
+    """Test that only looked-up items are parsed and then cached"""
+    with game_data.load_items("data/items.txt", lazy=True) as lazy_items:
+        assert lazy_items.parsed_count() == 0
+        assert 'iron_sword' in lazy_items
+        assert lazy_items.parsed_count() == 0
+
+        sword = lazy_items['iron_sword']
+        assert sword['type'] == 'weapon'
+        assert lazy_items['iron_sword'] is sword
+        assert lazy_items.parsed_count() == 1
+        assert lazy_items.get('missing_item') is None
+
+def test_lazy_catalog_display_inventory(capsys):
+    """Test that the lazy catalog works with display_inventory"""
+    char = {'inventory': ['health_potion', 'health_potion', 'iron_sword']}
+    with game_data.load_items("data/items.txt", lazy=True) as lazy_items:
+        inventory_system.display_inventory(char, lazy_items)
+
+    output = capsys.readouterr().out
+    assert "Health Potion (x2)" in output
+    assert "Iron Sword (x1)" in output
+
+def test_lazy_catalog_reports_bad_block(tmp_path):
+    """Test that a bad block is reported with its line when accessed"""
+    item_file = str(tmp_path / "items.txt")
+    with open(item_file, "w") as f:
+        f.write("ITEM_ID: ok\nNAME: Ok\nTYPE: armor\nEFFECT: max_health:5\n"
+                "COST: 10\nDESCRIPTION: Fine\n\n"
+                "ITEM_ID: bad\nNAME: Bad\nTYPE: armor\nEFFECT: max_health:5\n"
+                "COST: lots\nDESCRIPTION: Broken cost")
+
+    with game_data.load_items(item_file, lazy=True) as lazy_items:
+        assert lazy_items['ok']['cost'] == 10
+        with pytest.raises(InvalidDataFormatError, match="line 8"):
+            lazy_items['bad']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
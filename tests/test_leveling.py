@@ -0,0 +1,68 @@
+"""
+Test Leveling
+Tests that large XP grants level up in one step and match the level curve
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from custom_exceptions import CharacterDeadError
+
+def level_one_at_a_time(level, experience):
+    """Reference: apply the level * 100 curve one level at a time"""
+    while experience >= level * 100:
+        experience -= level * 100
+        level += 1
+    return level, experience
+
+def test_levels_gained_matches_curve():
+    """Test the closed form against the level-by-level curve"""
+    for level in (1, 2, 7, 50):
+        for experience in (0, 99, 100, 299, 300, 5000, 123456):
+            expected_level, expected_xp = level_one_at_a_time(level, experience)
+            assert level + character_manager.get_levels_gained(level, experience) == expected_level
+
+    assert character_manager.get_total_xp_for_level(1) == 0
+    assert character_manager.get_total_xp_for_level(4) == 600
+
+def test_large_grant_applies_all_levels_at_once():
+    """Test stats and leftover XP after crossing hundreds of levels"""
+    char = character_manager.create_character("Vale", "Warrior")
+    xp = character_manager.get_total_xp_for_level(501) + 42
+    summary = character_manager.gain_experience(char, xp, quiet=True)
+
+    assert char['level'] == 501
+    assert char['experience'] == 42
+    assert char['max_health'] == 120 + 10 * 500
+    assert char['health'] == char['max_health']
+    assert char['strength'] == 15 + 2 * 500
+    assert summary == {
+        'xp_gained': xp, 'old_level': 1, 'new_level': 501, 'levels_gained': 500,
+        'max_health_gained': 5000, 'strength_gained': 1000, 'magic_gained': 1000
+    }
+
+def test_quiet_mode_prints_nothing(capsys):
+    """Test that quiet mode only returns the summary"""
+    char = character_manager.create_character("Vale", "Mage")
+    character_manager.gain_experience(char, 50, quiet=True)
+    assert capsys.readouterr().out == ""
+
+    summary = character_manager.gain_experience(char, 550)
+    output = capsys.readouterr().out
+    assert summary['levels_gained'] == 3
+    assert output.count("LEVEL UP") == 1
+    assert "Level 4! (+3 levels)" in output
+
+def test_dead_character_cannot_gain_xp():
+    """Test that the dead check still comes first"""
+    char = character_manager.create_character("Vale", "Rogue")
+    char['health'] = 0
+    with pytest.raises(CharacterDeadError):
+        character_manager.gain_experience(char, 100, quiet=True)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
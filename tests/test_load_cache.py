@@ -0,0 +1,96 @@
+"""
+Test Load Cache
+Tests the LRU cache behind load_character: hits, invalidation, file
+change detection, defensive copies and eviction
+"""
+
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+from custom_exceptions import CharacterNotFoundError
+
+@pytest.fixture
+def save_dir(tmp_path):
+    character_manager.load_cache.clear()
+    character = character_manager.create_character("CacheHero", "Mage")
+    character_manager.save_character(character, str(tmp_path))
+    return str(tmp_path)
+
+def stats():
+    return character_manager.get_load_cache_stats()
+
+def test_repeated_loads_hit_cache(save_dir):
+    """Test that the second load is served from the cache"""
+    before = stats()
+    first = character_manager.load_character("CacheHero", save_dir)
+    second = character_manager.load_character("CacheHero", save_dir)
+
+    assert first == second
+    assert stats()['misses'] == before['misses'] + 1
+    assert stats()['hits'] == before['hits'] + 1
+
+def test_cache_returns_copies(save_dir):
+    """Test that editing a loaded character cannot change the cache"""
+    character = character_manager.load_character("CacheHero", save_dir)
+    character['inventory'].append("stolen_item")
+    character['gold'] = 0
+
+    again = character_manager.load_character("CacheHero", save_dir)
+    assert again['inventory'] == []
+    assert again['gold'] == 100
+
+def test_save_and_delete_invalidate(save_dir):
+    """Test that save_character and delete_character drop the cached copy"""
+    character = character_manager.load_character("CacheHero", save_dir)
+    character['gold'] = 777
+    character_manager.save_character(character, save_dir)
+    assert character_manager.load_character("CacheHero", save_dir)['gold'] == 777
+
+    character_manager.delete_character("CacheHero", save_dir)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("CacheHero", save_dir)
+
+def test_outside_change_is_detected(save_dir):
+    """Test that a save file rewritten by another program is reloaded"""
+    character_manager.load_character("CacheHero", save_dir)
+    character = character_manager.create_character("CacheHero", "Mage")
+    character['gold'] = 5
+    save_backends.BinarySaveBackend(save_dir).write_character(character)
+    later = time.time() + 10
+    os.utime(character_manager.get_save_path("CacheHero", save_dir), (later, later))
+
+    assert character_manager.load_character("CacheHero", save_dir)['gold'] == 5
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first"""
+    cache = character_manager.CharacterCache(max_size=2)
+    for name in ("a", "b"):
+        cache.put(name, 1, {'name': name})
+    cache.get("a", 1)
+    cache.put("c", 1, {'name': 'c'})
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == {'name': 'a'}
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.get("a", 2) is None
+
+def test_batch_load_uses_cache(save_dir):
+    """Test that load_characters only reads characters not in the cache"""
+    other = character_manager.create_character("OtherHero", "Rogue")
+    character_manager.save_character(other, save_dir)
+    character_manager.load_character("CacheHero", save_dir)
+
+    before = stats()
+    loaded = character_manager.load_characters(["OtherHero", "CacheHero"], save_dir)
+    assert [c['name'] for c in loaded] == ["OtherHero", "CacheHero"]
+    assert stats()['hits'] == before['hits'] + 1
+    assert stats()['misses'] == before['misses'] + 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+"""
+Test Records
+Tests that Quest and Item records can be used like the old dictionaries
+"""
+
+import pickle
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import inventory_system
+import quest_handler
+
+def test_loaded_catalogs_use_records():
+    """Test that load_quests and load_items return compact records"""
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+
+    assert isinstance(quests['first_steps'], game_data.Quest)
+    assert isinstance(items['iron_sword'], game_data.Item)
+    assert not hasattr(items['iron_sword'], '__dict__')
+
+def test_record_dict_access():
+    """Test subscript, get, membership, iteration and equality"""
+    item = game_data.Item('potion', 'Potion', 'consumable', 'health:20', 25, 'Heals')
+
+    assert item['cost'] == 25
+    assert item.get('name') == 'Potion'
+    assert item.get('missing', 'default') == 'default'
+    assert 'effect' in item and 'missing' not in item
+    assert list(item) == ['item_id', 'name', 'type', 'effect', 'cost', 'description']
+    assert item == {'item_id': 'potion', 'name': 'Potion', 'type': 'consumable',
+                    'effect': 'health:20', 'cost': 25, 'description': 'Heals'}
+    with pytest.raises(KeyError):
+        item['missing']
+
+def test_record_pickle_round_trip():
+    """Test that records survive pickling (cache files, worker processes)"""
+    quest = game_data.load_quests("data/quests.txt")['first_steps']
+    assert pickle.loads(pickle.dumps(quest)) == quest
+
+def test_pooled_fields_share_strings():
+    """Test that repeated field values are one shared string object"""
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+
+    weapon_types = [item['type'] for item in items.values() if item['type'] == 'weapon']
+    assert len(weapon_types) > 1
+    assert all(value is weapon_types[0] for value in weapon_types)
+    assert quests['goblin_hunter']['prerequisite'] is quests['first_steps']['quest_id']
+
+def test_records_work_with_game_modules():
+    """Test records with quest_handler and inventory_system"""
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+    char = {'level': 1, 'active_quests': [], 'completed_quests': [],
+            'inventory': ['health_potion'], 'health': 50, 'max_health': 100, 'gold': 100}
+
+    quest_handler.accept_quest(char, 'first_steps', quests)
+    inventory_system.use_item(char, 'health_potion', items['health_potion'])
+
+    assert char['active_quests'] == ['first_steps']
+    assert char['health'] == 70
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,156 @@
+"""
+Test Save Backends
+Tests the text and SQLite save backends, batch saves and loads, backend
+selection and migration from text and journaled saves
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_journal
+from custom_exceptions import CharacterNotFoundError, InvalidSaveDataError
+
+def saved_fields(characters):
+    """Keep only the fields a save stores"""
+    return [{field: c[field] for field in save_backends.SAVE_FIELDS} for c in characters]
+
+def make_party(count=5):
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    party = []
+    for index in range(count):
+        character = character_manager.create_character(f"hero_{index}", classes[index % 4])
+        character['gold'] = 10 * index
+        character['inventory'] = ["health_potion"] * (index % 3)
+        character['completed_quests'] = ["first_steps"] if index % 2 else []
+        party.append(character)
+    return party
+
+@pytest.fixture(params=["text", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "text":
+        backend = save_backends.TextSaveBackend(str(tmp_path / "saves"))
+    else:
+        backend = save_backends.SQLiteSaveBackend(str(tmp_path / "saves.db"))
+    yield backend
+    backend.close()
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    backend = save_backends.SQLiteSaveBackend(str(tmp_path / "saves.db"))
+    character_manager.set_storage_backend(backend)
+    yield backend
+    character_manager.set_storage_backend(None)
+    backend.close()
+
+def test_text_save_round_trip():
+    """Test formatting and parsing the text save format"""
+    character = make_party(2)[1]
+    text = save_backends.format_text_save(character)
+    assert text.splitlines()[0] == "NAME: hero_1"
+    assert [save_backends.parse_text_save(text.splitlines())] == saved_fields([character])
+
+def test_text_save_missing_field():
+    """Test that a save missing a field is rejected"""
+    with pytest.raises(InvalidSaveDataError):
+        save_backends.parse_text_save(["NAME: hero", "CLASS: Mage"])
+
+def test_backend_round_trip(backend):
+    """Test batch save, batch load, listing and delete on both backends"""
+    party = make_party()
+    backend.save_characters(party)
+
+    assert backend.load_characters(["hero_3", "hero_0"]) == saved_fields([party[3], party[0]])
+    assert [backend.load_character("hero_1")] == saved_fields([party[1]])
+    assert sorted(backend.list_names()) == [c['name'] for c in party]
+    by_gold = backend.list_summaries(sort_by="gold", reverse=True)
+    assert [entry['name'] for entry in by_gold][0] == "hero_4"
+    with pytest.raises(ValueError):
+        backend.list_summaries(sort_by="luck")
+
+    backend.delete_character("hero_2")
+    assert "hero_2" not in backend.list_names()
+    with pytest.raises(CharacterNotFoundError):
+        backend.load_characters(["hero_1", "hero_2"])
+    with pytest.raises(CharacterNotFoundError):
+        backend.delete_character("hero_2")
+
+def test_sqlite_batch_is_one_transaction(tmp_path):
+    """Test that a failing batch leaves the database unchanged"""
+    backend = save_backends.SQLiteSaveBackend(str(tmp_path / "saves.db"))
+    party = make_party(3)
+    del party[2]['gold']
+    with pytest.raises(KeyError):
+        backend.save_characters(party)
+    assert backend.list_names() == []
+    backend.close()
+
+def test_character_manager_uses_configured_backend(sqlite_backend, tmp_path):
+    """Test that the usual character_manager calls go to the SQLite backend"""
+    character = character_manager.create_character("SqlHero", "Cleric")
+    character_manager.save_character(character)
+
+    assert character_manager.list_saved_characters() == ["SqlHero"]
+    assert [character_manager.load_character("SqlHero")] == saved_fields([character])
+    assert not os.path.exists(os.path.join("data", "save_games", "SqlHero_save.txt"))
+
+    assert character_manager.save_characters(make_party(3)) == 3
+    assert character_manager.save_characters(make_party(3)[:1] + [character]) == 0
+    names = [c['name'] for c in character_manager.load_characters(["hero_2", "SqlHero"])]
+    assert names == ["hero_2", "SqlHero"]
+
+    character_manager.delete_character("SqlHero")
+    assert "SqlHero" not in character_manager.list_saved_characters()
+
+def test_make_backend():
+    """Test backend specs"""
+    assert isinstance(save_backends.make_backend("text:somewhere"), save_backends.TextSaveBackend)
+    with pytest.raises(ValueError):
+        save_backends.make_backend("floppy")
+
+def test_migrate_text_saves(tmp_path, capsys):
+    """Test migrating a directory of text saves into SQLite"""
+    save_directory = str(tmp_path / "saves")
+    party = make_party(7)
+    save_backends.TextSaveBackend(save_directory).save_characters(party)
+    with open(os.path.join(save_directory, "broken_save.txt"), "w") as f:
+        f.write("NAME: broken\n")
+
+    db_path = str(tmp_path / "saves.db")
+    status = save_backends.main(["migrate", "--from", save_directory, "--to", db_path,
+                                 "--batch-size", "3"])
+    assert status == 1
+    assert "Migrated 7 character(s)" in capsys.readouterr().out
+
+    backend = save_backends.SQLiteSaveBackend(db_path)
+    assert backend.load_characters([c['name'] for c in party]) == saved_fields(party)
+    backend.close()
+
+def test_migrate_and_export_replay_journals(tmp_path):
+    """Test that migrate and export include journaled changes not yet compacted"""
+    save_directory = str(tmp_path / "saves")
+    journal = save_journal.JournalSaveBackend(save_directory)
+    character = character_manager.create_character("Ledger", "Rogue")
+    journal.save_character(character)
+    character['gold'] = 999
+    journal.save_character(character)
+    assert os.path.exists(journal.get_journal_path("Ledger"))    # Not compacted
+
+    db_path = str(tmp_path / "saves.db")
+    assert save_backends.main(["migrate", "--from", save_directory, "--to", db_path]) == 0
+    backend = save_backends.SQLiteSaveBackend(db_path)
+    assert backend.load_character("Ledger")['gold'] == 999
+    backend.close()
+
+    export_path = str(tmp_path / "Ledger.txt")
+    assert save_backends.main(["export", "Ledger", "--from", save_directory,
+                               "--to", export_path]) == 0
+    with open(export_path) as f:
+        assert save_backends.parse_text_save(f)['gold'] == 999
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Test Save Format
+Tests the versioned binary save format, loading older text saves and
+exporting saves as text
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import save_backends
+import save_format
+from custom_exceptions import SaveFileCorruptedError, InvalidSaveDataError
+
+@pytest.fixture
+def hero():
+    character = character_manager.create_character("Équipe Hero", "Warrior")
+    character['experience'] = 2 ** 40
+    character['inventory'] = ["health_potion", "health_potion", "leather_armor"]
+    character['completed_quests'] = ["first_steps"]
+    inventory_system.add_item_to_inventory(character, "iron_sword")
+    inventory_system.equip_weapon(character, "iron_sword", {'type': 'weapon', 'effect': 'strength:5'})
+    return character
+
+def test_binary_round_trip(hero):
+    """Test that every field, including equipment, survives encode/decode"""
+    data = save_format.encode_character(hero)
+    assert data[:4] == save_format.SAVE_MAGIC
+    assert save_format.decode_character(data) == hero
+
+def test_rejects_damaged_or_unknown_saves(hero):
+    """Test truncated data, bad headers and future versions"""
+    data = save_format.encode_character(hero)
+    with pytest.raises(SaveFileCorruptedError):
+        save_format.decode_character(data[:-3])
+    with pytest.raises(SaveFileCorruptedError):
+        save_format.decode_character(data + b"x")
+    with pytest.raises(SaveFileCorruptedError):
+        save_format.decode_character(b"NAME: hero\n")
+
+    future = save_format.HEADER.pack(save_format.SAVE_MAGIC, 99, 0) + data[save_format.HEADER.size:]
+    with pytest.raises(InvalidSaveDataError):
+        save_format.decode_character(future)
+
+def test_encode_rejects_bad_characters(hero):
+    """Test missing fields and values that do not fit"""
+    del hero['gold']
+    with pytest.raises(InvalidSaveDataError):
+        save_format.encode_character(hero)
+    hero['gold'] = 2 ** 70
+    with pytest.raises(InvalidSaveDataError):
+        save_format.encode_character(hero)
+
+def test_save_and_load_restore_full_character(hero, tmp_path):
+    """Test that load_character restores max_health, magic and equipment"""
+    character_manager.save_character(hero, str(tmp_path))
+    assert os.path.exists(tmp_path / "Équipe Hero_save.dat")
+
+    loaded = save_backends.BinarySaveBackend(str(tmp_path)).load_character("Équipe Hero")
+    assert loaded == hero
+    assert loaded['equipped_weapon'] == {'id': 'iron_sword', 'effect': 'strength:5'}
+
+def test_text_saves_still_load_and_upgrade(hero, tmp_path):
+    """Test reading an older text save and replacing it on the next save"""
+    save_directory = str(tmp_path)
+    save_backends.TextSaveBackend(save_directory).save_character(hero)
+
+    backend = save_backends.BinarySaveBackend(save_directory)
+    assert backend.load_character("Équipe Hero") == hero
+    assert backend.list_names() == ["Équipe Hero"]
+
+    backend.save_character(hero)
+    assert sorted(os.listdir(save_directory)) == ["save_index.txt", "Équipe Hero_save.dat"]
+
+def test_text_export(hero, tmp_path):
+    """Test exporting a binary save to the text format and reading it back"""
+    character_manager.save_character(hero, str(tmp_path))
+    export_path = character_manager.export_character("Équipe Hero", str(tmp_path / "hero.txt"),
+                                                     str(tmp_path))
+    with open(export_path) as f:
+        text = f.read()
+    assert "EQUIPPED_WEAPON: iron_sword,strength:5" in text
+    assert save_backends.parse_text_save(text.splitlines()) == hero
+
+def test_sqlite_stores_equipment(hero, tmp_path):
+    """Test that the SQLite backend round-trips equipment too"""
+    backend = save_backends.SQLiteSaveBackend(str(tmp_path / "saves.db"))
+    backend.save_character(hero)
+    assert backend.load_character("Équipe Hero") == hero
+    backend.close()
+
+def test_old_text_save_without_equipment():
+    """Test that twelve-line text saves load with nothing equipped"""
+    lines = ["NAME: Old", "CLASS: Mage", "LEVEL: 2", "HEALTH: 80", "MAX_HEALTH: 90",
+             "STRENGTH: 8", "MAGIC: 22", "EXPERIENCE: 5", "GOLD: 10", "INVENTORY:",
+             "ACTIVE_QUESTS:", "COMPLETED_QUESTS: first_steps"]
+    character = save_backends.parse_text_save(lines)
+    assert character['max_health'] == 90 and character['magic'] == 22
+    assert character['equipped_weapon'] is None and character['equipped_armor'] is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,119 @@
+"""
+Test Save Index
+Tests that the save-directory index tracks saves and deletes and repairs
+itself when it is missing, corrupted or out of date
+"""
+
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_index
+
+@pytest.fixture
+def save_dir(tmp_path):
+    directory = str(tmp_path)
+    for name, character_class, gold in (("Ayla", "Warrior", 300), ("Bren", "Mage", 50)):
+        character = character_manager.create_character(name, character_class)
+        character['gold'] = gold
+        character_manager.save_character(character, directory)
+    return directory
+
+def test_index_written_by_save(save_dir):
+    """Test that saving records class, level, gold and save time"""
+    entries, line_count = save_index.parse_index(save_index.get_index_path(save_dir))
+    assert list(entries) == ["Ayla", "Bren"]
+    assert entries["Ayla"]['class'] == "Warrior"
+    assert entries["Ayla"]['level'] == 1
+    assert entries["Bren"]['gold'] == 50
+    assert entries["Bren"]['saved_at'] <= time.time()
+
+def test_listing_and_sorting(save_dir):
+    """Test list_saved_characters and sorted summaries"""
+    assert sorted(character_manager.list_saved_characters(save_dir)) == ["Ayla", "Bren"]
+    by_gold = character_manager.list_save_summaries(save_dir, sort_by="gold")
+    assert [entry['name'] for entry in by_gold] == ["Bren", "Ayla"]
+    assert character_manager.list_saved_characters(str(os.path.join(save_dir, "missing"))) == []
+
+    # Results are copies: editing one leaves the cached index alone
+    by_gold[0]['gold'] = 0
+    assert save_index.list_summaries(save_dir, sort_by="gold")[0]['gold'] == 50
+    with pytest.raises(ValueError):
+        save_index.list_summaries(save_dir, sort_by="luck")
+
+def test_delete_updates_index(save_dir):
+    """Test that deleting a character removes its entry"""
+    character_manager.delete_character("Ayla", save_dir)
+    entries, line_count = save_index.parse_index(save_index.get_index_path(save_dir))
+    assert list(entries) == ["Bren"]
+
+def test_missing_or_corrupted_index_is_rebuilt(save_dir):
+    """Test rebuilding from the save files"""
+    index_path = save_index.get_index_path(save_dir)
+    os.remove(index_path)
+    assert sorted(character_manager.list_saved_characters(save_dir)) == ["Ayla", "Bren"]
+    assert os.path.exists(index_path)
+
+    with open(index_path, "w") as f:
+        f.write("garbage\n")
+    summaries = character_manager.list_save_summaries(save_dir)
+    assert [(entry['name'], entry['gold']) for entry in summaries] == [("Ayla", 300), ("Bren", 50)]
+
+def test_stale_index_is_reconciled(save_dir):
+    """Test that save files added or removed outside save_character are noticed"""
+    index_path = save_index.get_index_path(save_dir)
+    old_time = time.time() - 60
+    os.utime(index_path, (old_time, old_time))
+
+    os.remove(os.path.join(save_dir, "Bren_save.dat"))
+    with open(os.path.join(save_dir, "Cato_save.txt"), "w") as f:
+        f.write("NAME: Cato\nCLASS: Rogue\nLEVEL: 4\nGOLD: 12\n")
+
+    summaries = {entry['name']: entry for entry in character_manager.list_save_summaries(save_dir)}
+    assert sorted(summaries) == ["Ayla", "Cato"]
+    assert summaries["Cato"]['level'] == 4
+
+def test_unreadable_save_is_listed_last(save_dir):
+    """Test that a broken save file is still listed, with unknown fields"""
+    with open(os.path.join(save_dir, "Dax_save.txt"), "w") as f:
+        f.write("not a save file\n")
+    os.remove(save_index.get_index_path(save_dir))
+
+    summaries = character_manager.list_save_summaries(save_dir, sort_by="level")
+    assert summaries[-1]['name'] == "Dax"
+    assert summaries[-1]['level'] is None
+
+def test_index_is_appended_and_compacted(save_dir, monkeypatch):
+    """Test that updates append lines and old lines are compacted away"""
+    monkeypatch.setattr(save_index, "COMPACT_SLACK", 5)
+    character = character_manager.load_character("Ayla", save_dir)
+    for gold in range(4):
+        character['gold'] = gold
+        character_manager.save_character(character, save_dir)
+
+    index_path = save_index.get_index_path(save_dir)
+    entries, line_count = save_index.parse_index(index_path)
+    assert line_count == 6      # 2 lines for the fixture, then one per save
+    assert entries["Ayla"]['gold'] == 3
+
+    for gold in range(4, 8):
+        character['gold'] = gold
+        character_manager.save_character(character, save_dir)
+    entries, line_count = save_index.parse_index(index_path)
+    assert line_count <= 2 * len(entries) + 5
+    save_index.index_cache.clear()
+    assert character_manager.list_save_summaries(save_dir)[0]['gold'] == 7
+
+def test_index_line_round_trip():
+    """Test formatting and parsing one index line, including a tab in the name"""
+    entry = save_index.make_entry("Odd\tName", None, 3, 10, 1.5)
+    line = "\t".join(save_index.format_value(entry[key])
+                     for key in ('name', 'class', 'level', 'gold', 'saved_at'))
+    assert save_index.parse_index_line(line) == entry
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
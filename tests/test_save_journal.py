@@ -0,0 +1,121 @@
+"""
+Test Save Journal
+Tests that journaled saves append only changes, replay on load, compact
+into snapshots and survive torn or stale journals
+"""
+
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_journal
+
+@pytest.fixture
+def backend(tmp_path):
+    journal_backend = save_journal.JournalSaveBackend(str(tmp_path), compact_records=4)
+    character_manager.set_storage_backend(journal_backend)
+    yield journal_backend
+    character_manager.set_storage_backend(None)
+    journal_backend.close()
+
+def reopen(backend):
+    """A fresh backend on the same directory, as after a restart"""
+    return save_journal.JournalSaveBackend(backend.save_directory, backend.compact_records)
+
+def test_saves_append_changes_and_load_replays(backend):
+    """Test that a save after game actions appends a small record"""
+    char = character_manager.create_character("Wren", "Rogue")
+    char['inventory'] = ["potion"] * 200
+    character_manager.save_character(char)
+    snapshot_size = os.path.getsize(backend.get_location("Wren"))
+
+    character_manager.add_gold(char, 25)
+    character_manager.gain_experience(char, 150, quiet=True)
+    char['inventory'].append("dagger")
+    char['active_quests'].append("q1_rats")
+    character_manager.save_character(char)
+
+    journal_size = os.path.getsize(backend.get_journal_path("Wren"))
+    assert journal_size < snapshot_size / 4
+    assert os.path.getsize(backend.get_location("Wren")) == snapshot_size
+
+    loaded = reopen(backend).load_character("Wren")
+    assert loaded['gold'] == 125
+    assert loaded['level'] == 2
+    assert loaded['experience'] == 50
+    assert loaded['inventory'][-1] == "dagger" and len(loaded['inventory']) == 201
+    assert loaded['active_quests'] == ["q1_rats"]
+
+def test_full_journal_is_compacted(backend):
+    """Test that a save past compact_records writes a new snapshot"""
+    char = character_manager.create_character("Wren", "Rogue")
+    character_manager.save_character(char)
+    for gold in range(1, 7):
+        char['gold'] = gold
+        character_manager.save_character(char)
+
+    stats = backend.get_stats()
+    assert stats['appends'] == 5        # 4 appends, 1 compaction, 1 append
+    assert reopen(backend).load_character("Wren")['gold'] == 6
+
+    assert backend.compact_all() == 1
+    assert not os.path.exists(backend.get_journal_path("Wren"))
+    assert reopen(backend).load_character("Wren")['gold'] == 6
+
+def test_torn_record_is_dropped(backend):
+    """Test that a half-written last record is ignored and then overwritten"""
+    char = character_manager.create_character("Wren", "Rogue")
+    character_manager.save_character(char)
+    char['gold'] = 10
+    character_manager.save_character(char)
+    char['gold'] = 20
+    character_manager.save_character(char)
+
+    journal_path = backend.get_journal_path("Wren")
+    with open(journal_path, "r+b") as f:
+        f.truncate(os.path.getsize(journal_path) - 3)
+
+    restarted = reopen(backend)
+    char = restarted.load_character("Wren")
+    assert char['gold'] == 10
+    char['gold'] = 30
+    restarted.save_character(char)
+    assert reopen(backend).load_character("Wren")['gold'] == 30
+
+def test_stale_journal_is_ignored(backend):
+    """Test that a journal for an older snapshot is not replayed"""
+    char = character_manager.create_character("Wren", "Rogue")
+    character_manager.save_character(char)
+    char['inventory'].append("dagger")
+    character_manager.save_character(char)
+
+    with open(backend.get_journal_path("Wren"), "rb") as f:
+        old_journal = f.read()
+    backend.compact("Wren")
+    # Simulate a crash between writing the snapshot and removing the journal
+    with open(backend.get_journal_path("Wren"), "wb") as f:
+        f.write(old_journal)
+
+    assert reopen(backend).load_character("Wren")['inventory'] == ["dagger"]
+
+def test_background_compaction(backend):
+    """Test that the compaction thread folds journals into snapshots"""
+    char = character_manager.create_character("Wren", "Rogue")
+    character_manager.save_character(char)
+    char['gold'] = 5
+    character_manager.save_character(char)
+
+    backend.start_compaction(interval=0.01, min_records=1)
+    deadline = time.monotonic() + 5
+    while backend.get_stats()['journaled'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    backend.stop_compaction()
+    assert backend.get_stats()['journaled'] == 0
+    assert reopen(backend).load_character("Wren")['gold'] == 5
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
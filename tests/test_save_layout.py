@@ -0,0 +1,160 @@
+"""
+Test Save Layout
+Tests sharded save directories and the migration from the flat layout
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_journal
+import save_layout
+import save_validator
+
+@pytest.fixture
+def save_dir(tmp_path):
+    directory = str(tmp_path)
+    yield directory
+    character_manager.close_storage_backends()
+    save_layout.layouts.clear()
+
+def make_flat_saves(save_dir, count):
+    characters = [character_manager.create_character(f"hero_{index}", "Mage")
+                  for index in range(count)]
+    character_manager.save_characters(characters, save_dir)
+    return characters
+
+def test_shard_paths_are_stable_and_two_levels_deep(save_dir):
+    """Test that a name always maps to the same two-level shard directory"""
+    shard = save_layout.get_shard_path("Ayla")
+    assert shard == save_layout.get_shard_path("Ayla")
+    parts = shard.split(os.sep)
+    assert len(parts) == save_layout.SHARD_LEVELS
+    assert all(save_layout.is_shard_name(part) for part in parts)
+
+    layout = save_layout.get_layout(save_dir)
+    assert layout.mode == save_layout.FLAT
+    assert layout.locate("Ayla", "_save.dat") == os.path.join(save_dir, "Ayla_save.dat")
+    layout.set_mode(save_layout.SHARDED)
+    assert layout.locate("Ayla", "_save.dat") == os.path.join(save_dir, shard, "Ayla_save.dat")
+
+def test_migration_moves_saves_and_everything_still_works(save_dir):
+    """Test that saves, loads, lists and deletes work after migrating"""
+    make_flat_saves(save_dir, 20)
+    assert character_manager.migrate_save_layout(save_dir) == 20
+    assert not [name for name in os.listdir(save_dir) if name.endswith("_save.dat")]
+    assert save_layout.get_layout(save_dir).read_mode() == save_layout.SHARDED
+
+    assert len(character_manager.list_saved_characters(save_dir)) == 20
+    character = character_manager.load_character("hero_7", save_dir)
+    character['gold'] = 777
+    character_manager.save_character(character, save_dir)
+    character_manager.load_cache.clear()
+    assert character_manager.load_character("hero_7", save_dir)['gold'] == 777
+    assert os.path.exists(os.path.join(save_dir, save_layout.get_shard_path("hero_7"),
+                                       "hero_7_save.dat"))
+
+    character_manager.delete_character("hero_3", save_dir)
+    assert "hero_3" not in character_manager.list_saved_characters(save_dir)
+    assert character_manager.migrate_save_layout(save_dir) == 0
+
+def test_saves_during_migration_are_not_lost(save_dir):
+    """Test that a migration resumed after saves mid-way keeps the newest data"""
+    make_flat_saves(save_dir, 5)
+    layout = save_layout.get_layout(save_dir)
+    layout.set_mode(save_layout.MIGRATING)      # As if interrupted before moving anything
+
+    # Not moved yet: found and rewritten at the flat path
+    character = character_manager.load_character("hero_1", save_dir)
+    character['gold'] = 111
+    character_manager.save_character(character, save_dir)
+    assert os.path.exists(os.path.join(save_dir, "hero_1_save.dat"))
+    # New characters go straight to their shard
+    character_manager.save_character(character_manager.create_character("Newcomer", "Cleric"),
+                                     save_dir)
+    assert os.path.exists(layout.get_sharded_path("Newcomer", "Newcomer_save.dat"))
+
+    character_manager.migrate_save_layout(save_dir)
+    assert sorted(character_manager.list_saved_characters(save_dir)) == \
+        ["Newcomer", "hero_0", "hero_1", "hero_2", "hero_3", "hero_4"]
+    assert character_manager.load_character("hero_1", save_dir)['gold'] == 111
+
+def test_other_processes_see_the_migration(save_dir):
+    """Test that a process still using the flat layout keeps working"""
+    make_flat_saves(save_dir, 2)
+    stale = save_layout.SaveLayout(save_dir)    # Another process's view
+    character_manager.migrate_save_layout(save_dir)
+    assert stale.locate("hero_0", "_save.dat") == \
+        save_layout.get_layout(save_dir).get_sharded_path("hero_0", "hero_0_save.dat")
+    assert stale.mode == save_layout.SHARDED
+
+    # A save the other process wrote flat before it noticed
+    straggler = character_manager.create_character("Straggler", "Rogue")
+    straggler['gold'] = 5
+    with open(os.path.join(save_dir, "Straggler_save.txt"), "w") as f:
+        f.write(save_backends.format_text_save(straggler))
+    assert "Straggler" in character_manager.list_saved_characters(save_dir)
+    assert character_manager.load_character("Straggler", save_dir)['gold'] == 5
+
+    assert character_manager.migrate_save_layout(save_dir) == 1
+    assert not os.path.exists(os.path.join(save_dir, "Straggler_save.txt"))
+    assert character_manager.load_character("Straggler", save_dir)['gold'] == 5
+
+def test_durable_saves_sync_their_shard_directories(save_dir, monkeypatch):
+    """Test that per-save and periodic syncs reach the shard and new parents"""
+    synced = []
+    monkeypatch.setattr(save_backends, "fsync_directory", synced.append)
+    save_layout.get_layout(save_dir).set_mode(save_layout.SHARDED)
+    shard = os.path.join(save_dir, save_layout.get_shard_path("Ayla"))
+    expected = [shard, os.path.dirname(shard), save_dir]
+
+    backend = save_backends.BinarySaveBackend(save_dir)
+    backend.set_durability("per-save")
+    backend.write_character(character_manager.create_character("Ayla", "Mage"))
+    assert synced == expected
+
+    synced.clear()
+    save_layout.layouts.clear()
+    backend = save_backends.BinarySaveBackend(save_dir)
+    backend.set_durability("periodic", sync_interval=3600)
+    backend.write_character(character_manager.create_character("Bram", "Rogue"))
+    assert synced == []
+    backend.sync()
+    bram_shard = os.path.join(save_dir, save_layout.get_shard_path("Bram"))
+    assert bram_shard in synced and os.path.dirname(bram_shard) in synced
+
+def test_journals_move_with_their_snapshots(save_dir, monkeypatch):
+    """Test that a journaled save still replays after migration"""
+    monkeypatch.setenv("QUEST_SAVE_BACKEND", "journal")
+    character = character_manager.create_character("Wren", "Rogue")
+    character_manager.save_character(character, save_dir)
+    character_manager.add_gold(character, 40)
+    character_manager.save_character(character, save_dir)
+    assert os.path.exists(os.path.join(save_dir, "Wren" + save_journal.JOURNAL_SUFFIX))
+
+    character_manager.migrate_save_layout(save_dir)
+    backend = save_journal.JournalSaveBackend(save_dir)
+    assert os.path.exists(backend.get_journal_path("Wren"))
+    assert backend.load_character("Wren")['gold'] == 140
+
+def test_validator_walks_shards(save_dir):
+    """Test that the save validator checks and quarantines sharded saves"""
+    make_flat_saves(save_dir, 6)
+    character_manager.migrate_save_layout(save_dir)
+    bad_path = save_layout.get_layout(save_dir).locate("hero_2", "_save.dat")
+    with open(bad_path, "wb") as f:
+        f.write(b"not a save")
+
+    report = save_validator.validate_save_directory(save_dir, quarantine=True, chunk_size=4)
+    assert report['checked'] == 6
+    assert [problem['name'] for problem in report['problems']] == ["hero_2"]
+    assert report['quarantined'] == [os.path.relpath(bad_path, save_dir)]
+    assert os.path.exists(os.path.join(save_dir, save_validator.QUARANTINE_DIR, "hero_2_save.dat"))
+    assert "hero_2" not in character_manager.list_saved_characters(save_dir)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Test Save Validator
+Tests bulk checking of a save directory, the JSON report and quarantine
+"""
+
+import pytest
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_journal
+import save_validator
+
+@pytest.fixture
+def save_dir(tmp_path):
+    directory = str(tmp_path)
+    backend = save_backends.BinarySaveBackend(directory)
+    for index in range(12):
+        backend.save_character(character_manager.create_character(f"hero_{index}", "Warrior"))
+    # Truncated binary save
+    with open(os.path.join(directory, "hero_3_save.dat"), "r+b") as f:
+        f.truncate(10)
+    # Text save with a missing field
+    save_backends.TextSaveBackend(directory).save_character(
+        character_manager.create_character("old_hero", "Mage"))
+    path = os.path.join(directory, "old_hero_save.txt")
+    with open(path) as f:
+        lines = [line for line in f if not line.startswith("GOLD:")]
+    with open(path, "w") as f:
+        f.writelines(lines)
+    return directory
+
+def test_report_lists_bad_saves(save_dir):
+    """Test that every bad save is reported with its error type"""
+    report = save_validator.validate_save_directory(save_dir, chunk_size=5)
+    assert report['checked'] == 13
+    assert report['bad'] == 2
+    assert [(problem['name'], problem['error']) for problem in report['problems']] == [
+        ("hero_3", "SaveFileCorruptedError"),
+        ("old_hero", "InvalidSaveDataError")
+    ]
+    assert report['quarantined'] == []
+
+def test_parallel_matches_serial(save_dir):
+    """Test that worker processes find the same problems"""
+    serial = save_validator.validate_save_directory(save_dir, workers=1, chunk_size=3)
+    parallel = save_validator.validate_save_directory(save_dir, workers=2, chunk_size=3)
+    assert parallel['checked'] == serial['checked']
+    assert parallel['problems'] == serial['problems']
+
+def test_journal_is_checked(tmp_path):
+    """Test that a journal that breaks the character is reported"""
+    backend = save_journal.JournalSaveBackend(str(tmp_path))
+    char = character_manager.create_character("Wren", "Rogue")
+    backend.save_character(char)
+    with open(backend.get_journal_path("Wren"), "wb") as f:
+        f.write(save_journal.encode_record({'base': backend.states["Wren"]['base']}))
+        f.write(save_journal.encode_record({'set': {'inventory': 5}}))
+    report = save_validator.validate_save_directory(str(tmp_path))
+    assert report['bad'] == 1
+    assert report['problems'][0]['error'] == "InvalidSaveDataError"
+
+def test_quarantine_moves_bad_saves(save_dir):
+    """Test that quarantine moves bad files and drops them from the index"""
+    report = save_validator.validate_save_directory(save_dir, quarantine=True)
+    assert sorted(report['quarantined']) == ["hero_3_save.dat", "old_hero_save.txt"]
+    quarantine = os.path.join(save_dir, save_validator.QUARANTINE_DIR)
+    assert sorted(os.listdir(quarantine)) == ["hero_3_save.dat", "old_hero_save.txt"]
+    names = character_manager.list_saved_characters(save_dir)
+    assert "hero_3" not in names and "old_hero" not in names and len(names) == 11
+    assert save_validator.validate_save_directory(save_dir)['bad'] == 0
+
+def test_quarantine_keeps_earlier_files(save_dir):
+    """Test that quarantining a name twice keeps both copies"""
+    save_validator.validate_save_directory(save_dir, quarantine=True)
+    with open(os.path.join(save_dir, "hero_3_save.dat"), "wb") as f:
+        f.write(b"broken again")
+    report = save_validator.validate_save_directory(save_dir, quarantine=True)
+    assert report['quarantined'] == ["hero_3_save.dat"]
+    quarantine = os.path.join(save_dir, save_validator.QUARANTINE_DIR)
+    assert sorted(os.listdir(quarantine)) == ["hero_3_save.dat", "hero_3_save.dat.1",
+                                              "old_hero_save.txt"]
+    with open(os.path.join(quarantine, "hero_3_save.dat.1"), "rb") as f:
+        assert f.read() == b"broken again"
+
+def test_text_save_shadowed_by_binary_is_skipped(save_dir):
+    """Test that a leftover text save load_character never reads is not reported"""
+    with open(os.path.join(save_dir, "hero_5_save.txt"), "w") as f:
+        f.write("not a save\n")
+    report = save_validator.validate_save_directory(save_dir)
+    assert [problem['name'] for problem in report['problems']] == ["hero_3", "old_hero"]
+
+def test_command_line_report(save_dir, tmp_path):
+    """Test that the CLI writes a JSON report and exits non-zero"""
+    report_path = str(tmp_path / "report.json")
+    assert save_validator.main(["--save-dir", save_dir, "-j", "1", "--report", report_path]) == 1
+    with open(report_path) as f:
+        report = json.load(f)
+    assert report['bad'] == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
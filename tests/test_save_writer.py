@@ -0,0 +1,179 @@
+"""
+Test Save Writer
+Tests atomic save writes, fsync policies and the background save writer
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+import save_writer
+from custom_exceptions import InvalidSaveDataError
+
+class BlockingBackend:
+    """Backend that records saves and waits for a signal before each one"""
+
+    def __init__(self, fail_names=()):
+        self.release = threading.Event()
+        self.saved = []
+        self.fail_names = fail_names
+
+    def save_character(self, character):
+        self.release.wait(5)
+        if character['name'] in self.fail_names:
+            raise IOError("disk full")
+        self.saved.append((character['name'], character['gold']))
+
+@pytest.fixture
+def save_dir(tmp_path):
+    directory = str(tmp_path)
+    character_manager.enable_async_saves()
+    yield directory
+    character_manager.disable_async_saves()
+    character_manager.set_save_durability("none")
+
+def test_atomic_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    """Test that a failed rename keeps the old save and removes the temp file"""
+    backend = save_backends.BinarySaveBackend(str(tmp_path))
+    character = character_manager.create_character("Ira", "Rogue")
+    backend.save_character(character)
+    assert sorted(os.listdir(tmp_path)) == ["Ira_save.dat", "save_index.txt"]
+
+    def broken_replace(source, destination):
+        raise OSError("rename failed")
+    monkeypatch.setattr(save_backends.os, "replace", broken_replace)
+    character['gold'] = 999
+    with pytest.raises(OSError):
+        backend.write_character(character)
+    assert sorted(os.listdir(tmp_path)) == ["Ira_save.dat", "save_index.txt"]
+    assert backend.load_character("Ira")['gold'] == 100
+
+def test_fsync_policies(tmp_path, monkeypatch):
+    """Test that per-save syncs every write and periodic syncs on sync()"""
+    synced = []
+    monkeypatch.setattr(save_backends.os, "fsync", synced.append)
+    backend = save_backends.BinarySaveBackend(str(tmp_path))
+    character = character_manager.create_character("Ira", "Rogue")
+
+    backend.save_character(character)
+    assert synced == []
+
+    backend.set_durability("per-save")
+    backend.save_character(character)
+    assert len(synced) >= 1
+
+    synced.clear()
+    backend.set_durability("periodic", sync_interval=3600)
+    backend.save_character(character)
+    assert synced == []
+    backend.sync()
+    assert len(synced) >= 1
+
+    with pytest.raises(ValueError):
+        backend.set_durability("sometimes")
+
+def test_load_sees_queued_save_and_flush_writes_it(save_dir):
+    """Test that a queued save is visible to loads before and after flush"""
+    character = character_manager.create_character("Juno", "Cleric")
+    character_manager.save_character(character, save_dir)
+    character['gold'] = 250
+    character_manager.save_character(character, save_dir)
+    character['gold'] = 1       # Changes after saving are not queued
+
+    assert character_manager.load_character("Juno", save_dir)['gold'] == 250
+    character_manager.flush_saves()
+    assert os.path.exists(os.path.join(save_dir, "Juno_save.dat"))
+    assert not [name for name in os.listdir(save_dir) if name.endswith(".tmp")]
+    character_manager.load_cache.clear()
+    assert character_manager.load_character("Juno", save_dir)['gold'] == 250
+    assert character_manager.list_saved_characters(save_dir) == ["Juno"]
+
+def test_queued_saves_are_coalesced():
+    """Test that saves for a character already waiting replace the waiting copy"""
+    backend = BlockingBackend()
+    writer = save_writer.SaveWriter(max_pending=4)
+    writer.submit(backend, "first", {'name': "First", 'gold': 0})
+    for gold in range(5):
+        writer.submit(backend, "second", {'name': "Second", 'gold': gold})
+    assert writer.get_pending("second")['gold'] == 4
+
+    backend.release.set()
+    writer.close()
+    assert backend.saved == [("First", 0), ("Second", 4)]
+    stats = writer.get_stats()
+    assert stats['submitted'] == 6
+    assert stats['written'] == 2
+    assert stats['coalesced'] == 4
+    with pytest.raises(IOError):
+        writer.submit(backend, "third", {'name': "Third", 'gold': 0})
+
+def test_failed_writes_are_raised_by_flush():
+    """Test that a background write error is reported by the next flush"""
+    backend = BlockingBackend(fail_names=("Bad",))
+    backend.release.set()
+    failures = []
+    writer = save_writer.SaveWriter(on_failure=lambda location, error: failures.append(location))
+    writer.submit(backend, "bad", {'name': "Bad", 'gold': 0})
+    writer.submit(backend, "good", {'name': "Good", 'gold': 0})
+    with pytest.raises(IOError):
+        writer.flush()
+    assert failures == ["bad"]
+    assert backend.saved == [("Good", 0)]
+    assert writer.flush() == 1      # The error is only reported once
+    writer.close()
+
+def test_incomplete_character_rejected_before_queueing(save_dir):
+    """Test that missing fields are still reported by save_character"""
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.save_character({'name': "Nobody"}, save_dir)
+    character_manager.flush_saves()
+
+def test_bad_character_does_not_stop_the_writer(save_dir):
+    """Test that an encoding error is reported and later saves still flush"""
+    bad = character_manager.create_character("Broke", "Rogue")
+    bad['gold'] = "lots"
+    character_manager.save_character(bad, save_dir)
+    with pytest.raises(IOError):
+        character_manager.flush_saves()
+
+    good = character_manager.create_character("Fine", "Rogue")
+    character_manager.save_character(good, save_dir)
+    assert character_manager.flush_saves()
+    assert os.path.exists(os.path.join(save_dir, "Fine_save.dat"))
+    assert not os.path.exists(os.path.join(save_dir, "Broke_save.dat"))
+
+class FailingBackend(save_backends.BinarySaveBackend):
+    """Backend whose writes always fail straight away"""
+
+    def save_character(self, character):
+        raise IOError("disk full")
+
+def test_fast_failing_save_is_not_recorded_as_saved(save_dir, monkeypatch):
+    """Test that a write failing before submit returns is retried by the next save"""
+    character_manager.set_storage_backend(FailingBackend(save_dir))
+    writer = character_manager.async_writer
+    submit = writer.submit
+    def submit_and_wait(*args):
+        # The worst case: the write fails before submit returns
+        submit(*args)
+        writer.queue.join()
+    monkeypatch.setattr(writer, "submit", submit_and_wait)
+    try:
+        character = character_manager.create_character("Unlucky", "Rogue")
+        location = character_manager.get_storage_backend().get_location("Unlucky")
+        for attempt in range(20):
+            character_manager.save_character(character, save_dir)
+            with pytest.raises(IOError):
+                character_manager.flush_saves()
+            assert location not in character_manager.saved_snapshots
+        assert character_manager.async_writer.get_stats()['submitted'] == 20
+    finally:
+        character_manager.set_storage_backend(None)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,54 @@
+"""
+Test Sharded Catalogs
+Tests loading quests and items from a directory or glob of shard files
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError, MissingDataFileError
+import game_data
+
+def write_quest_shard(filename, quest_ids):
+    """Write a small quest shard containing the given quest IDs"""
+    with open(filename, "w") as f:
+        for quest_id in quest_ids:
+            f.write(f"QUEST_ID: {quest_id}\nTITLE: {quest_id}\nDESCRIPTION: Test\n"
+                    "REWARD_XP: 10\nREWARD_GOLD: 5\nREQUIRED_LEVEL: 1\n"
+                    "PREREQUISITE: NONE\n\n")
+
+def test_load_quest_directory(tmp_path):
+    """Test that every shard in a directory is merged in sorted order"""
+    write_quest_shard(str(tmp_path / "b.txt"), ["quest_c", "quest_d"])
+    write_quest_shard(str(tmp_path / "a.txt"), ["quest_a", "quest_b"])
+
+    quests = game_data.load_quests(str(tmp_path), workers=2)
+    assert list(quests) == ["quest_a", "quest_b", "quest_c", "quest_d"]
+
+def test_load_quest_glob_single_worker(tmp_path):
+    """Test that a glob pattern only loads matching shards"""
+    write_quest_shard(str(tmp_path / "quests_1.txt"), ["quest_a"])
+    write_quest_shard(str(tmp_path / "quests_2.txt"), ["quest_b"])
+    write_quest_shard(str(tmp_path / "other.txt"), ["quest_z"])
+
+    quests = game_data.load_quests(str(tmp_path / "quests_*.txt"), workers=1)
+    assert list(quests) == ["quest_a", "quest_b"]
+
+def test_duplicate_ids_across_shards(tmp_path):
+    """Test that an ID defined in two shards is reported with both files"""
+    write_quest_shard(str(tmp_path / "a.txt"), ["quest_a", "shared"])
+    write_quest_shard(str(tmp_path / "b.txt"), ["shared"])
+
+    with pytest.raises(InvalidDataFormatError, match="'shared' in .*a.txt and .*b.txt"):
+        game_data.load_quests(str(tmp_path))
+
+def test_no_matching_shards(tmp_path):
+    """Test that an empty glob raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        game_data.load_items(str(tmp_path / "*.txt"))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])